@@ -0,0 +1,100 @@
+"""
+Clock sources for the Rowing Timer
+Elapsed times are measured on a monotonic high-resolution counter in integer
+nanoseconds, so NTP steps or DST changes during a race cannot corrupt them.
+A wall-clock anchor taken when the clock is created turns counter readings
+into human-readable start times.
+"""
+
+import time
+
+
+class Clock:
+    """Monotonic nanosecond counter anchored to the wall clock"""
+
+    name = None
+    counter = None
+    clock_info_name = None
+
+    def __init__(self):
+        # Take both readings back to back so the anchor is as tight as possible
+        self.anchor_ns = self.now_ns()
+        self.anchor_wall_ns = time.time_ns()
+
+    def now_ns(self):
+        """Current counter value in nanoseconds"""
+        return self.counter()
+
+    def to_wall(self, counter_ns):
+        """Seconds since the epoch for a counter value, for display and storage"""
+        return (self.anchor_wall_ns + (counter_ns - self.anchor_ns)) / 1e9
+
+    @property
+    def resolution(self):
+        """Resolution of the underlying clock in seconds"""
+        return time.get_clock_info(self.clock_info_name).resolution
+
+
+class PerfCounterClock(Clock):
+    """Highest-resolution monotonic clock available on the platform"""
+
+    name = "perf_counter_ns"
+    counter = time.perf_counter_ns
+    clock_info_name = "perf_counter"
+
+
+class MonotonicClock(Clock):
+    """System monotonic clock, unaffected by wall-clock adjustments"""
+
+    name = "monotonic_ns"
+    counter = time.monotonic_ns
+    clock_info_name = "monotonic"
+
+
+CLOCKS = {
+    PerfCounterClock.name: PerfCounterClock,
+    MonotonicClock.name: MonotonicClock,
+}
+
+
+class EventTimeMapper:
+    """Maps input event times onto a Clock, so late handling adds no time.
+
+    Tk stamps every input event with the windowing system's millisecond
+    clock. The smallest gap between that stamp and our clock seen so far
+    is the one with the least delay, so event time plus that gap is when
+    the input really happened. The stamp is only as fine as the windowing
+    clock (1 ms on X11, 10-16 ms on Windows).
+    """
+
+    # Events handled later than this, or a wrapped 32-bit event clock,
+    # start the mapping afresh
+    MAX_LAG_NS = 5_000_000_000
+
+    def __init__(self, clock):
+        self.clock = clock
+        self._offset_ns = None
+
+    def observe(self, event_time_ms):
+        """Learn the gap from any input event, such as a mouse move.
+
+        The first event seen sets the gap, delay and all. Feeding in cheap
+        events before the first press lets that press be corrected too.
+        """
+        offset_ns = self.clock.now_ns() - event_time_ms * 1_000_000
+        if (
+            self._offset_ns is None
+            or offset_ns < self._offset_ns
+            or offset_ns - self._offset_ns > self.MAX_LAG_NS
+        ):
+            self._offset_ns = offset_ns
+
+    def to_clock_ns(self, event_time_ms):
+        """Clock value at which an event with this time happened"""
+        self.observe(event_time_ms)
+        return event_time_ms * 1_000_000 + self._offset_ns
+
+
+def get_clock(name=PerfCounterClock.name):
+    """Create a clock by name; unknown names fall back to perf_counter_ns"""
+    return CLOCKS.get(name, PerfCounterClock)()
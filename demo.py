@@ -100,7 +100,7 @@ def setup_demo_app(app):
     try:
         # Load demo data
         demo_data = create_demo_data()
-        app.participants.update(demo_data)
+        app.participants = {**app.participants, **demo_data}
         app.save_data()
 
         # Update all displays
@@ -9,6 +9,7 @@ import os
 import sys
 import tempfile
 import tkinter as tk
+import tkinter.filedialog
 from datetime import datetime
 from tkinter import messagebox
 
@@ -82,7 +83,7 @@ def setup_demo_app():
 
     # Load sample data
     sample_data = create_sample_data()
-    app.participants.update(sample_data)
+    app.participants = {**app.participants, **sample_data}
 
     # Calculate results to populate the results tree
     app.calculate_results()
@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+Result export for the Rowing Timer
+Rows are generated straight from the timing engine's leaderboard, so an
+export neither needs the Results tab nor loses precision on the way through
+display strings. CSV times are written as seconds with all nine decimals.
+PDF reports are rendered from a snapshot of the results on a worker thread,
+one page-sized table at a time, so large fields neither freeze the window
+nor build one huge table in memory.
+
+Headless use:
+    python exporter.py rowing_data.json -o results.csv
+    python exporter.py rowing_data.json --columns place,boat,runs,score
+"""
+
+import argparse
+import csv
+import os
+import re
+import sys
+import threading
+from datetime import datetime
+from itertools import islice
+from operator import attrgetter, itemgetter, sub
+
+from storage import STORAGE_BACKENDS, open_storage, replay_journal
+from time_format import format_ms, ns_to_ms
+from timing_engine import DEFAULT_RUN_COUNT, DEFAULT_SCORING, Participant, TimingEngine
+
+NS_PER_SECOND = 1_000_000_000
+
+# PDF table row heights in points; fixed so rows per page can be computed
+PDF_HEADER_HEIGHT = 30
+PDF_ROW_HEIGHT = 18
+
+
+def format_seconds_ns(ns):
+    """Exact decimal seconds for a nanosecond count, e.g. 65.234000001"""
+    if ns is None:
+        return ""
+    return "%d.%09d" % divmod(ns, NS_PER_SECOND)
+
+
+def _seconds_cells(values):
+    """format_seconds_ns for a column of non-negative nanosecond counts"""
+    # Splitting the digits is much cheaper than divmod and %
+    digits = list(map(str, values))
+    if values and min(values) < NS_PER_SECOND:
+        digits = [ns.zfill(10) for ns in digits]
+    return [ns[:-9] + "." + ns[-9:] for ns in digits]
+
+
+# Rows are built for a chunk of boats at a time, one column at a time: each
+# selected column is a function, chosen once per export, that turns the
+# chunk's (boat, score) pairs and Participant records into a list of cells,
+# and zip() joins the columns into rows. The per-cell work stays inside
+# map() and comprehensions instead of a Python call per cell.
+ROW_CHUNK = 4096
+
+
+def _place_cells(first_place, ranked, records):
+    return range(first_place, first_place + len(ranked))
+
+
+def _boat_cells(first_place, ranked, records):
+    return list(map(itemgetter(0), ranked))
+
+
+def _name_cells(first_place, ranked, records):
+    return list(map(attrgetter("name"), records))
+
+
+def _difference_cells(first_place, ranked, records):
+    times = list(map(attrgetter("times_ns"), records))
+    return _seconds_cells(list(map(sub, map(max, times), map(min, times))))
+
+
+def _score_cells(first_place, ranked, records):
+    return list(map(itemgetter(1), ranked))
+
+
+def _run_cells(index):
+    def cells(first_place, ranked, records):
+        # Ranked boats have a time in every run
+        return _seconds_cells(
+            list(map(itemgetter(index), map(attrgetter("times_ns"), records)))
+        )
+
+    return cells
+
+
+# Characters that make the csv module quote a field
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+
+
+def _csv_text(cells):
+    """Text cells as CSV fields, quoted like csv.writer does when needed"""
+    search = _CSV_SPECIAL.search
+    if not search("".join(cells)):
+        # The usual case: one scan of the whole column instead of each cell
+        return cells
+    return [
+        '"' + cell.replace('"', '""') + '"' if search(cell) else cell for cell in cells
+    ]
+
+
+def _csv_numbers(cells):
+    return list(map(str, cells))
+
+
+def _csv_plain(cells):
+    # Seconds strings never contain anything that needs quoting
+    return cells
+
+
+# Export columns: key -> (header, cells function, CSV field function).
+# "runs" is special and expands to one "Tur N" column per run of the event.
+COLUMNS = {
+    "place": ("Plads", _place_cells, _csv_numbers),
+    "boat": ("Båd", _boat_cells, _csv_text),
+    "name": ("Navn", _name_cells, _csv_text),
+    "runs": (None, None, _csv_plain),
+    "difference": ("Forskel", _difference_cells, _csv_plain),
+    "score": ("Score", _score_cells, _csv_numbers),
+}
+DEFAULT_COLUMNS = ("place", "boat", "name", "runs", "difference", "score")
+
+
+def _resolve_columns(columns, run_count):
+    """Headers, cells functions and CSV field functions for the column keys"""
+    headers = []
+    builders = []
+    csv_fields = []
+    for key in columns:
+        if key not in COLUMNS:
+            raise ValueError(f"Ukendt kolonne: {key}")
+        header, builder, csv_field = COLUMNS[key]
+        if key == "runs":
+            for index in range(run_count):
+                headers.append(f"Tur {index + 1}")
+                builders.append(_run_cells(index))
+                csv_fields.append(csv_field)
+        else:
+            headers.append(header)
+            builders.append(builder)
+            csv_fields.append(csv_field)
+    if not builders:
+        raise ValueError("Vælg mindst én kolonne.")
+    return headers, builders, csv_fields
+
+
+def _ranked_columns(engine, builders):
+    """Yield the selected columns for ROW_CHUNK ranked boats at a time"""
+    participants = engine.participants
+    ranked_boats = engine.leaderboard.items()
+    first_place = 1
+    while True:
+        ranked = list(islice(ranked_boats, ROW_CHUNK))
+        if not ranked:
+            return
+        records = list(map(participants.__getitem__, map(itemgetter(0), ranked)))
+        yield [builder(first_place, ranked, records) for builder in builders]
+        first_place += len(ranked)
+
+
+def iter_result_rows(engine, columns=DEFAULT_COLUMNS):
+    """Yield the header and then one row per ranked boat, best first"""
+    headers, builders, _ = _resolve_columns(columns, engine.run_count)
+    yield headers
+    for cells in _ranked_columns(engine, builders):
+        yield from zip(*cells)
+
+
+def event_info_rows(event_info):
+    """Preamble rows describing the event, skipping empty fields"""
+    rows = []
+    if event_info.get("name"):
+        rows.append(["Begivenhed:", event_info["name"]])
+    if event_info.get("date"):
+        rows.append(["Dato:", event_info["date"]])
+    if event_info.get("location"):
+        rows.append(["Lokation:", event_info["location"]])
+    if event_info.get("description"):
+        rows.append(["Beskrivelse:", event_info["description"].replace("\n", " ")])
+    return rows
+
+
+def write_results_csv(f, engine, columns=DEFAULT_COLUMNS, event_info=None):
+    """Stream the results to an open text file; returns the number of boats.
+
+    The result rows are joined into CSV text a chunk at a time rather than
+    passed through csv.writer field by field; the output is the same.
+    """
+    writer = csv.writer(f)
+    if event_info:
+        writer.writerows(event_info_rows(event_info))
+        writer.writerow([])  # Empty line
+
+    headers, builders, csv_fields = _resolve_columns(columns, engine.run_count)
+    writer.writerow(headers)
+    for cells in _ranked_columns(engine, builders):
+        fields = [csv_field(column) for csv_field, column in zip(csv_fields, cells)]
+        f.write("\r\n".join(map(",".join, zip(*fields))) + "\r\n")
+    return len(engine.leaderboard)
+
+
+class ExportCancelled(Exception):
+    """The user cancelled an export that was in progress"""
+
+
+def format_clock_ns(ns):
+    """MM:SS.mmm for a nanosecond count, as shown on the Results tab"""
+    return format_ms(ns_to_ms(ns))
+
+
+def result_snapshot(engine):
+    """Copy of the leaderboard that a worker thread can read safely.
+
+    Returns (place, boat, name, times_ns, score) tuples, best first.
+    """
+    participants = engine.participants
+    return [
+        (place, boat, participants[boat].name, tuple(participants[boat].times_ns), score)
+        for place, (boat, score) in enumerate(engine.leaderboard.items(), 1)
+    ]
+
+
+def _pdf_row(result):
+    place, boat, name, times_ns, score = result
+    return [
+        place,
+        boat,
+        name,
+        *map(format_clock_ns, times_ns),
+        format_clock_ns(max(times_ns) - min(times_ns)),
+        f"{score:.3f}s",
+    ]
+
+
+def write_results_pdf(
+    filename, snapshot, run_count, event_info, progress=None, cancelled=None
+):
+    """Render a results report from result_snapshot() rows.
+
+    progress(fraction) is called as the work proceeds and the export stops
+    with ExportCancelled as soon as cancelled() returns True. The report is
+    written next to filename first, so a cancelled or failed export never
+    leaves a half-written file. Raises ImportError without reportlab.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (
+        LongTable,
+        PageBreak,
+        Paragraph,
+        SimpleDocTemplate,
+        Spacer,
+        TableStyle,
+    )
+
+    def check_cancelled():
+        if cancelled is not None and cancelled():
+            raise ExportCancelled()
+
+    def report(fraction):
+        if progress is not None:
+            progress(min(fraction, 1.0))
+
+    temp_name = filename + ".tmp"
+    doc = SimpleDocTemplate(
+        temp_name,
+        pagesize=A4,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=18,
+    )
+
+    # Container for the 'Flowable' objects
+    elements = []
+
+    # Get styles
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        "CustomTitle",
+        parent=styles["Heading1"],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor("#2E4057"),
+    )
+
+    subtitle_style = ParagraphStyle(
+        "CustomSubtitle",
+        parent=styles["Normal"],
+        fontSize=12,
+        spaceAfter=20,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor("#666666"),
+    )
+
+    # Club header with logo placeholder
+    elements.append(Paragraph("🚣 SKELSKØR ROKLUB 🚣", title_style))
+    elements.append(Spacer(1, 20))
+
+    # Event details
+    event_name = event_info.get("name") or "Ro Konkurrence Resultater"
+    elements.append(Paragraph(event_name, title_style))
+
+    # Metadata
+    date_str = event_info.get("date") or datetime.now().strftime("%d. %B %Y")
+    loc_str = event_info.get("location") or "Skælskør"
+    elements.append(Paragraph(f"{date_str} • {loc_str}", subtitle_style))
+
+    if event_info.get("description"):
+        elements.append(Paragraph(event_info["description"], subtitle_style))
+
+    elements.append(Spacer(1, 20))
+
+    # Rows per table: whatever is left of the first page, then a full page
+    # each, so every page gets exactly one table with its own header
+    frame_height = doc.height - 12  # Frame padding
+    used = sum(
+        element.wrap(doc.width, frame_height)[1]
+        + element.getSpaceBefore()
+        + element.getSpaceAfter()
+        for element in elements
+    )
+    page_rows = int((frame_height - PDF_HEADER_HEIGHT) // PDF_ROW_HEIGHT) - 1
+    first_rows = max(1, int((frame_height - used - PDF_HEADER_HEIGHT) // PDF_ROW_HEIGHT) - 1)
+
+    header = ["Plads", "Båd", "Deltager Navn"]
+    header.extend(f"Tur {run}" for run in range(1, run_count + 1))
+    header.extend(["Forskel", "Score"])
+
+    # With many runs the run columns share the width
+    run_width = min(0.9, 3.6 / run_count) * inch
+    col_widths = [
+        0.6 * inch,
+        0.7 * inch,
+        (2.0 if run_count <= 2 else 1.4) * inch,
+        *[run_width] * run_count,
+        0.9 * inch,
+        0.8 * inch,
+    ]
+    base_style = [
+        # Header row
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2E4057")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 12),
+        # Data rows
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 1), (-1, -1), 10),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.beige, colors.white]),
+        ("ALIGN", (0, 1), (0, -1), "CENTER"),  # Rank column
+        ("ALIGN", (1, 1), (1, -1), "CENTER"),  # Boat column
+        ("ALIGN", (2, 1), (2, -1), "LEFT"),  # Name column
+        ("ALIGN", (3, 1), (-1, -1), "CENTER"),  # Time columns
+        # Grid
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ]
+    winner_style = TableStyle(
+        base_style
+        + [
+            # Special styling for winner
+            ("BACKGROUND", (0, 1), (-1, 1), colors.HexColor("#FFD700")),
+            ("FONTNAME", (0, 1), (-1, 1), "Helvetica-Bold"),
+        ]
+    )
+    page_style = TableStyle(base_style)
+
+    # Preparing the tables is the first fifth of the work, rendering the rest
+    total = len(snapshot)
+    start = 0
+    chunk_rows = first_rows
+    while start < total:
+        check_cancelled()
+        chunk = snapshot[start : start + chunk_rows]
+        if start:
+            elements.append(PageBreak())
+        table = LongTable(
+            [header, *map(_pdf_row, chunk)],
+            colWidths=col_widths,
+            rowHeights=[PDF_HEADER_HEIGHT] + [PDF_ROW_HEIGHT] * len(chunk),
+            repeatRows=1,
+        )
+        table.setStyle(page_style if start else winner_style)
+        elements.append(table)
+        start += len(chunk)
+        chunk_rows = page_rows
+        report(0.2 * start / total)
+
+    elements.append(Spacer(1, 30))
+
+    # Add summary information
+    if snapshot:
+        _, _, winner_name, _, winner_score = snapshot[0]
+
+        summary_style = ParagraphStyle(
+            "Summary",
+            parent=styles["Normal"],
+            fontSize=11,
+            spaceAfter=10,
+            alignment=TA_LEFT,
+        )
+
+        summary_text = [
+            "<b>Konkurrence Sammendrag:</b>",
+            f"• Antal Deltagere: {total}",
+            f"• Vinder: {winner_name} (Mest Konsistent)",
+            f"• Vinder Konsistens Score: {winner_score:.3f}s",
+        ]
+
+        for text in summary_text:
+            elements.append(Paragraph(text, summary_style))
+
+    flowable_count = len(elements)
+
+    def on_build_progress(kind, value):
+        check_cancelled()
+        if kind == "PROGRESS":
+            report(0.2 + 0.8 * value / flowable_count)
+
+    doc.setProgressCallBack(on_build_progress)
+    try:
+        doc.build(elements)
+        os.replace(temp_name, filename)
+    finally:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+    report(1.0)
+
+
+class PdfExportJob:
+    """One PDF export running on its own thread.
+
+    The Tk thread starts the job, polls progress and done(), and may call
+    cancel(). The worker never touches Tk; when it finishes, error holds the
+    exception it failed with (None on success or cancel).
+    """
+
+    def __init__(self, filename, snapshot, run_count, event_info):
+        self.filename = filename
+        self.progress = 0.0
+        self.error = None
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(snapshot, run_count, dict(event_info)),
+            name="rowing-pdf-export",
+            daemon=True,
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def done(self):
+        return not self._thread.is_alive()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def _set_progress(self, fraction):
+        self.progress = fraction
+
+    def _run(self, snapshot, run_count, event_info):
+        try:
+            write_results_pdf(
+                self.filename,
+                snapshot,
+                run_count,
+                event_info,
+                progress=self._set_progress,
+                cancelled=self._cancel.is_set,
+            )
+        except ExportCancelled:
+            pass
+        except Exception as e:
+            self.error = e
+
+
+def load_engine(data_file, storage_kind="json"):
+    """Read a saved event into a fresh engine; returns (engine, event_info)"""
+    storage = open_storage(storage_kind, data_file)
+    try:
+        data = storage.load_snapshot() or {}
+        records = storage.read_journal()
+    finally:
+        storage.close()
+
+    if "participants" in data:
+        event_info = data.get("event_info", {})
+        participant_data = data["participants"]
+        snapshot_seq = data.get("journal_seq", 0)
+    else:
+        # Legacy flat format
+        event_info = {}
+        participant_data = data
+        snapshot_seq = 0
+
+    run_count = event_info.get("run_count", DEFAULT_RUN_COUNT)
+    participants = {
+        boat: Participant.from_dict(record, run_count)
+        for boat, record in participant_data.items()
+    }
+    replay_journal(participants, records, after_seq=snapshot_seq, run_count=run_count)
+
+    engine = TimingEngine(
+        run_count=run_count, scoring=event_info.get("scoring", DEFAULT_SCORING)
+    )
+    engine.load(participants)
+    return engine, event_info
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Eksporter resultater fra en gemt begivenhed til CSV"
+    )
+    parser.add_argument("data_file", help="datafil, f.eks. rowing_data.json")
+    parser.add_argument(
+        "-o", "--output", default="-", help="CSV fil (standard: standard output)"
+    )
+    parser.add_argument(
+        "--storage",
+        choices=sorted(STORAGE_BACKENDS),
+        default="json",
+        help="lagringsformat for datafilen",
+    )
+    parser.add_argument(
+        "--columns",
+        default=",".join(DEFAULT_COLUMNS),
+        help=f"kommaseparerede kolonner blandt: {', '.join(COLUMNS)}",
+    )
+    parser.add_argument(
+        "--event-info",
+        action="store_true",
+        help="skriv begivenhedsdetaljer før tabellen",
+    )
+    args = parser.parse_args(argv)
+
+    columns = [key.strip() for key in args.columns.split(",") if key.strip()]
+    try:
+        engine, event_info = load_engine(args.data_file, args.storage)
+        if args.output == "-":
+            count = write_results_csv(
+                sys.stdout, engine, columns, event_info if args.event_info else None
+            )
+        else:
+            with open(args.output, "w", newline="", encoding="utf-8") as f:
+                count = write_results_csv(
+                    f, engine, columns, event_info if args.event_info else None
+                )
+    except (OSError, ValueError) as e:
+        print(f"Eksport fejlede: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{count} resultater eksporteret", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Remote station API for the Rowing Timer
+A small HTTP/JSON server (stdlib asyncio, no dependencies) lets the start
+and finish officials send START, STOP and RESET from their own devices on
+the local network.
+
+The server runs its own event loop on a background thread and never
+touches the engine. Commands are queued and applied by whoever owns the
+engine (the Tk thread in the app) through CommandQueue.drain(), ordered by
+the moment the official pressed the button.
+
+Endpoints (JSON in, JSON out):
+    GET  /api/clock                          engine clock, for client sync
+    GET  /api/status                         runs, boats and running timers
+    POST /api/boats/<boat>/runs/<run>/start  body {"at_ns": ...} is optional
+    POST /api/boats/<boat>/runs/<run>/stop
+    POST /api/boats/<boat>/runs/<run>/reset
+    POST /api/commands                       [{"action", "boat", "run", "at_ns"}]
+
+Station use:
+    python remote_api.py --host 192.168.1.10 stop 12 --run 1
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import http.client
+import itertools
+import json
+import sys
+import threading
+import time
+from urllib.parse import quote, unquote
+
+from timing_engine import TimerStateError, TimingError
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+ACTIONS = ("start", "stop", "reset")
+
+# Largest request body accepted (a batch of a few thousand commands)
+MAX_BODY_BYTES = 1 << 20
+
+# How long a request waits for the engine owner to apply its command
+COMMAND_TIMEOUT = 5.0
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+def parse_address(value):
+    """(host, port) from "host:port", ":port", "port" or a bare "1"/"on" """
+    value = (value or "").strip()
+    if value.lower() in ("", "1", "on", "true", "yes"):
+        return DEFAULT_HOST, DEFAULT_PORT
+    host, _, port = value.rpartition(":")
+    if not port.isdigit():
+        # Just a host name or address
+        return value, DEFAULT_PORT
+    return host or DEFAULT_HOST, int(port)
+
+
+class ApiError(Exception):
+    """A request that is answered with an HTTP error status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Command:
+    """One queued remote command and the future its response waits on"""
+
+    __slots__ = ("action", "boat", "run", "at_ns", "seq", "future")
+
+    def __init__(self, action, boat, run, at_ns, seq):
+        self.action = action
+        self.boat = boat
+        self.run = run
+        self.at_ns = at_ns
+        self.seq = seq
+        self.future = concurrent.futures.Future()
+
+
+class CommandQueue:
+    """Hands commands from the server thread to the engine's owner thread.
+
+    Commands without a client timestamp are stamped with the engine clock
+    on arrival. drain() applies everything queued, oldest press first, so a
+    burst of finishes is recorded in the order it happened even when the
+    requests arrive out of order.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self._pending = []
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+
+    def submit(self, action, boat=None, run=None, at_ns=None):
+        """Queue a command (any thread); returns a concurrent Future"""
+        if at_ns is None:
+            at_ns = self.clock.now_ns()
+        command = Command(action, boat, run, at_ns, next(self._seq))
+        with self._lock:
+            self._pending.append(command)
+        return command.future
+
+    def __len__(self):
+        return len(self._pending)
+
+    def drain(self, engine):
+        """Apply all queued commands to the engine; call on the owner thread"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            commands, self._pending = self._pending, []
+
+        commands.sort(key=lambda command: (command.at_ns, command.seq))
+        for command in commands:
+            try:
+                result = apply_command(engine, command)
+            except Exception as e:
+                command.future.set_exception(e)
+            else:
+                command.future.set_result(result)
+        return len(commands)
+
+
+def apply_command(engine, command):
+    """Carry out one command and return its JSON response"""
+    boat, run = command.boat, command.run
+    if command.action == "status":
+        return {
+            "run_count": engine.run_count,
+            "boats": {
+                boat: {"name": participant.name, "times_ns": list(participant.times_ns)}
+                for boat, participant in engine.participants.items()
+            },
+            "running": [[boat, run] for boat, run in engine.current_timers],
+            "skew": engine.skew.summary(),
+        }
+    if command.action == "start":
+        start_ns = engine.start(boat, run, at_ns=command.at_ns)
+        return {"boat": boat, "run": int(run), "start_ns": start_ns}
+    if command.action == "stop":
+        time_ns = engine.stop(boat, run, at_ns=command.at_ns)
+        return {"boat": boat, "run": int(run), "time_ns": time_ns}
+    if command.action == "reset":
+        engine.reset(boat, run)
+        return {"boat": boat, "run": int(run)}
+    raise ApiError(400, f"Ukendt handling: {command.action}")
+
+
+def _error_status(error):
+    if isinstance(error, ApiError):
+        return error.status
+    if isinstance(error, TimerStateError):
+        return 409
+    if isinstance(error, (TimingError, ValueError)):
+        return 400
+    return 500
+
+
+class RemoteApiServer:
+    """HTTP/1.1 JSON server on its own thread and asyncio event loop"""
+
+    def __init__(self, queue, host=DEFAULT_HOST, port=DEFAULT_PORT, token=None):
+        self.queue = queue
+        self.host = host
+        self.port = port
+        self.token = token
+        self._loop = None
+        self._server = None
+        self._writers = set()
+        self._ready = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, name="rowing-remote-api", daemon=True
+        )
+
+    def start(self):
+        """Start serving; returns once the port is bound (port 0 picks one)"""
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def stop(self, timeout=5.0):
+        if self._loop is not None and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle_connection, self.host, self.port)
+            )
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            loop.close()
+            return
+
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            # Keep-alive stations would otherwise hold the shutdown up
+            for writer in list(self._writers):
+                writer.close()
+            loop.run_until_complete(self._server.wait_closed())
+            loop.close()
+
+    async def _handle_connection(self, reader, writer):
+        """Serve requests on one keep-alive connection until it closes"""
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = (
+                        request_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+                    )
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Ugyldig forespørgsel"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = version == "HTTP/1.1" and (
+                    headers.get("connection", "").lower() != "close"
+                )
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Ugyldig længde"}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "For stor forespørgsel"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    self._check_token(headers)
+                    status, payload = 200, await self._dispatch(method, target, body)
+                except Exception as e:
+                    status, payload = _error_status(e), {"error": str(e)}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _check_token(self, headers):
+        if self.token and headers.get("authorization") != f"Bearer {self.token}":
+            raise ApiError(401, "Manglende eller forkert adgangsnøgle")
+
+    async def _dispatch(self, method, target, body):
+        path = target.split("?", 1)[0]
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+
+        if parts == ["api", "clock"]:
+            self._check_method(method, "GET")
+            clock = self.queue.clock
+            return {"now_ns": clock.now_ns(), "clock": clock.name}
+
+        if parts == ["api", "status"]:
+            self._check_method(method, "GET")
+            return await self._wait(self.queue.submit("status"))
+
+        if parts == ["api", "commands"]:
+            self._check_method(method, "POST")
+            commands = self._parse_json(body)
+            if not isinstance(commands, list) or not all(
+                isinstance(command, dict) for command in commands
+            ):
+                raise ApiError(400, "Forventede en liste af kommandoer")
+            # Check the whole batch first, so a bad entry queues nothing
+            checked = [
+                self._check_command(
+                    command.get("action"),
+                    command.get("boat"),
+                    command.get("run"),
+                    command.get("at_ns"),
+                )
+                for command in commands
+            ]
+            futures = [self.queue.submit(*command) for command in checked]
+            results = []
+            for future in futures:
+                try:
+                    results.append({"ok": True, **await self._wait(future)})
+                except Exception as e:
+                    results.append(
+                        {"ok": False, "status": _error_status(e), "error": str(e)}
+                    )
+            return {"results": results}
+
+        if (
+            len(parts) == 6
+            and parts[:2] == ["api", "boats"]
+            and parts[3] == "runs"
+            and parts[5] in ACTIONS
+        ):
+            self._check_method(method, "POST")
+            data = self._parse_json(body) if body else {}
+            if not isinstance(data, dict):
+                raise ApiError(400, "Forventede et JSON objekt")
+            return await self._wait(
+                self._submit(parts[5], parts[2], parts[4], data.get("at_ns"))
+            )
+
+        raise ApiError(404, f"Ukendt adresse: {path}")
+
+    def _submit(self, action, boat, run, at_ns):
+        return self.queue.submit(*self._check_command(action, boat, run, at_ns))
+
+    @staticmethod
+    def _check_command(action, boat, run, at_ns):
+        """(action, boat, run, at_ns) of a well-formed command, or ApiError"""
+        if action not in ACTIONS:
+            raise ApiError(400, f"Ukendt handling: {action}")
+        if isinstance(boat, bool) or not isinstance(boat, (str, int)) or not str(boat).strip():
+            raise ApiError(400, "boat skal være et båd nummer")
+        if isinstance(run, str) and run.strip().isdigit():
+            run = int(run)
+        if isinstance(run, bool) or not isinstance(run, int):
+            raise ApiError(400, "run skal være et heltal")
+        if at_ns is not None and (isinstance(at_ns, bool) or not isinstance(at_ns, int)):
+            raise ApiError(400, "at_ns skal være et heltal (nanosekunder)")
+        return action, str(boat), run, at_ns
+
+    @staticmethod
+    def _check_method(method, allowed):
+        if method != allowed:
+            raise ApiError(405, f"Brug {allowed}")
+
+    @staticmethod
+    def _parse_json(body):
+        try:
+            return json.loads(body or b"null")
+        except ValueError:
+            raise ApiError(400, "Ugyldig JSON")
+
+    @staticmethod
+    async def _wait(future):
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), COMMAND_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise ApiError(503, "Tidtagningen svarer ikke")
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+class RemoteClient:
+    """Station-side client: one keep-alive connection and a synced clock.
+
+    sync() estimates the offset between this machine's perf_counter_ns and
+    the engine clock from the fastest of a few round trips, so commands can
+    carry the moment the button was pressed rather than when they arrived.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, token=None, timeout=10.0):
+        self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+        self.token = token
+        self.offset_ns = None
+
+    def request(self, method, path, payload=None):
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        body = None if payload is None else json.dumps(payload)
+        self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        return response.status, json.loads(response.read() or b"null")
+
+    def sync(self, samples=5):
+        """Measure the clock offset; returns the best round trip in ns"""
+        best_rtt = None
+        for _ in range(samples):
+            sent = time.perf_counter_ns()
+            _, data = self.request("GET", "/api/clock")
+            received = time.perf_counter_ns()
+            rtt = received - sent
+            if best_rtt is None or rtt < best_rtt:
+                best_rtt = rtt
+                self.offset_ns = data["now_ns"] - (sent + received) // 2
+        return best_rtt
+
+    def now_ns(self):
+        """The engine clock as estimated on this machine, or None before sync()"""
+        if self.offset_ns is None:
+            return None
+        return time.perf_counter_ns() + self.offset_ns
+
+    def command(self, action, boat, run, at_ns=None):
+        if at_ns is None:
+            at_ns = self.now_ns()
+        payload = {} if at_ns is None else {"at_ns": at_ns}
+        # Boat IDs are free text; "/", "?" or "#" must not change the path
+        boat = quote(str(boat), safe="")
+        return self.request("POST", f"/api/boats/{boat}/runs/{run}/{action}", payload)
+
+    def start(self, boat, run, at_ns=None):
+        return self.command("start", boat, run, at_ns)
+
+    def stop(self, boat, run, at_ns=None):
+        return self.command("stop", boat, run, at_ns)
+
+    def reset(self, boat, run):
+        return self.command("reset", boat, run)
+
+    def close(self):
+        self.connection.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Send START/STOP/RESET til tidtagningen fra en anden maskine"
+    )
+    parser.add_argument("action", choices=ACTIONS)
+    parser.add_argument("boat", help="båd nummer")
+    parser.add_argument("--run", type=int, default=1, help="tur (standard: 1)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--token", help="adgangsnøgle, hvis serveren kræver en")
+    args = parser.parse_args(argv)
+
+    # Take the timestamp before anything touches the network
+    pressed = time.perf_counter_ns()
+    client = RemoteClient(args.host, args.port, args.token)
+    try:
+        client.sync()
+        status, data = client.command(
+            args.action, args.boat, args.run, pressed + client.offset_ns
+        )
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Kunne ikke nå tidtagningen: {e}", file=sys.stderr)
+        return 1
+    finally:
+        client.close()
+
+    print(json.dumps(data, ensure_ascii=False))
+    return 0 if status == 200 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
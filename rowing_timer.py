@@ -1,40 +1,525 @@
 import csv
-import json
+import importlib.util
 import os
 import sys
 import time
 import tkinter as tk
 from datetime import datetime
-from tkinter import filedialog, messagebox, ttk
+from operator import itemgetter
+from tkinter import messagebox, ttk
+
+from clock import EventTimeMapper
+from exporter import PdfExportJob, result_snapshot, write_results_csv
+from remote_api import CommandQueue, RemoteApiServer, parse_address
+from start_list import read_start_list
+from time_format import (
+    NS_PER_TENTH,
+    format_ms,
+    format_running_tenths,
+    format_time_ns,
+    seconds_to_ms,
+)
+from storage import (
+    BackgroundWriter,
+    SqliteStorage,
+    import_json_to_sqlite,
+    open_storage,
+    replay_journal,
+)
+from timing_engine import (
+    DEFAULT_RUN_COUNT,
+    DEFAULT_SCORING,
+    MAX_RUN_COUNT,
+    SCORING_METHODS,
+    GroupStartError,
+    Participant,
+    RegistrationError,
+    TimerStateError,
+    TimingEngine,
+    TimingError,
+    natural_key,
+)
+
+# Number of journal records written before they are folded into a snapshot
+JOURNAL_COMPACT_THRESHOLD = 200
+
+# Storage backend: "json" (rowing_data.json + journal) or "sqlite" (rowing_data.db)
+DEFAULT_STORAGE = os.environ.get("ROWING_TIMER_STORAGE", "json")
+
+# Print how long each startup phase takes (also: --profile-startup)
+PROFILE_STARTUP = os.environ.get("ROWING_TIMER_PROFILE") == "1"
+
+# Remote station API: "host:port" to listen on (also: --api); unset is off.
+# Listening beyond this machine, e.g. on 0.0.0.0, should set a token.
+REMOTE_API = os.environ.get("ROWING_TIMER_API")
+REMOTE_API_TOKEN = os.environ.get("ROWING_TIMER_API_TOKEN")
+
+# How often the Tk thread applies queued remote commands (ms)
+REMOTE_POLL_MS = 10
+
+# Virtualized boat list: fixed row height (px) and extra rows kept above/below
+BOAT_ROW_HEIGHT = 34
+BOAT_ROW_BUFFER = 4
+
+# Running-timer refresh (ms): fast while a running row is on screen, slow
+# while all running boats are scrolled out of view
+TIMER_TICK_MS = 50
+TIMER_IDLE_TICK_MS = 500
+
+# How often the Tk thread checks on a running PDF export (ms)
+PDF_POLL_MS = 100
+
+# Problems listed in the error dialog of a refused start list import
+START_LIST_PROBLEMS_SHOWN = 15
+
+# Notifications in the timing path never block: they show at the bottom of
+# the window for TOAST_MS, at most TOASTS_SHOWN at a time besides the
+# sticky ones that stay until dismissed
+TOAST_MS = 6000
+TOASTS_SHOWN = 3
+TOAST_COLORS = {  # kind -> (background, text)
+    "info": ("#dbeafe", "#1e3a8a"),
+    "warning": ("#fef3c7", "#92400e"),
+    "error": ("#fee2e2", "#991b1b"),
+}
+
+# Resets and discarded times that can be undone (Ctrl+Z or "Fortryd")
+UNDO_LIMIT = 50
+
+# Problems listed in the notification of a refused group start
+GROUP_START_PROBLEMS_SHOWN = 3
 
 
 class RowingTimer:
-    def __init__(self, root):
+    def __init__(
+        self,
+        root,
+        clock=None,
+        storage=None,
+        data_file="rowing_data.json",
+        profile_startup=PROFILE_STARTUP,
+        remote_api=REMOTE_API,
+    ):
+        self.profile_startup = profile_startup
+        self._startup_started = self._phase_started = time.perf_counter()
+
         self.root = root
         self.root.title("Skelskør Roklub - Ro Konkurrence Timer")
         self.root.geometry("900x700")
 
+        # Timing state lives in the headless engine; this class is the view.
+        # Elapsed times come from a monotonic nanosecond counter whose
+        # wall-clock anchor keeps run start times human-readable.
+        self.engine = TimingEngine(clock)
+
         # Data storage
-        self.participants = {}
         self.event_info = {
             "name": "",
             "date": datetime.now().strftime("%Y-%m-%d"),
             "location": "Skælskør",
-            "description": ""
+            "description": "",
+            "run_count": DEFAULT_RUN_COUNT,
+            "scoring": DEFAULT_SCORING,
         }
-        self.current_timers = {}
-        self.data_file = "rowing_data.json"
+        self.data_file = data_file
+        self.storage_kind = storage or DEFAULT_STORAGE
+        self._storage = None
+        self._storage_file = None
+
+        # Write-ahead journal: timing events are appended instead of
+        # rewriting the whole data file on every stop
+        self.journal_mode = True
+        self._journal_seq = 0
+        self._journal_count = 0
+
+        # All disk writes happen on a background thread
+        self.writer = BackgroundWriter(on_error=self._on_storage_error)
+        self._storage_error_pending = False
+        self._storage_error_toast = None
+
+        # Keyed row index for the participants list: boat -> (item id, values)
+        self._participant_rows = {}
+        self._participant_row_boats = {}
+        self._participant_rows_tree = None
+
+        # Results tab rows follow the engine's leaderboard: boat -> item id
+        self._result_rows = {}
+
+        # Header sorting of the Results tab: the (column, reverse) shown,
+        # and each column's ascending item order until the rows change
+        self._result_sort = None
+        self._result_sort_orders = {}
+
+        # Pending running-timer tick (at most one is ever scheduled)
+        self._timer_tick_id = None
+
+        # PDF export running on a worker thread, if any
+        self._pdf_export = None
+        self._pdf_progress_dialog = None
+
+        # Non-modal notifications on screen, oldest first, and the undo
+        # stack. Each entry is a tuple of (boat, run, state before, state
+        # after) changes that are undone together.
+        self._toasts = []
+        self._sticky_toasts = set()
+        self._undo_stack = []
+
+        # START/STOP take the time of the button press, not of handling it
+        self.input_times = EventTimeMapper(self.engine.clock)
+
+        # Commands from remote start/finish stations, applied on this thread
+        self.remote_commands = CommandQueue(self.engine.clock)
+        self.remote_server = None
+
+        # Tabs other than the first are built when first shown, so their
+        # widgets stay None until then and their views skip updates
+        self.participants_tree = None
+        self.results_tree = None
+        self.boat_controls_canvas = None
+        self.run_var = tk.StringVar(value="1")
+
+        # Widgets of the rows currently on screen, keyed by boat, for targeted
+        # updates. Boats scrolled out of view have no entry.
+        self.boat_control_widgets = {}
+        self._boat_row_pool = []
+        self._boat_order = []
+        self._boat_row_index = {}
+        self._boat_render_pending = False
+
+        # Filter boxes of the Registration and Timing tabs: the query and,
+        # while it has words, the set of matching boats
+        self._participant_query = ""
+        self._participant_filter = None
+        self._timing_query = ""
+        self._timing_filter = None
+
+        # Staggered starts: boats before this index in _boat_order have
+        # started (or have a time) in the selected run
+        self._next_start_index = 0
+
+        # Boats ticked for the next group start
+        self._group_selection = set()
+
+        self._startup_phase("init")
 
         # Load existing data if available
         self.load_data()
+        self._startup_phase("load_data")
 
         # Create GUI
         self.create_widgets()
+        self._startup_phase("create_widgets")
+
+        # Keep views and the data file in step with the engine
+        self.engine.subscribe(self._refresh_for_engine_event)
+        self.engine.subscribe(self._persist_engine_event)
+
+        # Make sure queued writes reach the disk before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        if remote_api:
+            self.start_remote_api(remote_api)
+
+    @property
+    def participants(self):
+        return self.engine.participants
+
+    @participants.setter
+    def participants(self, participants):
+        self.engine.load(self._as_participants(participants))
+
+    def _as_participants(self, records):
+        """Accept records in the JSON format as well as Participant objects"""
+        return {
+            boat: (
+                record
+                if isinstance(record, Participant)
+                else Participant.from_dict(record, self.engine.run_count)
+            )
+            for boat, record in records.items()
+        }
+
+    @property
+    def current_timers(self):
+        return self.engine.current_timers
+
+    @current_timers.setter
+    def current_timers(self, current_timers):
+        self.engine.current_timers = current_timers
+
+    @property
+    def clock(self):
+        return self.engine.clock
+
+    @property
+    def storage(self):
+        """Storage backend for the current data file"""
+        storage = self._storage
+        if (
+            storage is None
+            or storage.name != self.storage_kind
+            or self._storage_file != self.data_file
+        ):
+            storage = self._storage = open_storage(self.storage_kind, self.data_file)
+            self._storage_file = self.data_file
+        return storage
+
+    def _refresh_for_engine_event(self, event, data):
+        """Engine listener: bring the views up to date after a change"""
+        boat = data.get("boat")
+
+        if event == "ranked":
+            self._update_result_rank(boat, data["old_index"], data["new_index"])
+        elif event == "configured":
+            self._apply_run_count()
+        elif event in ("started", "stopped", "reset", "restored"):
+            if event in ("reset", "restored"):
+                # The boat may be due to start again
+                self._next_start_index = min(
+                    self._next_start_index,
+                    self._boat_row_index.get(boat, self._next_start_index),
+                )
+            self.update_participants_display([boat])
+            self.update_single_boat_controls(boat)
+            if event != "reset":
+                self._update_skew_label()
+            if event == "started" or (event == "restored" and data["running_ns"]):
+                # A slow idle tick may be pending; the new row ticks at once
+                self._schedule_timer_tick(restart=True)
+        elif event == "group_started":
+            # One refresh for the whole group, touching only its rows
+            boats = data["boats"]
+            self.update_participants_display(boats)
+            for boat in boats:
+                self.update_single_boat_controls(boat)
+            self._update_skew_label()
+            self._schedule_timer_tick(restart=True)
+        else:
+            self.update_participants_display()
+            self.update_boat_controls()
+            if event not in ("registered", "imported"):
+                self.refresh_results()
+
+    def _update_skew_label(self):
+        skew_label = getattr(self, "skew_label", None)
+        if skew_label is None or not self.engine.skew.count:
+            return
+        skew = self.engine.skew.summary()
+        skew_label.config(
+            text=f"Forsinkelse: {skew['last_ms']:.0f} ms (maks {skew['max_ms']:.0f} ms)"
+        )
+
+    def _persist_engine_event(self, event, data):
+        """Engine listener: journal timing events, snapshot structural changes"""
+        if event == "registered":
+            self.record_event("register", boat=data["boat"], name=data["name"])
+        elif event == "started":
+            self.record_event(
+                "start", boat=data["boat"], run=data["run"], start=data["start"]
+            )
+        elif event == "group_started":
+            # The same start records as single starts, in a single write
+            self.record_events(
+                [
+                    {"op": "start", "boat": boat, "run": data["run"], "start": data["start"]}
+                    for boat in data["boats"]
+                ]
+            )
+        elif event == "stopped":
+            self.record_event(
+                "stop",
+                boat=data["boat"],
+                run=data["run"],
+                time=data["time"],
+                time_ns=data["time_ns"],
+                clock=data["clock"],
+            )
+        elif event == "reset":
+            self.record_event("reset", boat=data["boat"], run=data["run"])
+        elif event == "restored":
+            # Journalled as the reset, start and stop that lead to the same run
+            boat, run = data["boat"], data["run"]
+            if data["start"] is None and data["time_ns"] is None:
+                self.record_event("reset", boat=boat, run=run)
+            else:
+                self.record_event("start", boat=boat, run=run, start=data["start"])
+            if data["time_ns"] is not None:
+                self.record_event(
+                    "stop",
+                    boat=boat,
+                    run=run,
+                    time=data["time_ns"] / 1e9,
+                    time_ns=data["time_ns"],
+                    clock=data["clock"],
+                )
+        elif event == "configured":
+            self.event_info["run_count"] = data["run_count"]
+            self.event_info["scoring"] = data["scoring"]
+            self.save_data()
+        elif event in ("imported", "removed", "cleared"):
+            # One snapshot covers a whole batch of registrations
+            self.save_data()
+
+    def _show_timing_error(self, error):
+        """Report a refused timing operation without blocking other boats"""
+        if isinstance(error, TimerStateError):
+            self.show_toast(str(error), "warning")
+        else:
+            self.show_toast(str(error), "error")
+
+    def show_toast(self, message, kind="info", undo=None, sticky=False):
+        """Show a notification that goes away by itself.
+
+        Unlike a messagebox it does not stop the event loop, so every other
+        START/STOP button keeps working while it is shown. With undo (an
+        undo stack entry) it gets a "Fortryd" button. A sticky one stays
+        until its ✕ is clicked.
+        """
+        background, foreground = TOAST_COLORS[kind]
+        toast = tk.Frame(self.toast_frame, bg=background, padx=10, pady=4)
+        tk.Label(
+            toast,
+            text=message,
+            bg=background,
+            fg=foreground,
+            font=("Arial", 10, "bold"),
+            anchor="w",
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        tk.Button(
+            toast,
+            text="✕",
+            command=lambda: self._dismiss_toast(toast),
+            relief="flat",
+            bg=background,
+        ).pack(side=tk.RIGHT)
+        if undo is not None:
+            tk.Button(
+                toast,
+                text="↶ Fortryd",
+                command=lambda: self._undo_from_toast(toast, undo),
+                font=("Arial", 9, "bold"),
+            ).pack(side=tk.RIGHT, padx=5)
+        toast.pack(fill=tk.X, pady=1)
+
+        self._toasts.append(toast)
+        if sticky:
+            self._sticky_toasts.add(toast)
+        else:
+            self.root.after(TOAST_MS, lambda: self._dismiss_toast(toast))
+        expiring = [shown for shown in self._toasts if shown not in self._sticky_toasts]
+        for shown in expiring[: max(0, len(expiring) - TOASTS_SHOWN)]:
+            self._dismiss_toast(shown)
+        return toast
+
+    def _dismiss_toast(self, toast):
+        if toast in self._toasts:
+            self._toasts.remove(toast)
+            self._sticky_toasts.discard(toast)
+            toast.destroy()
+
+    def _undo_from_toast(self, toast, entry):
+        self._dismiss_toast(toast)
+        self.undo(entry)
+
+    def _push_undo(self, message, changes):
+        """Offer to put runs back the way they were before a destructive action.
+
+        changes lists (boat, run, state before) for every run the action
+        changed; they are undone together.
+        """
+        entry = tuple(
+            (boat, run, before, self.engine.run_state(boat, run))
+            for boat, run, before in changes
+        )
+        self._undo_stack.append(entry)
+        del self._undo_stack[:-UNDO_LIMIT]
+        self.show_toast(message, "warning", undo=entry)
+
+    def undo(self, entry=None):
+        """Undo the latest reset or discarded time, or the given entry.
+
+        Nothing is undone if any of the entry's runs has been timed again
+        since. Returns True when the runs were put back.
+        """
+        if entry is None:
+            if not self._undo_stack:
+                self.show_toast("Intet at fortryde.")
+                return False
+            entry = self._undo_stack[-1]
+        for index, queued in enumerate(self._undo_stack):
+            if queued is entry:
+                del self._undo_stack[index]
+                break
+        else:
+            return False  # Undone already
+
+        try:
+            for boat, run, before, after in entry:
+                if self.engine.run_state(boat, run) != after:
+                    raise TimingError(
+                        f"Båd {boat} Tur {run} er ændret siden og kan ikke fortrydes."
+                    )
+            for boat, run, before, after in entry:
+                self.engine.restore(boat, run, before)
+        except TimingError as e:
+            self._show_timing_error(e)
+            return False
+        if len(entry) == 1:
+            self.show_toast(f"Fortrudt: Båd {boat} Tur {run} er sat tilbage.")
+        else:
+            self.show_toast(f"Fortrudt: {len(entry)} både i Tur {run} er sat tilbage.")
+        return True
+
+    def on_close(self):
+        """Flush pending writes and close the application"""
+        if self._pdf_export is not None:
+            # Let the worker remove its unfinished file before exiting
+            self._pdf_export.cancel()
+            self._pdf_export.join(5.0)
+        self.stop_remote_api()
+        self.flush_storage()
+        self.root.destroy()
+
+    def start_remote_api(self, address, token=REMOTE_API_TOKEN):
+        """Accept START/STOP/RESET from remote stations over HTTP"""
+        host, port = parse_address(address)
+        server = RemoteApiServer(self.remote_commands, host, port, token)
+        try:
+            server.start()
+        except OSError as e:
+            messagebox.showerror(
+                "Fjernbetjening",
+                f"Kunne ikke starte fjernbetjening på {host}:{port}:\n{e}",
+                parent=self.root,
+            )
+            return
+        self.remote_server = server
+        print(f"Fjernbetjening lytter på http://{host}:{server.port}/api/")
+        self.root.after(REMOTE_POLL_MS, self._apply_remote_commands)
+
+    def stop_remote_api(self):
+        if self.remote_server is not None:
+            self.remote_server.stop()
+            self.remote_server = None
+
+    def _apply_remote_commands(self):
+        """Run queued remote commands through the engine, then check again"""
+        if self.remote_server is None:
+            return
+        self.remote_commands.drain(self.engine)
+        self.root.after(REMOTE_POLL_MS, self._apply_remote_commands)
+
+    def flush_storage(self, timeout=10.0):
+        """Wait for the writer thread to finish all queued writes"""
+        if not self.writer.close(timeout):
+            print("Warning: not all data could be written before exit")
 
     def create_widgets(self):
         # Create notebook for tabs
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.notebook = notebook
 
         # Add club header
         header_frame = tk.Frame(self.root, bg="#1e3a8a", height=80)
@@ -83,25 +568,76 @@ class RowingTimer:
         )
         subtitle_label.pack(pady=(0, 5))
 
-        # Event Tab
-        event_frame = ttk.Frame(notebook)
-        notebook.add(event_frame, text="📅 Begivenhed")
-        self.create_event_tab(event_frame)
+        # Notifications and undo for the timing path, below the tabs
+        self.toast_frame = tk.Frame(self.root)
+        self.toast_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10)
+        self.root.bind("<Control-z>", lambda event: self.undo())
+
+        # Mouse moves and key presses anywhere teach the input clock mapping
+        # its gap, so even the first START/STOP press is backdated correctly
+        for sequence in ("<Motion>", "<KeyPress>"):
+            self.root.bind_all(
+                sequence,
+                lambda event: self.input_times.observe(event.time),
+                add="+",
+            )
+
+        # Tabs are built the first time they are shown; each builder also
+        # does the tab's one and only initial population
+        self._pending_tabs = {}
+
+        # Event Tab (shown first, so built right away)
+        event_frame = self._add_tab("📅 Begivenhed", self.create_event_tab)
+        self._build_tab(str(event_frame))
 
         # Registration Tab
-        reg_frame = ttk.Frame(notebook)
-        notebook.add(reg_frame, text="📝 Tilmeldinger")
-        self.create_registration_tab(reg_frame)
+        self._add_tab(
+            "📝 Tilmeldinger",
+            self.create_registration_tab,
+            self.update_participants_display,
+        )
 
         # Timing Tab
-        timing_frame = ttk.Frame(notebook)
-        notebook.add(timing_frame, text="⏱️ Tidtagning")
-        self.create_timing_tab(timing_frame)
+        self.timing_frame = self._add_tab(
+            "⏱️ Tidtagning", self.create_timing_tab, self.update_boat_controls
+        )
 
         # Results Tab
-        results_frame = ttk.Frame(notebook)
-        notebook.add(results_frame, text="🏆 Resultater")
-        self.create_results_tab(results_frame)
+        self.results_frame = self._add_tab(
+            "🏆 Resultater", self.create_results_tab, self.refresh_results
+        )
+
+    def _add_tab(self, text, build, populate=None):
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        self._pending_tabs[str(frame)] = (frame, build, populate)
+        return frame
+
+    def _build_tab(self, name):
+        """Create a tab's widgets and fill them, if not done already"""
+        pending = self._pending_tabs.pop(name, None)
+        if pending is None:
+            return
+        frame, build, populate = pending
+        build(frame)
+        if populate is not None:
+            populate()
+
+    def build_all_tabs(self):
+        """Build every tab now, e.g. for tests or before exporting"""
+        for name in list(self._pending_tabs):
+            self._build_tab(name)
+
+    def _startup_phase(self, phase):
+        """Print the time spent in a startup phase when profiling"""
+        if not self.profile_startup:
+            return
+        now = time.perf_counter()
+        print(
+            f"[startup] {phase:<16} {(now - self._phase_started) * 1000:7.1f} ms "
+            f"(total {(now - self._startup_started) * 1000:.1f} ms)"
+        )
+        self._phase_started = now
 
     def create_event_tab(self, parent):
         # Event details form
@@ -126,15 +662,34 @@ class RowingTimer:
         self.event_location_var = tk.StringVar(value=self.event_info.get("location", "Skælskør"))
         ttk.Entry(frame, textvariable=self.event_location_var, font=("Arial", 10)).grid(row=2, column=1, sticky=tk.EW, padx=10)
 
+        # Runs per boat
+        ttk.Label(frame, text="Antal ture:", font=("Arial", 10)).grid(row=3, column=0, sticky=tk.W, pady=10)
+        self.run_count_var = tk.StringVar(value=str(self.engine.run_count))
+        ttk.Spinbox(
+            frame, from_=1, to=MAX_RUN_COUNT, textvariable=self.run_count_var, width=5, font=("Arial", 10)
+        ).grid(row=3, column=1, sticky=tk.W, padx=10)
+
+        # Consistency scoring
+        ttk.Label(frame, text="Pointmetode:", font=("Arial", 10)).grid(row=4, column=0, sticky=tk.W, pady=10)
+        self.scoring_var = tk.StringVar(value=SCORING_METHODS[self.engine.scoring][0])
+        ttk.Combobox(
+            frame,
+            textvariable=self.scoring_var,
+            values=[label for label, _ in SCORING_METHODS.values()],
+            state="readonly",
+            width=25,
+            font=("Arial", 10),
+        ).grid(row=4, column=1, sticky=tk.W, padx=10)
+
         # Description
-        ttk.Label(frame, text="Beskrivelse/Noter:", font=("Arial", 10)).grid(row=3, column=0, sticky=tk.W, pady=10)
+        ttk.Label(frame, text="Beskrivelse/Noter:", font=("Arial", 10)).grid(row=5, column=0, sticky=tk.W, pady=10)
         self.event_desc_text = tk.Text(frame, height=10, font=("Arial", 10))
-        self.event_desc_text.grid(row=3, column=1, sticky=tk.EW, padx=10)
+        self.event_desc_text.grid(row=5, column=1, sticky=tk.EW, padx=10)
         self.event_desc_text.insert("1.0", self.event_info.get("description", ""))
 
         # Save Button
         search_btn_frame = ttk.Frame(frame)
-        search_btn_frame.grid(row=4, column=0, columnspan=2, pady=20)
+        search_btn_frame.grid(row=6, column=0, columnspan=2, pady=20)
         
         ttk.Button(
             search_btn_frame, 
@@ -148,7 +703,23 @@ class RowingTimer:
         self.event_info["date"] = self.event_date_var.get().strip()
         self.event_info["location"] = self.event_location_var.get().strip()
         self.event_info["description"] = self.event_desc_text.get("1.0", tk.END).strip()
-        
+
+        scoring = next(
+            (name for name, (label, _) in SCORING_METHODS.items() if label == self.scoring_var.get()),
+            self.engine.scoring,
+        )
+        try:
+            run_count = int(self.run_count_var.get())
+            if (run_count, scoring) != (self.engine.run_count, self.engine.scoring):
+                self.engine.configure(run_count=run_count, scoring=scoring)
+        except ValueError:
+            messagebox.showerror("Fejl", "Antal ture skal være et tal.", parent=self.root)
+            return
+        except TimingError as e:
+            self.run_count_var.set(str(self.engine.run_count))
+            messagebox.showerror("Fejl", str(e), parent=self.root)
+            return
+
         self.save_data()
         messagebox.showinfo("Gemt", "Begivenhedsinformation er gemt.", parent=self.root)
 
@@ -176,20 +747,21 @@ class RowingTimer:
         ttk.Button(
             form_frame, text="📝 Tilmeld", command=self.register_participant
         ).grid(row=0, column=4, padx=10)
+        ttk.Button(
+            form_frame, text="📥 Importer startliste", command=self.import_start_list
+        ).grid(row=0, column=5, padx=5)
 
         # Participants list
         list_frame = ttk.LabelFrame(parent, text="🚣 Deltagere", padding=10)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        # Treeview for participants
-        columns = ("Båd", "Navn", "Tur 1", "Tur 2", "Status")
-        self.participants_tree = ttk.Treeview(
-            list_frame, columns=columns, show="headings", height=15
+        self.participant_filter_var, self.participant_filter_label = (
+            self._create_filter_box(list_frame, self.filter_participants)
         )
 
-        for col in columns:
-            self.participants_tree.heading(col, text=col)
-            self.participants_tree.column(col, width=120)
+        # Treeview for participants
+        self.participants_tree = ttk.Treeview(list_frame, show="headings", height=15)
+        self._configure_participant_columns()
 
         # Scrollbar
         scrollbar = ttk.Scrollbar(
@@ -215,27 +787,100 @@ class RowingTimer:
         # Global run selection at the top
         run_select_frame = ttk.LabelFrame(parent, text="🏁 Nuværende tur", padding=10)
         run_select_frame.pack(fill=tk.X, padx=10, pady=5)
+        self.run_select_frame = run_select_frame
 
-        self.run_var = tk.StringVar(value="1")
         ttk.Label(
             run_select_frame,
             text="Vælg hvilken tur der skal tages tid på:",
             font=("Arial", 10, "bold"),
         ).pack(side=tk.LEFT, padx=5)
-        ttk.Radiobutton(
-            run_select_frame,
-            text="🥇 Tur 1",
-            variable=self.run_var,
-            value="1",
-            command=self.update_all_boat_controls_for_run_change,
-        ).pack(side=tk.LEFT, padx=10)
-        ttk.Radiobutton(
-            run_select_frame,
-            text="🥈 Tur 2",
-            variable=self.run_var,
-            value="2",
-            command=self.update_all_boat_controls_for_run_change,
-        ).pack(side=tk.LEFT, padx=10)
+        self._run_buttons = []
+        self._build_run_selector()
+
+        # How late START/STOP presses were handled (their times are not)
+        self.skew_label = ttk.Label(
+            run_select_frame, text="", font=("Arial", 8), foreground="gray"
+        )
+        self.skew_label.pack(side=tk.RIGHT, padx=5)
+
+        # Keyboard timing: boat number + Enter/Space starts or stops it, an
+        # empty field starts the next boat that has not started yet
+        hotkey_frame = ttk.LabelFrame(parent, text="⌨️ Hurtigtast", padding=10)
+        hotkey_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        ttk.Label(hotkey_frame, text="Båd nr.:", font=("Arial", 10, "bold")).pack(
+            side=tk.LEFT, padx=5
+        )
+        self.hotkey_var = tk.StringVar()
+        self.hotkey_entry = ttk.Entry(
+            hotkey_frame, textvariable=self.hotkey_var, width=10, font=("Arial", 12)
+        )
+        self.hotkey_entry.pack(side=tk.LEFT, padx=5)
+        for key in ("<Return>", "<KP_Enter>", "<space>"):
+            self.hotkey_entry.bind(key, self._on_hotkey)
+
+        ttk.Label(
+            hotkey_frame,
+            text="Enter/mellemrum: start eller stop båden · tomt felt: start næste båd",
+            font=("Arial", 8),
+            foreground="gray",
+        ).pack(side=tk.LEFT, padx=5)
+        self.hotkey_status_label = ttk.Label(
+            hotkey_frame, text="", font=("Arial", 10, "bold")
+        )
+        self.hotkey_status_label.pack(side=tk.RIGHT, padx=5)
+
+        # Mass and group starts: the ticked boats (or a saved heat) all
+        # start with the one timestamp of the button press
+        group_frame = ttk.LabelFrame(parent, text="🚦 Gruppestart", padding=10)
+        group_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        self.group_count_label = ttk.Label(
+            group_frame, text="0 både valgt", font=("Arial", 10, "bold"), width=14
+        )
+        self.group_count_label.pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            group_frame,
+            text="Vælg viste",
+            command=lambda: self.select_group(
+                self._group_selection.union(self._boat_order)
+            ),
+        ).pack(side=tk.LEFT, padx=2)
+        ttk.Button(
+            group_frame, text="Ryd valg", command=lambda: self.select_group(())
+        ).pack(side=tk.LEFT, padx=2)
+
+        ttk.Label(group_frame, text="Heat:").pack(side=tk.LEFT, padx=(15, 5))
+        self.heat_var = tk.StringVar()
+        self.heat_combo = ttk.Combobox(
+            group_frame,
+            textvariable=self.heat_var,
+            width=15,
+            postcommand=self._refresh_heat_choices,
+        )
+        self.heat_combo.pack(side=tk.LEFT, padx=2)
+        self.heat_combo.bind(
+            "<<ComboboxSelected>>", lambda event: self.select_heat(self.heat_var.get())
+        )
+        ttk.Button(group_frame, text="💾 Gem heat", command=self.save_heat).pack(
+            side=tk.LEFT, padx=2
+        )
+
+        group_row = {}
+        group_start_btn = tk.Button(
+            group_frame,
+            text="🚦 START GRUPPE",
+            command=lambda: self.start_group(at_ns=group_row.pop("start_pressed", None)),
+            font=("Arial", 10, "bold"),
+            bg="#4CAF50",
+            fg="white",
+            activebackground="#45a049",
+            activeforeground="white",
+            relief="raised",
+            bd=2,
+        )
+        group_start_btn.pack(side=tk.RIGHT, padx=5)
+        self._track_press(group_start_btn, group_row, "start_pressed")
 
         # Boat controls section
         self.boat_controls_frame = ttk.LabelFrame(
@@ -243,27 +888,58 @@ class RowingTimer:
         )
         self.boat_controls_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        # Scrollable frame for boat controls
-        self.boat_controls_canvas = tk.Canvas(self.boat_controls_frame)
+        self.timing_filter_var, self.timing_filter_label = self._create_filter_box(
+            self.boat_controls_frame, self.filter_boat_controls
+        )
+
+        # Column headers stay fixed above the scrolling rows
+        header_frame = ttk.Frame(self.boat_controls_frame)
+        header_frame.pack(side="top", fill=tk.X, padx=5, pady=(0, 2))
+
+        ttk.Label(header_frame, text="Båd", font=("Arial", 10, "bold"), width=8).grid(
+            row=0, column=0
+        )
+        ttk.Label(header_frame, text="Navn", font=("Arial", 10, "bold"), width=20).grid(
+            row=0, column=1
+        )
+        ttk.Label(
+            header_frame, text="Status", font=("Arial", 10, "bold"), width=18
+        ).grid(row=0, column=2)
+        ttk.Label(
+            header_frame, text="Nuværende Tid", font=("Arial", 10, "bold"), width=12
+        ).grid(row=0, column=3)
+        ttk.Label(
+            header_frame, text="Kontroller", font=("Arial", 10, "bold"), width=25
+        ).grid(row=0, column=4)
+
+        ttk.Separator(self.boat_controls_frame, orient=tk.HORIZONTAL).pack(
+            side="top", fill=tk.X, pady=2
+        )
+
+        # Virtualized list: only the visible rows (plus a small buffer) exist
+        # as widgets, placed on the canvas and recycled while scrolling
+        self.boat_controls_canvas = tk.Canvas(
+            self.boat_controls_frame,
+            highlightthickness=0,
+            yscrollincrement=BOAT_ROW_HEIGHT,
+        )
         self.boat_controls_scrollbar = ttk.Scrollbar(
             self.boat_controls_frame,
             orient="vertical",
             command=self.boat_controls_canvas.yview,
         )
-        self.boat_controls_inner_frame = ttk.Frame(self.boat_controls_canvas)
-
-        self.boat_controls_inner_frame.bind(
-            "<Configure>",
-            lambda e: self.boat_controls_canvas.configure(
-                scrollregion=self.boat_controls_canvas.bbox("all")
-            ),
+        self.boat_controls_canvas.configure(
+            yscrollcommand=self._on_boat_controls_scrolled
         )
+        self.boat_controls_canvas.bind("<Configure>", self._on_boat_canvas_resized)
 
-        self.boat_controls_canvas.create_window(
-            (0, 0), window=self.boat_controls_inner_frame, anchor="nw"
+        self.boat_controls_empty_label = ttk.Label(
+            self.boat_controls_canvas,
+            text="Ingen tilmeldte deltagere. Gå til Tilmeldinger for at tilføje både.",
+            font=("Arial", 10),
         )
-        self.boat_controls_canvas.configure(
-            yscrollcommand=self.boat_controls_scrollbar.set
+        self.boat_controls_empty_window = self.boat_controls_canvas.create_window(
+            (10, 20), window=self.boat_controls_empty_label, anchor="nw", state="hidden"
         )
 
         self.boat_controls_canvas.pack(side="left", fill="both", expand=True)
@@ -299,10 +975,57 @@ class RowingTimer:
         # Note: Using tk.Button instead of ttk.Button for reliable color control
         # ttk buttons can have theme conflicts with custom colors
 
-        # Store boat control widgets for targeted updates
-        self.boat_control_widgets = {}
+    def _create_filter_box(self, parent, apply_filter):
+        """Search field that filters a list live; returns (variable, count label)"""
+        filter_frame = ttk.Frame(parent)
+        filter_frame.pack(side="top", fill=tk.X, pady=(0, 5))
+
+        ttk.Label(filter_frame, text="🔍 Søg:").pack(side=tk.LEFT, padx=(5, 0))
+        variable = tk.StringVar()
+        variable.trace_add("write", lambda *args: apply_filter(variable.get()))
+        entry = ttk.Entry(filter_frame, textvariable=variable, width=30)
+        entry.pack(side=tk.LEFT, padx=5)
+        # Build the index when the field is clicked, not on the first key
+        entry.bind("<FocusIn>", lambda event: self.engine.prepare_search())
+        count_label = ttk.Label(filter_frame, text="", foreground="gray")
+        count_label.pack(side=tk.LEFT, padx=5)
+        return variable, count_label
+
+    def _show_filter_count(self, label, matches):
+        if matches is None:
+            label.config(text="")
+        else:
+            label.config(text=f"{len(matches)} af {len(self.participants)} både")
+
+    def filter_participants(self, query):
+        """Show only the registrations whose boat or name matches query.
+
+        Rows of other boats are detached from the tree, not deleted, so
+        clearing the filter puts them back without rebuilding anything.
+        """
+        self._participant_query = query
+        self._participant_filter = self.engine.find(query)
+        tree = self.participants_tree
+        if tree is None:
+            return
 
-        # Update displays
+        rows = self._participant_rows
+        matches = self._participant_filter
+        tree.set_children(
+            "",
+            *[
+                rows[boat][0]
+                for boat in self._sorted_boats()
+                if boat in rows and (matches is None or boat in matches)
+            ],
+        )
+        self._show_filter_count(self.participant_filter_label, matches)
+
+    def filter_boat_controls(self, query):
+        """Show only the Timing rows whose boat or name matches query"""
+        self._timing_query = query
+        if self.boat_controls_canvas is not None:
+            self.boat_controls_canvas.yview_moveto(0)
         self.update_boat_controls()
 
     def create_results_tab(self, parent):
@@ -313,28 +1036,8 @@ class RowingTimer:
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
         # Results treeview
-        columns = (
-            "Plads",
-            "Båd",
-            "Navn",
-            "Tur 1",
-            "Tur 2",
-            "Forskel",
-            "Konsistens Score",
-        )
-        self.results_tree = ttk.Treeview(
-            results_frame, columns=columns, show="headings", height=20
-        )
-
-        for col in columns:
-            self.results_tree.heading(
-                col, 
-                text=col,
-                command=lambda _col=col: self.treeview_sort_column(
-                    self.results_tree, _col, False
-                )
-            )
-            self.results_tree.column(col, width=100)
+        self.results_tree = ttk.Treeview(results_frame, show="headings", height=20)
+        self._configure_result_columns()
 
         # Scrollbar for results
         results_scrollbar = ttk.Scrollbar(
@@ -361,91 +1064,176 @@ class RowingTimer:
             results_button_frame, text="📄 Eksporter PDF", command=self.export_pdf
         ).pack(side=tk.LEFT, padx=5)
 
-    def treeview_sort_column(self, tv, col, reverse):
-        """Sort treeview content when header is clicked"""
-        l = [(tv.set(k, col), k) for k in tv.get_children('')]
+    def _run_columns(self):
+        return [f"Tur {run}" for run in range(1, self.engine.run_count + 1)]
 
-        def get_sort_key(val):
-            # Handle empty values
-            if val == "-" or val == "":
-                return float('inf')
-            
-            if col == "Plads":
-                try:
-                    return int(val)
-                except ValueError:
-                    return val
-            elif col == "Båd":
-                # Same logic as file sorting: (is_numeric, value)
-                # But here we want numeric first, so we use (0, int) for numbers and (1, str) for others
-                if val.isdigit():
-                    return (0, int(val))
-                else:
-                    return (1, val)
-            elif col in ("Forskel", "Konsistens Score"):
-                # Remove 's' if present
-                clean_val = val.replace('s', '').strip()
-                try:
-                    return float(clean_val)
-                except ValueError:
-                    return val
-            elif col in ("Tur 1", "Tur 2"):
-                # Times format MM:SS.mmm - alphanumeric sort works roughly okay
-                # but better to parse if possible, or just rely on the strict format
-                return val
-            else:
-                return val.lower()
+    def _configure_participant_columns(self):
+        columns = ("Båd", "Navn", *self._run_columns(), "Status")
+        self.participants_tree.configure(columns=columns)
+        for col in columns:
+            self.participants_tree.heading(col, text=col)
+            self.participants_tree.column(col, width=120)
 
-        try:
-            l.sort(key=lambda t: get_sort_key(t[0]), reverse=reverse)
-        except Exception as e:
-            print(f"Sort error: {e}")
-            # Fallback to string sort
-            l.sort(reverse=reverse)
+    def _configure_result_columns(self):
+        columns = (
+            "Plads",
+            "Båd",
+            "Navn",
+            *self._run_columns(),
+            "Forskel",
+            "Konsistens Score",
+        )
+        self.results_tree.configure(columns=columns)
+        self._result_columns = columns
+        self._result_sort = None
+        self._result_sort_orders.clear()
+        for col in columns:
+            self.results_tree.heading(
+                col, 
+                text=col,
+                command=lambda _col=col: self.treeview_sort_column(
+                    self.results_tree, _col, False
+                )
+            )
+            self.results_tree.column(col, width=100)
+
+    def _build_run_selector(self):
+        """One radio button per run in the event"""
+        for button in self._run_buttons:
+            button.destroy()
+
+        medals = ("🥇", "🥈", "🥉")
+        self._run_buttons = []
+        for run in range(1, self.engine.run_count + 1):
+            medal = medals[run - 1] if run <= len(medals) else "🏅"
+            button = ttk.Radiobutton(
+                self.run_select_frame,
+                text=f"{medal} Tur {run}",
+                variable=self.run_var,
+                value=str(run),
+                command=self.update_all_boat_controls_for_run_change,
+            )
+            button.pack(side=tk.LEFT, padx=10)
+            self._run_buttons.append(button)
+
+        if self.selected_run() > self.engine.run_count:
+            self.run_var.set("1")
+
+    def _apply_run_count(self):
+        """Rebuild the run-dependent parts of every built tab after a configure"""
+        if self.boat_controls_canvas is not None:
+            self._build_run_selector()
+            self.update_all_boat_controls_for_run_change()
+
+        if self.participants_tree is not None:
+            self._configure_participant_columns()
+            self._participant_rows_tree = None  # Force a full rebuild
+            self.update_participants_display()
+
+        if self.results_tree is not None:
+            self._configure_result_columns()
+            self.refresh_results()
 
-        for index, (val, k) in enumerate(l):
-            tv.move(k, '', index)
+    def treeview_sort_column(self, tv, col, reverse):
+        """Sort the Results rows when a header is clicked.
+
+        Rows are ordered by the typed values behind them, not by the cell
+        text. Each column's ascending order is kept until the results
+        change, so clicking the same header again only reverses it, and
+        the new order reaches Tk in a single set_children call.
+        """
+        order = self._result_sort_orders.get(col)
+        if order is None:
+            column = self._result_columns.index(col)
+            keyed = [
+                (self._result_sort_values(rank, boat)[column], self._result_rows[boat])
+                for rank, boat in enumerate(self.engine.leaderboard, 1)
+                if boat in self._result_rows
+            ]
+            # Stable, so ties stay in ranking order
+            keyed.sort(key=itemgetter(0))
+            order = self._result_sort_orders[col] = [item for _, item in keyed]
+
+        tv.set_children("", *(order[::-1] if reverse else order))
+        self._result_sort = (col, reverse)
 
         # Reverse sort next time
         tv.heading(col, command=lambda: self.treeview_sort_column(tv, col, not reverse))
 
+    def _result_sort_values(self, rank, boat):
+        """A Results row as typed values, in column order"""
+        participant = self.participants[boat]
+        times_ns = participant.times_ns
+        return (
+            rank,
+            natural_key(boat),
+            participant.name.casefold(),
+            *times_ns,
+            max(times_ns) - min(times_ns),
+            self.engine.leaderboard.score(boat),
+        )
+
+    def _keep_result_sort(self):
+        """After the Results rows changed, put a header sort back in place"""
+        self._result_sort_orders.clear()
+        if self._result_sort not in (None, ("Plads", False)):
+            self.treeview_sort_column(self.results_tree, *self._result_sort)
+
     def register_participant(self):
         boat_number = self.boat_number_var.get().strip()
         name = self.participant_name_var.get().strip()
 
-        if not boat_number or not name:
-            messagebox.showerror(
-                "Fejl", 
-                "Indtast venligst både båd nummer og deltager navn.",
-                parent=self.root
-            )
-            return
-
-        if boat_number in self.participants:
-            messagebox.showerror(
-                "Fejl", 
-                f"Båd {boat_number} er allerede tilmeldt.",
-                parent=self.root
-            )
+        try:
+            self.engine.register(boat_number, name)
+        except TimingError as e:
+            messagebox.showerror("Fejl", str(e), parent=self.root)
             return
 
-        # Add participant
-        self.participants[boat_number] = {
-            "name": name,
-            "run1_time": None,
-            "run2_time": None,
-            "run1_start": None,
-            "run2_start": None,
-        }
-
         # Clear form
         self.boat_number_var.set("")
         self.participant_name_var.set("")
 
-        # Update displays
-        self.update_participants_display()
-        self.update_boat_controls()
-        self.save_data()
+    def import_start_list(self, filename=None):
+        """Register every boat in a CSV/TSV start list in one go"""
+        if filename is None:
+            from tkinter import filedialog
+
+            filename = filedialog.askopenfilename(
+                filetypes=[
+                    ("Startliste", "*.csv *.tsv *.txt"),
+                    ("All files", "*.*"),
+                ],
+                title="Importer Startliste",
+            )
+            if not filename:  # User cancelled
+                return
+
+        try:
+            entries, problems = read_start_list(filename)
+            if not problems:
+                if not entries:
+                    problems = ["Filen indeholder ingen både."]
+                else:
+                    self.engine.register_many(entries)
+        except RegistrationError as e:
+            problems = e.problems
+        except (OSError, csv.Error) as e:
+            problems = [str(e)]
+
+        if problems:
+            shown = problems[:START_LIST_PROBLEMS_SHOWN]
+            if len(problems) > len(shown):
+                shown.append(f"... og {len(problems) - len(shown)} mere")
+            messagebox.showerror(
+                "Import Fejl",
+                "Ingen både blev importeret:\n\n" + "\n".join(shown),
+                parent=self.root,
+            )
+            return
+
+        messagebox.showinfo(
+            "Import Færdig", f"{len(entries)} både tilmeldt.", parent=self.root
+        )
 
     def remove_participant(self):
         selection = self.participants_tree.selection()
@@ -457,18 +1245,17 @@ class RowingTimer:
             )
             return
 
-        item = self.participants_tree.item(selection[0])
-        boat_number = str(item["values"][0])
+        boat_number = self._participant_row_boats.get(selection[0])
+        if boat_number is None:
+            item = self.participants_tree.item(selection[0])
+            boat_number = str(item["values"][0])
 
         if messagebox.askyesno(
             "Bekræft", 
             f"Fjern båd {boat_number}?",
             parent=self.root
         ):
-            del self.participants[boat_number]
-            self.update_participants_display()
-            self.update_boat_controls()
-            self.save_data()
+            self.engine.remove(boat_number)
 
     def clear_all_participants(self):
         if messagebox.askyesno(
@@ -477,11 +1264,7 @@ class RowingTimer:
             parent=self.root
         ):
             try:
-                self.participants.clear()
-                self.current_timers.clear()
-                self.update_participants_display()
-                self.update_boat_controls()
-                self.save_data()
+                self.engine.clear()
             except Exception as e:
                 messagebox.showerror(
                     "Fejl", 
@@ -489,109 +1272,259 @@ class RowingTimer:
                     parent=self.root
                 )
 
-    def start_timer(self, boat=None):
-        if boat is None:
-            boat = getattr(self, "_current_boat", None)
+    def _track_press(self, button, row, key):
+        """Keep row[key] at the time button was pressed, for its command"""
+        button.bind(
+            "<ButtonPress-1>", lambda event: self._note_press(row, key, event), add="+"
+        )
+        # Released off the button, a press runs no command; forget it after
+        # the release, so a later Space on the button is not backdated to it
+        button.bind(
+            "<ButtonRelease-1>",
+            lambda event: self.root.after_idle(row.pop, key, None),
+            add="+",
+        )
 
-        run = self.run_var.get()
+    def _note_press(self, row, key, event):
+        """Remember when a START/STOP button went down, on the engine clock.
 
-        if not boat:
-            messagebox.showerror("Fejl", "Ingen båd specificeret.", parent=self.root)
+        The command only runs on release, and maybe after a slow redraw, so
+        the press time is what the boat's time is measured from. Presses on
+        a disabled button run no command and are ignored.
+        """
+        if str(event.widget.cget("state")) == tk.DISABLED:
             return
+        row[key] = self.input_times.to_clock_ns(event.time)
+
+    def _on_hotkey(self, event):
+        """Enter/Space in the hotkey field: toggle the typed boat"""
+        at_ns = self.input_times.to_clock_ns(event.time)
+        self.toggle_boat(self.hotkey_var.get(), at_ns)
+        self.hotkey_var.set("")
+        return "break"  # Keep the space out of the field
+
+    def toggle_boat(self, boat, at_ns=None):
+        """Start or stop a boat in the selected run without any dialogs.
+
+        An empty boat starts the next boat that has not started yet. A
+        boat that already has a time is left alone; taking it again is
+        done with RESET and START in its row. Returns the message shown
+        next to the hotkey field.
+        """
+        boat = boat.strip()
+        run = self.selected_run()
+        if not boat:
+            boat = self._next_unstarted_boat()
+            if boat is None:
+                return self._show_hotkey_status(f"Alle både er startet i tur {run}.")
 
-        if boat not in self.participants:
-            messagebox.showerror("Fejl", "Valgte båd er ikke tilmeldt.", parent=self.root)
+        try:
+            if boat not in self.participants:
+                raise TimingError(f"Båd {boat} er ikke tilmeldt.")
+            if self.engine.is_running(boat, run):
+                elapsed_ns = self.engine.stop(boat, run, at_ns=at_ns)
+                message = f"Båd {boat} stoppet: {format_time_ns(elapsed_ns)}"
+            elif self.engine.has_time(boat, run):
+                raise TimingError(
+                    f"Båd {boat} har allerede en tid i tur {run} - brug RESET først."
+                )
+            else:
+                self.engine.start(boat, run, at_ns=at_ns)
+                message = f"Båd {boat} startet"
+        except TimingError as e:
+            message = str(e)
+        else:
+            self._scroll_to_boat(boat)
+
+        upcoming = self._next_unstarted_boat()
+        if upcoming is not None:
+            message += f" · næste: Båd {upcoming}"
+        return self._show_hotkey_status(message)
+
+    def _show_hotkey_status(self, message):
+        status_label = getattr(self, "hotkey_status_label", None)
+        if status_label is not None:
+            status_label.config(text=message)
+        return message
+
+    def _next_unstarted_boat(self):
+        """First boat in display order without a start in the selected run.
+
+        The position is remembered, so a whole start sequence walks the
+        list once; resets and reordering move it back.
+        """
+        run = self.selected_run()
+        order = self._boat_order
+        index = self._next_start_index
+        while index < len(order) and (
+            self.engine.is_running(order[index], run)
+            or self.engine.has_time(order[index], run)
+        ):
+            index += 1
+        self._next_start_index = index
+        return order[index] if index < len(order) else None
+
+    def _scroll_to_boat(self, boat):
+        """Scroll the boat's row into view if it is off screen"""
+        index = self._boat_row_index.get(boat)
+        if index is None or self.boat_controls_canvas is None:
             return
-
-        timer_key = f"{boat}_run{run}"
-
-        if timer_key in self.current_timers:
-            messagebox.showwarning(
-                "Advarsel", 
-                f"Timer for Båd {boat} Tur {run} kører allerede.",
-                parent=self.root
-            )
+        canvas = self.boat_controls_canvas
+        top = canvas.canvasy(0)
+        row_top = index * BOAT_ROW_HEIGHT
+        if top <= row_top and row_top + BOAT_ROW_HEIGHT <= top + canvas.winfo_height():
             return
+        canvas.yview_moveto(index / len(self._boat_order))
 
-        # Check if this run already has a time
-        run_key = f"run{run}_time"
-        if self.participants[boat][run_key] is not None:
-            if not messagebox.askyesno(
-                "Bekræft",
-                f"Båd {boat} Tur {run} har allerede en tid. Start ny tidtagning?",
-                parent=self.root
-            ):
-                return
+    def _toggle_group_boat(self, row):
+        """Tick box of a row: add its boat to or drop it from the group"""
+        if row["selected_var"].get():
+            self._group_selection.add(row["boat"])
+        else:
+            self._group_selection.discard(row["boat"])
+        self._show_group_count()
+
+    def select_group(self, boats):
+        """Make the registered boats among boats the group to start"""
+        self._group_selection = {boat for boat in boats if boat in self.participants}
+        for row in self.boat_control_widgets.values():
+            row["selected_var"].set(row["boat"] in self._group_selection)
+        self._show_group_count()
+
+    def _show_group_count(self):
+        count_label = getattr(self, "group_count_label", None)
+        if count_label is not None:
+            count_label.config(text=f"{len(self._group_selection)} både valgt")
+
+    def _refresh_heat_choices(self):
+        self.heat_combo.configure(values=sorted(self.event_info.get("heats", {})))
+
+    def save_heat(self, name=None):
+        """Save the ticked boats as a heat that can be selected again later"""
+        if name is None:
+            name = self.heat_var.get()
+        name = name.strip()
+        if not name:
+            self.show_toast("Skriv et navn på heatet først.", "warning")
+            return
+        if not self._group_selection:
+            self.show_toast("Vælg bådene i heatet først.", "warning")
+            return
 
-        # Start timer
-        start_time = time.time()
-        self.current_timers[timer_key] = {
-            "start_time": start_time,
-            "boat": boat,
-            "run": run,
-        }
+        # A new dict, so a snapshot being written never sees it change
+        heats = dict(self.event_info.get("heats", {}))
+        heats[name] = [
+            boat for boat in self._sorted_boats() if boat in self._group_selection
+        ]
+        self.event_info["heats"] = heats
+        self.save_data()
+        self.show_toast(f"Heat \"{name}\" gemt med {len(heats[name])} både.")
+
+    def select_heat(self, name):
+        """Tick the boats of a saved heat"""
+        boats = self.event_info.get("heats", {}).get(name)
+        if boats is not None:
+            self.select_group(boats)
+
+    def start_group(self, boats=None, at_ns=None):
+        """Start the ticked boats (or boats) in the selected run together.
+
+        Every boat gets the same start timestamp: at_ns, the time of the
+        button press, or now when there is none. The engine starts all of
+        them or none; the journal gets one write and the views one refresh
+        for the whole group. Returns the shared start in engine clock
+        nanoseconds, or None when refused.
+        """
+        if boats is None:
+            boats = [
+                boat for boat in self._sorted_boats() if boat in self._group_selection
+            ]
+        boats = list(dict.fromkeys(boats))
 
-        # Update participant data
-        self.participants[boat][f"run{run}_start"] = start_time
-        self.participants[boat][f"run{run}_time"] = None
+        run = self.selected_run()
 
-        self.update_participants_display()
-        self.update_single_boat_controls(boat)
+        # Starting again discards times; the group start can be undone
+        befores = [
+            (boat, run, self.engine.run_state(boat, run))
+            for boat in boats
+            if boat in self.participants and not self.engine.is_running(boat, run)
+        ]
 
-        # Start update loop if this is the first timer
-        if len(self.current_timers) == 1:
-            self.update_running_timers()
+        try:
+            start_ns = self.engine.start_many(boats, run, at_ns=at_ns)
+        except GroupStartError as e:
+            shown = e.problems[:GROUP_START_PROBLEMS_SHOWN]
+            message = "Gruppestart afvist: " + " ".join(shown)
+            if len(e.problems) > len(shown):
+                message += f" (+{len(e.problems) - len(shown)} flere)"
+            self.show_toast(message, "error")
+            return None
+        except TimingError as e:
+            self._show_timing_error(e)
+            return None
+
+        self.select_group(())
+        discarded = sum(1 for _, _, before in befores if before["time_ns"] is not None)
+        message = f"Gruppestart: {len(befores)} både startet i Tur {run}."
+        if discarded:
+            self._push_undo(f"{message} {discarded} tider er kasseret.", befores)
+        else:
+            self.show_toast(message)
+        return start_ns
 
-    def stop_timer(self, boat=None):
+    def start_timer(self, boat=None, at_ns=None):
         if boat is None:
             boat = getattr(self, "_current_boat", None)
 
-        run = self.run_var.get()
-
-        if not boat:
-            messagebox.showerror("Fejl", "Ingen båd specificeret.", parent=self.root)
-            return
+        run = self.selected_run()
 
-        timer_key = f"{boat}_run{run}"
+        # Starting again discards the run's time; that can be undone
+        before = None
+        if (
+            boat in self.participants
+            and not self.engine.is_running(boat, run)
+            and self.engine.has_time(boat, run)
+        ):
+            before = self.engine.run_state(boat, run)
 
-        if timer_key not in self.current_timers:
-            messagebox.showwarning(
-                "Advarsel", 
-                f"Ingen aktiv timer for Båd {boat} Tur {run}.",
-                parent=self.root
-            )
+        try:
+            self.engine.start(boat, run, at_ns=at_ns)
+        except TimingError as e:
+            self._show_timing_error(e)
             return
 
-        # Stop timer
-        end_time = time.time()
-        start_time = self.current_timers[timer_key]["start_time"]
-        elapsed_time = end_time - start_time
+        if before is not None:
+            self._push_undo(
+                f"Båd {boat} Tur {run} startet igen - "
+                f"tiden {format_time_ns(before['time_ns'])} er kasseret.",
+                [(boat, run, before)],
+            )
 
-        # Save time
-        self.participants[boat][f"run{run}_time"] = elapsed_time
+    def stop_timer(self, boat=None, at_ns=None):
+        if boat is None:
+            boat = getattr(self, "_current_boat", None)
 
-        # Remove from active timers
-        del self.current_timers[timer_key]
+        run = self.selected_run()
 
-        self.update_participants_display()
-        self.update_single_boat_controls(boat)
-        self.save_data()
+        try:
+            self.engine.stop(boat, run, at_ns=at_ns)
+        except TimingError as e:
+            self._show_timing_error(e)
 
-    def start_timer_with_feedback(self, boat):
+    def start_timer_with_feedback(self, boat, at_ns=None):
         """Start timer with visual feedback"""
-        self.start_timer(boat)
+        self.start_timer(boat, at_ns)
 
-    def stop_timer_with_feedback(self, boat):
+    def stop_timer_with_feedback(self, boat, at_ns=None):
         """Stop timer with visual feedback instead of popup"""
-        run = self.run_var.get()
-        timer_key = f"{boat}_run{run}"
+        run = self.selected_run()
 
-        if timer_key in self.current_timers:
+        if self.engine.is_running(boat, run):
             # Get the elapsed time before stopping
-            elapsed_time = time.time() - self.current_timers[timer_key]["start_time"]
+            elapsed_time = self.engine.elapsed_ns(boat, run, at_ns) / 1e9
 
             # Stop the timer
-            self.stop_timer(boat)
+            self.stop_timer(boat, at_ns)
 
             # Flash the status for visual feedback
             self.flash_completion_status(boat, run, elapsed_time)
@@ -606,148 +1539,305 @@ class RowingTimer:
         if boat is None:
             boat = getattr(self, "_current_boat", None)
 
-        run = self.run_var.get()
+        run = self.selected_run()
 
-        if not boat:
-            messagebox.showerror("Fejl", "Ingen båd specificeret.", parent=self.root)
+        try:
+            if not boat:
+                raise TimingError("Ingen båd specificeret.")
+            before = self.engine.run_state(boat, run)
+            self.engine.reset(boat, run)
+        except TimingError as e:
+            self._show_timing_error(e)
             return
 
-        timer_key = f"{boat}_run{run}"
-
-        if timer_key in self.current_timers:
-            if messagebox.askyesno(
-                "Bekræft", 
-                f"Nulstil aktiv timer for Båd {boat} Tur {run}?",
-                parent=self.root
-            ):
-                del self.current_timers[timer_key]
-                self.participants[boat][f"run{run}_time"] = None
-                self.participants[boat][f"run{run}_start"] = None
-                self.update_participants_display()
-                self.update_single_boat_controls(boat)
+        if before["running_ns"] is not None:
+            message = f"Aktiv timer for Båd {boat} Tur {run} er nulstillet."
         else:
-            if messagebox.askyesno(
-                "Bekræft", 
-                f"Ryd gemt tid for Båd {boat} Tur {run}?",
-                parent=self.root
-            ):
-                self.participants[boat][f"run{run}_time"] = None
-                self.participants[boat][f"run{run}_start"] = None
-                self.update_participants_display()
-                self.update_single_boat_controls(boat)
+            message = f"Tiden for Båd {boat} Tur {run} er ryddet."
+        self._push_undo(message, [(boat, run, before)])
+
+    def selected_run(self):
+        """Run number chosen on the Tidtagning tab, as an int"""
+        return int(self.run_var.get())
+
+    def _on_tab_changed(self, event=None):
+        try:
+            self._build_tab(self.notebook.select())
+        except tk.TclError:
+            pass
+
+        # Running timers are paused while the Timing tab is hidden
+        if self._timing_tab_visible():
+            self._schedule_timer_tick()
+            # Ready for boat numbers without a click first
+            if getattr(self, "hotkey_entry", None) is not None:
+                self.hotkey_entry.focus_set()
+
+    def _timing_tab_visible(self):
+        try:
+            return self.notebook.select() == str(self.timing_frame)
+        except (AttributeError, tk.TclError):
+            return True
+
+    def _schedule_timer_tick(self, restart=False):
+        """Make sure exactly one running-timer tick is pending.
+
+        With restart the pending tick is replaced by an immediate one, e.g.
+        when a running boat scrolls into view during a slow idle tick.
+        """
+        if self._timer_tick_id is not None:
+            if not restart:
+                return
+            self.root.after_cancel(self._timer_tick_id)
+            self._timer_tick_id = None
+        if self.current_timers:
+            self.update_running_timers()
 
     def update_running_timers(self):
         """Update the time display for all running timers"""
-        run = self.run_var.get()
-        
-        for timer_key, timer_data in self.current_timers.items():
-            boat = timer_data["boat"]
-            # Only update if the timer belongs to the current run view
-            if timer_data["run"] == run and boat in self.boat_control_widgets:
-                elapsed = time.time() - timer_data["start_time"]
-                time_str = self.format_time(elapsed)
-                
-                # Update the label in the boat control row
-                self.boat_control_widgets[boat]["time_label"].config(
-                    text=time_str, foreground="red"
-                )
+        self._timer_tick_id = None
+        if not self.current_timers or not self._timing_tab_visible():
+            # Nothing to show - _schedule_timer_tick resumes the loop
+            return
 
-        if self.current_timers:
-            self.root.after(50, self.update_running_timers)
+        # One clock read per tick for every timer
+        now_ns = self.engine.clock.now_ns()
+        run = self.selected_run()
+        visible_running = 0
+
+        for (boat, timer_run), start_ns in self.current_timers.items():
+            # Only update if the timer belongs to the current run view and
+            # its row is on screen
+            if timer_run != run:
+                continue
+            widgets = self.boat_control_widgets.get(boat)
+            if widgets is None:
+                continue
+
+            visible_running += 1
+            # A start stamped a moment ahead never shows a negative time
+            tenths = max(now_ns - start_ns, 0) // NS_PER_TENTH
+
+            # Skip formatting and the Tk call while the tenths are unchanged
+            if widgets.get("shown_tenths") != tenths:
+                time_str = format_running_tenths(tenths)
+                widgets["time_label"].config(text=time_str, foreground="red")
+                widgets["shown_tenths"] = tenths
+
+        delay = TIMER_TICK_MS if visible_running else TIMER_IDLE_TICK_MS
+        self._timer_tick_id = self.root.after(delay, self.update_running_timers)
+
+    def _sorted_boats(self):
+        """Boat numbers in display order, from the engine's sorted index"""
+        return self.engine.sorted_boats()
+
+    def _participant_row_values(self, boat_number, participant):
+        times_ns = participant.times_ns
+        run_displays = [format_time_ns(ns) for ns in times_ns]
+
+        # Determine status
+        status = "Tilmeldt"
+        if all(times_ns):
+            status = "Færdig"
+        elif any(times_ns):
+            status = "Delvis"
+
+        return (boat_number, participant.name, *run_displays, status)
+
+    def update_participants_display(self, boats=None):
+        """Refresh the participants list, touching only rows that changed.
+
+        With boats given only those rows are recomputed (timer clicks);
+        without it all rows are diffed and registrations/removals applied.
+        """
+        tree = self.participants_tree
+        rows = self._participant_rows
+        if tree is None:
+            # Tab not built yet - it is filled when first shown
+            return
 
-    def update_participants_display(self):
-        # Clear existing items
-        for item in self.participants_tree.get_children():
-            self.participants_tree.delete(item)
+        if self._participant_rows_tree is not tree:
+            # New tree widget - start again from an empty list
+            for item in tree.get_children():
+                tree.delete(item)
+            rows.clear()
+            self._participant_row_boats.clear()
+            self._participant_rows_tree = tree
 
-        # Add participants
-        for boat_number, data in sorted(
-            self.participants.items(),
-            key=lambda item: (int(item[0]) if item[0].isdigit() else float('inf'), item[0])
+        if boats is not None and all(
+            boat in rows and boat in self.participants for boat in boats
         ):
-            run1_display = (
-                self.format_time(data["run1_time"]) if data["run1_time"] else "-"
-            )
-            run2_display = (
-                self.format_time(data["run2_time"]) if data["run2_time"] else "-"
-            )
+            for boat in boats:
+                self._refresh_participant_row(boat)
+            return
 
-            # Determine status
-            status = "Tilmeldt"
-            if data["run1_time"] and data["run2_time"]:
-                status = "Færdig"
-            elif data["run1_time"] or data["run2_time"]:
-                status = "Delvis"
-
-            self.participants_tree.insert(
-                "",
-                tk.END,
-                values=(boat_number, data["name"], run1_display, run2_display, status),
-            )
+        # Drop rows for boats that are no longer registered
+        for boat in [boat for boat in rows if boat not in self.participants]:
+            item_id, _ = rows.pop(boat)
+            self._participant_row_boats.pop(item_id, None)
+            tree.delete(item_id)
 
-    def update_boat_controls(self):
-        # Clear existing controls and widget references
-        for widget in self.boat_controls_inner_frame.winfo_children():
-            widget.destroy()
-        self.boat_control_widgets = {}
+        # Insert new boats at their sorted position, update changed rows
+        for index, boat in enumerate(self._sorted_boats()):
+            if boat in rows:
+                self._refresh_participant_row(boat)
+            else:
+                values = self._participant_row_values(boat, self.participants[boat])
+                item_id = tree.insert("", index, values=values)
+                rows[boat] = (item_id, values)
+                self._participant_row_boats[item_id] = boat
+
+        if self._participant_filter is not None:
+            # New and removed boats may change what matches
+            self.filter_participants(self._participant_query)
+
+    def _refresh_participant_row(self, boat):
+        """Push new values to a single row if they differ from what is shown"""
+        item_id, shown = self._participant_rows[boat]
+        values = self._participant_row_values(boat, self.participants[boat])
+        if values != shown:
+            self.participants_tree.item(item_id, values=values)
+            self._participant_rows[boat] = (item_id, values)
 
-        if not self.participants:
-            ttk.Label(
-                self.boat_controls_inner_frame,
-                text="Ingen tilmeldte deltagere. Gå til Tilmeldinger for at tilføje både.",
-                font=("Arial", 10),
-            ).pack(pady=20)
+    def update_boat_controls(self):
+        """Recompute the boat order and re-render the visible rows.
+
+        Row widgets are recycled, never destroyed, so registrations only
+        change which boat each pooled row shows.
+        """
+        canvas = self.boat_controls_canvas
+        if canvas is None:
+            # Tab not built yet - it is filled when first shown
             return
 
-        # Get current run
-        run = self.run_var.get()
-
-        # Header
-        header_frame = ttk.Frame(self.boat_controls_inner_frame)
-        header_frame.pack(fill=tk.X, pady=5)
-
-        ttk.Label(header_frame, text="Båd", font=("Arial", 10, "bold"), width=8).grid(
-            row=0, column=0
+        order = self._sorted_boats()
+        self._timing_filter = self.engine.find(self._timing_query)
+        if self._timing_filter is not None:
+            order = [boat for boat in order if boat in self._timing_filter]
+        self._show_filter_count(self.timing_filter_label, self._timing_filter)
+        self._boat_order = order
+        self._boat_row_index = {
+            boat: index for index, boat in enumerate(self._boat_order)
+        }
+        self._next_start_index = 0
+
+        if not self._boat_order:
+            self.boat_controls_empty_label.config(
+                text=(
+                    f"Ingen både matcher \"{self._timing_query.strip()}\"."
+                    if self.participants
+                    else "Ingen tilmeldte deltagere. "
+                    "Gå til Tilmeldinger for at tilføje både."
+                )
+            )
+        canvas.itemconfigure(
+            self.boat_controls_empty_window,
+            state="hidden" if self._boat_order else "normal",
         )
-        ttk.Label(header_frame, text="Navn", font=("Arial", 10, "bold"), width=20).grid(
-            row=0, column=1
+        canvas.configure(
+            scrollregion=(
+                0, 0, canvas.winfo_width(), len(self._boat_order) * BOAT_ROW_HEIGHT
+            )
         )
-        ttk.Label(
-            header_frame, text="Status", font=("Arial", 10, "bold"), width=18
-        ).grid(row=0, column=2)
-        ttk.Label(
-            header_frame, text="Nuværende Tid", font=("Arial", 10, "bold"), width=12
-        ).grid(row=0, column=3)
-        ttk.Label(
-            header_frame, text="Kontroller", font=("Arial", 10, "bold"), width=25
-        ).grid(row=0, column=4)
 
-        # Separator
-        ttk.Separator(self.boat_controls_inner_frame, orient=tk.HORIZONTAL).pack(
-            fill=tk.X, pady=2
+        # Force every row to re-bind so renamed/removed boats are refreshed
+        for row in self._boat_row_pool:
+            row["boat"] = None
+        self._render_visible_boat_rows()
+
+    def _on_boat_controls_scrolled(self, first, last):
+        """Canvas yscrollcommand: move the scrollbar and re-render the rows"""
+        self.boat_controls_scrollbar.set(first, last)
+        self._schedule_boat_render()
+
+    def _on_boat_canvas_resized(self, event):
+        for row in self._boat_row_pool:
+            self.boat_controls_canvas.itemconfigure(row["window"], width=event.width)
+        self._schedule_boat_render()
+
+    def _schedule_boat_render(self):
+        # Coalesce bursts of scroll events into one render per idle cycle
+        if not self._boat_render_pending:
+            self._boat_render_pending = True
+            self.root.after_idle(self._render_visible_boat_rows)
+
+    def _visible_boat_range(self):
+        """Index range of the boats that should currently have widgets"""
+        canvas = self.boat_controls_canvas
+        top = canvas.canvasy(0)
+        height = max(canvas.winfo_height(), BOAT_ROW_HEIGHT)
+        first = max(int(top // BOAT_ROW_HEIGHT) - BOAT_ROW_BUFFER, 0)
+        last = min(
+            int((top + height) // BOAT_ROW_HEIGHT) + 1 + BOAT_ROW_BUFFER,
+            len(self._boat_order),
         )
+        return first, last
+
+    def _render_visible_boat_rows(self):
+        """Bind pooled row widgets to the boats in the visible range"""
+        self._boat_render_pending = False
+        first, last = self._visible_boat_range()
+        visible = self._boat_order[first:last]
+        wanted = set(visible)
+        run = self.selected_run()
+
+        # Rows still showing a visible boat stay as they are
+        bound = {}
+        free_rows = []
+        for row in self._boat_row_pool:
+            if row["boat"] in wanted and row["boat"] not in bound:
+                bound[row["boat"]] = row
+            else:
+                free_rows.append(row)
 
-        # Create controls for each boat
-        for i, (boat, data) in enumerate(sorted(
-            self.participants.items(),
-            key=lambda item: (int(item[0]) if item[0].isdigit() else float('inf'), item[0])
-        )):
-            self._create_boat_control_row(boat, data, run)
+        for boat in visible:
+            if boat in bound:
+                continue
+            if free_rows:
+                row = free_rows.pop()
+            else:
+                row = self._create_boat_control_row(boat, self.participants[boat], run)
+            self._bind_boat_control_row(row, boat, run)
+            bound[boat] = row
+
+        # Park rows that are not needed right now
+        for row in free_rows:
+            row["boat"] = None
+            self.boat_controls_canvas.itemconfigure(row["window"], state="hidden")
+
+        self.boat_control_widgets = bound
+
+        # Show running times on rows that just scrolled into view
+        if self.current_timers:
+            self._schedule_timer_tick(restart=True)
+
+    def _bind_boat_control_row(self, row, boat, run):
+        """Point a pooled row at a boat and move it to that boat's position"""
+        row["boat"] = boat
+        # A press noted for the row's previous boat must not time this one
+        row.pop("start_pressed", None)
+        row.pop("stop_pressed", None)
+        row["boat_label"].config(text=boat)
+        row["name_label"].config(text=self.participants[boat].name)
+        self.boat_controls_canvas.coords(
+            row["window"], 0, self._boat_row_index[boat] * BOAT_ROW_HEIGHT
+        )
+        self.boat_controls_canvas.itemconfigure(row["window"], state="normal")
+        row["selected_var"].set(boat in self._group_selection)
+        self.boat_control_widgets[boat] = row
+        self._update_boat_row(boat, run)
 
-    def _create_boat_control_row(self, boat, data, run):
+    def _create_boat_control_row(self, boat, participant, run):
         """Create a single boat control row and store widget references"""
-        boat_frame = ttk.Frame(self.boat_controls_inner_frame)
-        boat_frame.pack(fill=tk.X, pady=2, padx=5)
+        boat_frame = ttk.Frame(self.boat_controls_canvas)
 
         # Boat number
-        ttk.Label(boat_frame, text=boat, font=("Arial", 10, "bold"), width=8).grid(
-            row=0, column=0, sticky=tk.W
-        )
+        boat_label = ttk.Label(boat_frame, text=boat, font=("Arial", 10, "bold"), width=8)
+        boat_label.grid(row=0, column=0, sticky=tk.W, padx=(5, 0))
 
         # Participant name
-        ttk.Label(boat_frame, text=data["name"], width=20).grid(
-            row=0, column=1, sticky=tk.W
-        )
+        name_label = ttk.Label(boat_frame, text=participant.name, width=20)
+        name_label.grid(row=0, column=1, sticky=tk.W)
 
         # Status label
         status_label = ttk.Label(boat_frame, width=18)
@@ -761,35 +1851,53 @@ class RowingTimer:
         button_frame = ttk.Frame(boat_frame)
         button_frame.grid(row=0, column=4, sticky=tk.W)
 
+        # The row is recycled between boats, so the buttons look up the
+        # boat it currently shows when clicked
+        row = {}
+
+        # Tick box for the next group start
+        selected_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            button_frame,
+            variable=selected_var,
+            command=lambda r=row: self._toggle_group_boat(r),
+        ).pack(side=tk.LEFT, padx=2)
+
         # Start button
         start_btn = tk.Button(
             button_frame,
             text="START",
-            command=lambda b=boat: self.start_timer_with_feedback(b),
+            command=lambda r=row: self.start_timer_with_feedback(
+                r["boat"], r.pop("start_pressed", None)
+            ),
             font=("Arial", 9, "bold"),
             width=8,
             relief="raised",
             bd=2,
         )
         start_btn.pack(side=tk.LEFT, padx=2)
+        self._track_press(start_btn, row, "start_pressed")
 
         # Stop button
         stop_btn = tk.Button(
             button_frame,
             text="STOP",
-            command=lambda b=boat: self.stop_timer_with_feedback(b),
+            command=lambda r=row: self.stop_timer_with_feedback(
+                r["boat"], r.pop("stop_pressed", None)
+            ),
             font=("Arial", 9, "bold"),
             width=8,
             relief="raised",
             bd=2,
         )
         stop_btn.pack(side=tk.LEFT, padx=2)
+        self._track_press(stop_btn, row, "stop_pressed")
 
         # Reset button
         reset_btn = tk.Button(
             button_frame,
             text="RESET",
-            command=lambda b=boat: self.reset_timer(b),
+            command=lambda r=row: self.reset_timer(r["boat"]),
             font=("Arial", 9, "bold"),
             width=8,
             relief="raised",
@@ -797,17 +1905,32 @@ class RowingTimer:
         )
         reset_btn.pack(side=tk.LEFT, padx=2)
 
-        # Store widget references for targeted updates
-        self.boat_control_widgets[boat] = {
-            "status_label": status_label,
-            "time_label": time_label,
-            "start_btn": start_btn,
-            "stop_btn": stop_btn,
-            "reset_btn": reset_btn,
-        }
+        window = self.boat_controls_canvas.create_window(
+            (0, 0),
+            window=boat_frame,
+            anchor="nw",
+            width=self.boat_controls_canvas.winfo_width(),
+            height=BOAT_ROW_HEIGHT,
+        )
 
-        # Update this boat's display
-        self._update_boat_row(boat, run)
+        # Store widget references for targeted updates
+        row.update(
+            {
+                "boat": boat,
+                "frame": boat_frame,
+                "window": window,
+                "boat_label": boat_label,
+                "name_label": name_label,
+                "status_label": status_label,
+                "time_label": time_label,
+                "start_btn": start_btn,
+                "stop_btn": stop_btn,
+                "reset_btn": reset_btn,
+                "selected_var": selected_var,
+            }
+        )
+        self._boat_row_pool.append(row)
+        return row
 
     def _update_boat_row(self, boat, run):
         """Update a single boat's row without rebuilding the entire interface"""
@@ -815,22 +1938,29 @@ class RowingTimer:
             return
 
         widgets = self.boat_control_widgets[boat]
-        data = self.participants.get(boat, {})
-        timer_key = f"{boat}_run{run}"
-        run_key = f"run{run}_time"
+        participant = self.participants.get(boat)
+        running = self.engine.is_running(boat, run)
+        run_time = participant.time_ns(run) if participant else None
+
+        # Recycled rows often show this state already, e.g. "Klar" while
+        # filtering; running rows always refresh their ticking time
+        shown_state = None if running else (run, run_time)
+        if shown_state is not None and widgets.get("shown_state") == shown_state:
+            return
+        widgets["shown_state"] = shown_state
 
         # Update status and time display
-        if timer_key in self.current_timers:
+        if running:
             status_text = f"🏃 KØRER Tur {run}"
             status_color = "red"
             status_font = ("Arial", 9, "bold")
             current_time = "TIDTAGER..."
             time_color = "red"
-        elif data.get(run_key) is not None:
-            status_text = f"✓ Tur {run}: {self.format_time(data[run_key])}"
+        elif run_time is not None:
+            current_time = format_time_ns(run_time)
+            status_text = f"✓ Tur {run}: {current_time}"
             status_color = "green"
             status_font = ("Arial", 9, "bold")
-            current_time = self.format_time(data[run_key])
             time_color = "green"
         else:
             status_text = f"🏁 Tur {run} Klar"
@@ -844,9 +1974,10 @@ class RowingTimer:
             text=status_text, foreground=status_color, font=status_font
         )
         widgets["time_label"].config(text=current_time, foreground=time_color)
+        widgets["shown_tenths"] = None
 
         # Update button states and colors
-        if timer_key in self.current_timers:
+        if running:
             # Timer is running
             widgets["start_btn"].config(state="disabled", bg="#cccccc", fg="#666666")
             widgets["stop_btn"].config(
@@ -875,7 +2006,7 @@ class RowingTimer:
             widgets["stop_btn"].config(state="disabled", bg="#cccccc", fg="#666666")
 
             # Reset enabled only if there's a time to reset
-            if data.get(run_key) is not None:
+            if run_time is not None:
                 widgets["reset_btn"].config(
                     state="normal",
                     bg="#e0e0e0",
@@ -894,11 +2025,17 @@ class RowingTimer:
             not hasattr(self, "boat_control_widgets")
             or boat not in self.boat_control_widgets
         ):
+            # Boats scrolled out of view are rendered when they come back,
+            # boats hidden by the filter when it is cleared
+            if boat in getattr(self, "_boat_row_index", {}) or (
+                self._timing_filter is not None and boat in self.participants
+            ):
+                return
             # Fallback to full update if widgets don't exist
             self.update_boat_controls()
             return
 
-        run = self.run_var.get()
+        run = self.selected_run()
         self._update_boat_row(boat, run)
 
     def update_all_boat_controls_for_run_change(self):
@@ -908,52 +2045,81 @@ class RowingTimer:
             self.update_boat_controls()
             return
 
-        run = self.run_var.get()
+        run = self.selected_run()
+        self._next_start_index = 0
         for boat in self.boat_control_widgets.keys():
             self._update_boat_row(boat, run)
 
-    def calculate_results(self):
+    def _result_row_values(self, rank, result):
+        return (
+            rank,
+            result["boat"],
+            result["name"],
+            *[self.format_time(t) for t in result["times"]],
+            self.format_time(result["difference"]),
+            f"{result['score']:.3f}s",
+        )
+
+    def refresh_results(self, results=None):
+        """Rebuild the Results tab from the engine's leaderboard"""
+        if self.results_tree is None:
+            return
+        if results is None:
+            results = self.engine.results()
+
         # Clear existing results
         for item in self.results_tree.get_children():
             self.results_tree.delete(item)
-
-        # Calculate results for participants with both runs
-        results = []
-
-        for boat, data in self.participants.items():
-            if data["run1_time"] and data["run2_time"]:
-                run1_time = data["run1_time"]
-                run2_time = data["run2_time"]
-                difference = abs(run1_time - run2_time)
-
-                results.append(
-                    {
-                        "boat": boat,
-                        "name": data["name"],
-                        "run1_time": run1_time,
-                        "run2_time": run2_time,
-                        "difference": difference,
-                    }
-                )
-
-        # Sort by consistency (smallest difference wins)
-        results.sort(key=lambda x: x["difference"])
+        self._result_rows = {}
 
         # Display results
         for rank, result in enumerate(results, 1):
-            self.results_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    rank,
-                    result["boat"],
-                    result["name"],
-                    self.format_time(result["run1_time"]),
-                    self.format_time(result["run2_time"]),
-                    self.format_time(result["difference"]),
-                    f"{result['difference']:.3f}s",
-                ),
+            self._result_rows[result["boat"]] = self.results_tree.insert(
+                "", tk.END, values=self._result_row_values(rank, result)
             )
+        self._keep_result_sort()
+
+    def _update_result_rank(self, boat, old_index, new_index):
+        """Apply one leaderboard move to the Results tab.
+
+        Only the moved row is rewritten; the rows it passed get a new
+        Plads number but keep their place in the tree.
+        """
+        tree = self.results_tree
+        if tree is None:
+            return
+        item_id = self._result_rows.get(boat)
+
+        if new_index is None:
+            if item_id is not None:
+                tree.delete(self._result_rows.pop(boat))
+        else:
+            values = self._result_row_values(new_index + 1, self.engine.result(boat))
+            if item_id is None:
+                self._result_rows[boat] = tree.insert("", new_index, values=values)
+            else:
+                tree.move(item_id, "", new_index)
+                tree.item(item_id, values=values)
+
+        # Renumber the rows between the old and the new position; a boat
+        # entering or leaving the board shifts everything below it
+        leaderboard = self.engine.leaderboard
+        if old_index is None or new_index is None:
+            first = old_index if new_index is None else new_index + 1
+            last = len(leaderboard)
+        else:
+            first, last = sorted((old_index, new_index))
+            last += 1
+        for index in range(first, last):
+            other = leaderboard.boat_at(index)
+            if other != boat and other in self._result_rows:
+                tree.set(self._result_rows[other], "Plads", index + 1)
+        self._keep_result_sort()
+
+    def calculate_results(self):
+        # Recalculate results for participants with both runs
+        results = self.engine.calculate_results()
+        self.refresh_results(results)
 
         if results:
             messagebox.showinfo(
@@ -964,13 +2130,13 @@ class RowingTimer:
         else:
             messagebox.showwarning(
                 "Ingen Resultater", 
-                "Ingen deltagere har gennemført begge ture.",
+                "Ingen deltagere har gennemført alle ture.",
                 parent=self.root
             )
 
     def export_csv(self):
         """Export results to CSV file with user-selected filename"""
-        if not self.results_tree.get_children():
+        if not len(self.engine.leaderboard):
             messagebox.showwarning(
                 "Ingen Resultater", 
                 "Beregn venligst resultater først.",
@@ -983,6 +2149,8 @@ class RowingTimer:
             default_filename = (
                 f"rowing_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             )
+            from tkinter import filedialog
+
             filename = filedialog.asksaveasfilename(
                 defaultextension=".csv",
                 filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
@@ -993,38 +2161,9 @@ class RowingTimer:
             if not filename:  # User cancelled
                 return
 
+            # Rows come straight from the engine at full precision
             with open(filename, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-
-                # Event Info
-                if self.event_info["name"]:
-                    writer.writerow(["Begivenhed:", self.event_info["name"]])
-                if self.event_info["date"]:
-                    writer.writerow(["Dato:", self.event_info["date"]])
-                if self.event_info["location"]:
-                    writer.writerow(["Lokation:", self.event_info["location"]])
-                if self.event_info["description"]:
-                    writer.writerow(["Beskrivelse:", self.event_info["description"].replace("\n", " ")])
-                
-                writer.writerow([]) # Empty line
-
-                # Header
-                writer.writerow(
-                    [
-                        "Plads",
-                        "Båd",
-                        "Navn",
-                        "Tur 1",
-                        "Tur 2",
-                        "Forskel",
-                        "Score",
-                    ]
-                )
-
-                # Data
-                for item in self.results_tree.get_children():
-                    values = self.results_tree.item(item)["values"]
-                    writer.writerow(values)
+                write_results_csv(f, self.engine, event_info=self.event_info)
 
             messagebox.showinfo(
                 "CSV Eksport Færdig", f"Resultater eksporteret til:\n{filename}"
@@ -1036,29 +2175,25 @@ class RowingTimer:
             )
 
     def export_pdf(self):
-        """Export results to PDF file with formatted layout"""
-        if not self.results_tree.get_children():
+        """Export results to PDF file with formatted layout.
+
+        The report is rendered on a worker thread from a snapshot of the
+        results while a small dialog shows progress and allows cancelling.
+        """
+        if self._pdf_export is not None:
+            messagebox.showinfo(
+                "PDF Eksport", "En PDF eksport er allerede i gang.", parent=self.root
+            )
+            return
+        if not len(self.engine.leaderboard):
             messagebox.showwarning(
                 "Ingen Resultater", "Beregn venligst resultater først."
             )
             return
 
         try:
-            # Try to import reportlab
-            try:
-                from reportlab.lib import colors
-                from reportlab.lib.enums import TA_CENTER, TA_LEFT
-                from reportlab.lib.pagesizes import A4
-                from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-                from reportlab.lib.units import inch
-                from reportlab.platypus import (
-                    Paragraph,
-                    SimpleDocTemplate,
-                    Spacer,
-                    Table,
-                    TableStyle,
-                )
-            except ImportError:
+            # The export job imports reportlab; only check that it is installed
+            if importlib.util.find_spec("reportlab") is None:
                 messagebox.showerror(
                     "PDF Eksport Fejl",
                     "PDF eksport kræver 'reportlab' biblioteket.\n\n"
@@ -1072,6 +2207,8 @@ class RowingTimer:
             default_filename = (
                 f"rowing_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
             )
+            from tkinter import filedialog
+
             filename = filedialog.asksaveasfilename(
                 defaultextension=".pdf",
                 filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
@@ -1082,225 +2219,231 @@ class RowingTimer:
             if not filename:  # User cancelled
                 return
 
-            # Create PDF document
-            doc = SimpleDocTemplate(
+            # Snapshot on the Tk thread; the worker only reads the copy
+            job = PdfExportJob(
                 filename,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18,
+                result_snapshot(self.engine),
+                self.engine.run_count,
+                self.event_info,
             )
-
-            # Container for the 'Flowable' objects
-            elements = []
-
-            # Get styles
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                "CustomTitle",
-                parent=styles["Heading1"],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor("#2E4057"),
+        except Exception as e:
+            messagebox.showerror(
+                "PDF Eksport Fejl", f"Kunne ikke eksportere PDF: {str(e)}"
             )
+            return
 
-            subtitle_style = ParagraphStyle(
-                "CustomSubtitle",
-                parent=styles["Normal"],
-                fontSize=12,
-                spaceAfter=20,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor("#666666"),
-            )
+        self._pdf_export = job
+        self._show_pdf_progress(job)
+        job.start()
+        self._poll_pdf_export()
 
-            # Club header with logo placeholder
-            club_header = Paragraph("🚣 SKELSKØR ROKLUB 🚣", title_style)
-            elements.append(club_header)
+    def _show_pdf_progress(self, job):
+        """Small non-blocking dialog with a progress bar and a cancel button"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("PDF Eksport")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        # Closing the window cancels, like the button
+        dialog.protocol("WM_DELETE_WINDOW", job.cancel)
 
-            elements.append(Spacer(1, 20))
+        ttk.Label(
+            dialog, text=f"Eksporterer til {os.path.basename(job.filename)}..."
+        ).pack(padx=20, pady=(15, 5))
+        self.pdf_progress_var = tk.DoubleVar(value=0.0)
+        ttk.Progressbar(
+            dialog, variable=self.pdf_progress_var, maximum=100, length=300
+        ).pack(padx=20, pady=5)
+        ttk.Button(dialog, text="Annuller", command=job.cancel).pack(pady=(5, 15))
+
+        self._pdf_progress_dialog = dialog
+
+    def _poll_pdf_export(self):
+        """Follow the worker from the Tk thread until it is done"""
+        job = self._pdf_export
+        if job is None:
+            return
+        self.pdf_progress_var.set(job.progress * 100)
+        if not job.done():
+            self.root.after(PDF_POLL_MS, self._poll_pdf_export)
+            return
 
-            # Event details
-            event_name = self.event_info.get("name") or "Ro Konkurrence Resultater"
-            title = Paragraph(event_name, title_style)
-            elements.append(title)
+        self._pdf_export = None
+        self._pdf_progress_dialog.destroy()
+        self._pdf_progress_dialog = None
 
-            # Metadata
-            date_str = self.event_info.get("date") or datetime.now().strftime('%d. %B %Y')
-            loc_str = self.event_info.get("location") or "Skælskør"
-            
-            meta_info = f"{date_str} • {loc_str}"
-            subtitle = Paragraph(meta_info, subtitle_style)
-            elements.append(subtitle)
+        if job.error is not None:
+            if isinstance(job.error, ImportError):
+                message = (
+                    "PDF eksport kræver 'reportlab' biblioteket.\n\n"
+                    "Installer det med:\npip install reportlab"
+                )
+            else:
+                message = f"Kunne ikke eksportere PDF: {str(job.error)}"
+            messagebox.showerror("PDF Eksport Fejl", message, parent=self.root)
+        elif not job.cancelled:
+            messagebox.showinfo(
+                "PDF Eksport Færdig",
+                f"Resultater eksporteret til:\n{job.filename}",
+                parent=self.root,
+            )
 
-            if self.event_info.get("description"):
-                desc = Paragraph(self.event_info["description"], subtitle_style)
-                elements.append(desc)
+    def format_running_time(self, seconds):
+        """Running timers are shown in tenths, final times keep milliseconds"""
+        return format_running_tenths(int(seconds * 10))
 
-            elements.append(Spacer(1, 20))
+    def format_time(self, seconds):
+        if seconds is None:
+            return "-"
+        return format_ms(seconds_to_ms(seconds))
 
-            # Prepare table data
-            table_data = [
-                [
-                    "Plads",
-                    "Båd",
-                    "Deltager Navn",
-                    "Tur 1",
-                    "Tur 2",
-                    "Forskel",
-                    "Score",
-                ]
-            ]
+    def record_event(self, op, **fields):
+        """Append a single timing event to the journal instead of rewriting the data file"""
+        self.record_events([{"op": op, **fields}])
 
-            for item in self.results_tree.get_children():
-                values = self.results_tree.item(item)["values"]
-                if values:
-                    table_data.append(list(values))
-
-            # Create table
-            table = Table(
-                table_data,
-                colWidths=[
-                    0.6 * inch,
-                    0.7 * inch,
-                    2.0 * inch,
-                    0.9 * inch,
-                    0.9 * inch,
-                    0.9 * inch,
-                    0.8 * inch,
-                ],
-            )
+    def record_events(self, events):
+        """Append timing events to the journal in one write, e.g. a group start"""
+        if not self.journal_mode:
+            self.save_data()
+            return
 
-            # Table styling
-            table.setStyle(
-                TableStyle(
-                    [
-                        # Header row
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2E4057")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 12),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        # Data rows
-                        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                        ("FONTSIZE", (0, 1), (-1, -1), 10),
-                        (
-                            "ROWBACKGROUNDS",
-                            (0, 1),
-                            (-1, -1),
-                            [colors.beige, colors.white],
-                        ),
-                        ("ALIGN", (0, 1), (0, -1), "CENTER"),  # Rank column
-                        ("ALIGN", (1, 1), (1, -1), "CENTER"),  # Boat column
-                        ("ALIGN", (2, 1), (2, -1), "LEFT"),  # Name column
-                        ("ALIGN", (3, 1), (-1, -1), "CENTER"),  # Time columns
-                        # Grid
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        # Special styling for winner
-                        ("BACKGROUND", (0, 1), (-1, 1), colors.HexColor("#FFD700")),
-                        ("FONTNAME", (0, 1), (-1, 1), "Helvetica-Bold"),
-                    ]
-                )
-            )
+        records = []
+        for event in events:
+            self._journal_seq += 1
+            records.append({"seq": self._journal_seq, **event})
 
-            elements.append(table)
-            elements.append(Spacer(1, 30))
-
-            # Add summary information
-            total_participants = len(table_data) - 1
-            if total_participants > 0:
-                winner_data = table_data[1]  # First data row after header
-                winner_name = winner_data[2]
-                winner_consistency = winner_data[6]
-
-                summary_style = ParagraphStyle(
-                    "Summary",
-                    parent=styles["Normal"],
-                    fontSize=11,
-                    spaceAfter=10,
-                    alignment=TA_LEFT,
-                )
+        if not self.writer.submit_records(self.storage, records):
+            # Writer is backlogged - a single snapshot replaces the queue
+            self.save_data()
+            return
 
-                summary_text = [
-                    "<b>Konkurrence Sammendrag:</b>",
-                    f"• Antal Deltagere: {total_participants}",
-                    f"• Vinder: {winner_name} (Mest Konsistent)",
-                    f"• Vinder Konsistens Score: {winner_consistency}",
-                ]
+        self._journal_count += len(records)
+        if (
+            self.storage.needs_compaction
+            and self._journal_count >= JOURNAL_COMPACT_THRESHOLD
+        ):
+            # Periodic compaction keeps the journal short and startup fast
+            self.save_data()
 
-                for text in summary_text:
-                    if text:
-                        elements.append(Paragraph(text, summary_style))
-                    else:
-                        elements.append(Spacer(1, 6))
+    def save_data(self):
+        """Queue a full snapshot; the writer thread does the disk work"""
+        # Copy on the Tk thread so later edits don't race with the writer
+        data_to_save = {
+            "event_info": dict(self.event_info),
+            "participants": {
+                boat: participant.to_dict()
+                for boat, participant in self.participants.items()
+            },
+            "journal_seq": self._journal_seq,
+        }
+        self._journal_count = 0
 
-            # Build PDF
-            doc.build(elements)
+        if not self.writer.submit_snapshot(self.storage, data_to_save):
+            # Writer already shut down - write directly
+            try:
+                self.storage.save_snapshot(data_to_save)
+            except Exception as e:
+                self._show_storage_error(e)
 
-            messagebox.showinfo(
-                "PDF Eksport Færdig", f"Resultater eksporteret til:\n{filename}"
+    def _on_storage_error(self, error):
+        """Called on the writer thread - hand the error over to the Tk thread"""
+        print(f"Fejl ved gemning af data: {error}")
+        if self._storage_error_pending:
+            return
+        self._storage_error_pending = True
+        try:
+            self.root.after(0, self._show_storage_error, error)
+        except Exception:
+            # Tk is gone (might be during shutdown)
+            pass
+
+    def _show_storage_error(self, error):
+        """Keep the latest save error on screen until it is dismissed.
+
+        A toast rather than a messagebox, so the timing goes on while the
+        disk problem is looked into.
+        """
+        self._storage_error_pending = False
+        # Only show it if root exists (might be during shutdown)
+        if hasattr(self, "root") and self.root:
+            self._dismiss_toast(self._storage_error_toast)
+            self._storage_error_toast = self.show_toast(
+                f"Kunne ikke gemme data! Tjek filrettigheder. {error}",
+                "error",
+                sticky=True,
             )
 
+    def load_data(self):
+        # Make sure nothing queued is still on its way to disk
+        self.writer.flush()
+
+        storage = self.storage
+        snapshot_seq = 0
+        participants = {}
+        try:
+            if (
+                isinstance(storage, SqliteStorage)
+                and not os.path.exists(storage.data_file)
+                and os.path.exists(self.data_file)
+            ):
+                # First start on SQLite - bring the existing JSON data along
+                import_json_to_sqlite(self.data_file, storage)
+
+            data = storage.load_snapshot()
+            if data is not None:
+                # check if new format (has "participants" key)
+                if "participants" in data:
+                    self.event_info = data.get("event_info", self.event_info)
+                    self.engine.run_count = self.event_info.setdefault(
+                        "run_count", DEFAULT_RUN_COUNT
+                    )
+                    self.engine.scoring = self.event_info.setdefault(
+                        "scoring", DEFAULT_SCORING
+                    )
+                    participants = data["participants"]
+                    snapshot_seq = data.get("journal_seq", 0)
+                else:
+                    # Legacy format - migration
+                    participants = data
+                    # Keep default event info
+            participants = self._as_participants(participants)
         except Exception as e:
+            print(f"Error loading data: {e}")
+            participants = {}
             messagebox.showerror(
-                "PDF Eksport Fejl", f"Kunne ikke eksportere PDF: {str(e)}"
+                "Indlæsnings Fejl",
+                f"Kunne ikke indlæse gemte data - starter tomt.\n\n{e}",
+                parent=self.root
             )
 
-    def format_time(self, seconds):
-        if seconds is None:
-            return "-"
-        minutes = int(seconds // 60)
-        secs = seconds % 60
-        return f"{minutes:02d}:{secs:06.3f}"
-
-    def save_data(self):
+        # Replay events recorded since the snapshot was written, before the
+        # engine ranks the boats, so finishes only in the journal count too
         try:
-            data_to_save = {
-                "event_info": self.event_info,
-                "participants": self.participants
-            }
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data_to_save, f, indent=2)
+            records = storage.read_journal()
+            self._journal_seq = replay_journal(
+                participants,
+                records,
+                after_seq=snapshot_seq,
+                run_count=self.engine.run_count,
+            )
+            self._journal_count = len(records)
         except Exception as e:
-            error_msg = f"Fejl ved gemning af data: {e}"
-            print(error_msg)
-            # Only show popup if root exists (might be during shutdown)
-            if hasattr(self, "root") and self.root:
-                messagebox.showerror(
-                    "Gemmer Fejl", 
-                    f"Kunne ikke gemme data!\n\nTjek filrettigheder.\n{e}",
-                    parent=self.root
-                )
+            print(f"Error replaying journal: {e}")
+            self._journal_seq = snapshot_seq
 
-    def load_data(self):
-        try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    
-                    # check if new format (has "participants" key)
-                    if "participants" in data:
-                        self.participants = data["participants"]
-                        self.event_info = data.get("event_info", self.event_info)
-                    else:
-                        # Legacy format - migration
-                        self.participants = data
-                        # Keep default event info
-        except Exception as e:
-            print(f"Error loading data: {e}")
-            self.participants = {}
+        self.participants = participants
 
 
 def main():
     root = tk.Tk()
-    app = RowingTimer(root)
-
-    # Update displays initially
-    app.update_participants_display()
-    app.update_boat_controls()
+    app = RowingTimer(
+        root,
+        profile_startup=PROFILE_STARTUP or "--profile-startup" in sys.argv,
+        remote_api=REMOTE_API or ("1" if "--api" in sys.argv else None),
+    )
+
+    # Tabs fill themselves when first shown; this marks the first idle
+    # moment after the window has been drawn
+    root.after_idle(app._startup_phase, "first idle")
 
     root.mainloop()
 
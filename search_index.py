@@ -0,0 +1,94 @@
+"""
+Search index over boat numbers and participant names for the Rowing Timer
+Every substring of up to three characters points at the boats whose text
+contains it, so a filter box can narrow thousands of boats on each
+keystroke without looking at all of them. Longer words intersect the boats
+of their trigrams and only check the few candidates that are left.
+"""
+
+GRAM = 3
+
+
+def _grams(text):
+    """All substrings of text up to GRAM characters long"""
+    return {
+        text[start:start + size]
+        for size in range(1, GRAM + 1)
+        for start in range(len(text) - size + 1)
+    }
+
+
+class SearchIndex:
+    """Boats by the substrings of their boat number and name"""
+
+    def __init__(self):
+        self._texts = {}  # boat -> lower-case "boat name"
+        self._boats = {}  # substring -> set of boats
+
+    def __len__(self):
+        return len(self._texts)
+
+    def add(self, boat, name):
+        self.remove(boat)
+        text = f"{boat} {name}".casefold()
+        self._texts[boat] = text
+        boats = self._boats
+        for gram in _grams(text):
+            if gram in boats:
+                boats[gram].add(boat)
+            else:
+                boats[gram] = {boat}
+
+    def remove(self, boat):
+        text = self._texts.pop(boat, None)
+        if text is None:
+            return
+        for gram in _grams(text):
+            boats = self._boats[gram]
+            boats.discard(boat)
+            if not boats:
+                del self._boats[gram]
+
+    def rebuild(self, participants):
+        """Index a whole {boat: Participant} mapping from scratch"""
+        self.clear()
+        for boat, participant in participants.items():
+            self.add(boat, participant.name)
+
+    def clear(self):
+        self._texts.clear()
+        self._boats.clear()
+
+    def search(self, query):
+        """Boats whose number or name contains every word of query.
+
+        Returns None for a query without words, meaning "no filter".
+        """
+        words = query.casefold().split()
+        if not words:
+            return None
+        matches = None
+        # Longest words first: they usually narrow the most
+        for word in sorted(words, key=len, reverse=True):
+            found = self._search_word(word)
+            matches = found if matches is None else matches & found
+            if not matches:
+                break
+        return matches
+
+    def _search_word(self, word):
+        if len(word) <= GRAM:
+            return set(self._boats.get(word, ()))
+
+        postings = []
+        for start in range(len(word) - GRAM + 1):
+            boats = self._boats.get(word[start:start + GRAM])
+            if not boats:
+                return set()
+            postings.append(boats)
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+
+        # Trigrams in the wrong order can match too; check the text
+        texts = self._texts
+        return {boat for boat in candidates if word in texts[boat]}
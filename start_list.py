@@ -0,0 +1,85 @@
+"""
+Start list import for the Rowing Timer
+Reads boat numbers and names from CSV or TSV files, including the
+semicolon-separated CSV that Excel writes with Danish regional settings.
+A header row is optional; without one the first two columns are used.
+"""
+
+import csv
+
+# Lower-case header names recognised for the two columns
+BOAT_HEADERS = {"båd", "bad", "boat", "båd nummer", "bådnummer", "boat number", "nr", "nummer"}
+NAME_HEADERS = {"navn", "name", "deltager", "deltager navn", "deltagernavn", "participant"}
+
+DELIMITERS = ",;\t"
+
+# Reported for workbooks and other files that are not text
+NOT_TEXT_PROBLEM = "Filen er ikke en tekst/CSV-fil - gem som CSV fra Excel."
+
+
+def _sniff_delimiter(text):
+    """Delimiter of the file, judged from its first lines"""
+    sample = "\n".join(text.splitlines()[:20])
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=DELIMITERS).delimiter
+    except csv.Error:
+        # A single column or odd quoting - go by the most common candidate
+        first_line = sample.split("\n", 1)[0]
+        return max(DELIMITERS, key=first_line.count)
+
+
+def parse_start_list(text):
+    """Parse start list text into (entries, problems).
+
+    entries is a list of (boat, name) pairs in file order; problems lists
+    lines that could not be read, with their line numbers.
+    """
+    rows = csv.reader(text.splitlines(), delimiter=_sniff_delimiter(text))
+
+    entries = []
+    problems = []
+    boat_column, name_column = 0, 1
+    for line_number, row in enumerate(rows, 1):
+        cells = [cell.strip() for cell in row]
+        if not any(cells):
+            continue
+
+        if not entries and not problems:
+            lowered = [cell.lower() for cell in cells]
+            boat_match = [i for i, cell in enumerate(lowered) if cell in BOAT_HEADERS]
+            name_match = [i for i, cell in enumerate(lowered) if cell in NAME_HEADERS]
+            if boat_match or name_match:
+                if not (boat_match and name_match):
+                    problems.append(
+                        f"Linje {line_number}: overskriften skal have både "
+                        "en båd- og en navnekolonne."
+                    )
+                    return entries, problems
+                boat_column, name_column = boat_match[0], name_match[0]
+                continue
+
+        if len(cells) <= max(boat_column, name_column):
+            problems.append(f"Linje {line_number}: mangler båd nummer eller navn.")
+            continue
+        entries.append((cells[boat_column], cells[name_column]))
+
+    return entries, problems
+
+
+def read_start_list(path):
+    """Read and parse a start list file; see parse_start_list"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if b"\x00" in raw:
+        # .xlsx workbooks (zip files), .xls and UTF-16 text all contain NULs
+        return [], [NOT_TEXT_PROBLEM]
+    try:
+        # utf-8-sig also drops the byte order mark Excel puts in UTF-8 files
+        text = raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        try:
+            # Older Excel versions save CSV in the Windows code page
+            text = raw.decode("cp1252")
+        except UnicodeDecodeError:
+            return [], [NOT_TEXT_PROBLEM]
+    return parse_start_list(text)
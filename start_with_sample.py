@@ -124,7 +124,7 @@ def load_sample_data(app):
     """Indlæs eksempel data i applikationen"""
     try:
         sample_data = create_sample_data()
-        app.participants.update(sample_data)
+        app.participants = {**app.participants, **sample_data}
         app.save_data()
         app.update_participants_display()
         app.update_boat_controls()
@@ -0,0 +1,602 @@
+"""
+Persistence helpers for the Rowing Timer
+Two storage backends share one interface:
+- json: snapshot file plus an append-only event journal next to it, so a
+  finish only costs one small fsynced write instead of a full rewrite
+- sqlite: one row per participant and per run in a WAL-mode database, so a
+  finish costs a single-row UPSERT
+All disk writes are done by a background writer thread so a slow USB stick or
+network share never delays the next button click.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections import deque
+
+from timing_engine import DEFAULT_RUN_COUNT, Participant
+
+JOURNAL_SUFFIX = ".journal"
+SQLITE_SUFFIX = ".db"
+
+# Previous snapshots kept as rowing_data.json.1 (newest) ... .N
+SNAPSHOT_GENERATIONS = 3
+
+
+def journal_path_for(data_file):
+    """Return the journal file that belongs to a snapshot file"""
+    return os.path.splitext(data_file)[0] + JOURNAL_SUFFIX
+
+
+def sqlite_path_for(data_file):
+    """Return the SQLite database that replaces a JSON data file"""
+    return os.path.splitext(data_file)[0] + SQLITE_SUFFIX
+
+
+class EventJournal:
+    """Append-only log of timing events, one compact JSON record per line"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def append(self, record):
+        """Write a single record and fsync it before returning"""
+        self.append_many([record])
+
+    def append_many(self, records):
+        """Write several records with a single fsync"""
+        lines = "".join(
+            json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+            for record in records
+        )
+        if self._file is None:
+            # After a crash the last line may be torn; start on a new line so
+            # the next record is not glued onto it and skipped with it
+            if not self._ends_with_newline():
+                lines = "\n" + lines
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(lines)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _ends_with_newline(self):
+        """True for a missing or empty journal or one whose last line is complete"""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b"\n"
+        except FileNotFoundError:
+            return True
+
+    def read(self):
+        """Return all complete records; a torn last line from a crash is skipped"""
+        if not os.path.exists(self.path):
+            return []
+
+        records = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    print(f"Skipping damaged journal record: {line[:80]}")
+        return records
+
+    def truncate(self):
+        """Empty the journal after its records have been folded into a snapshot"""
+        self.close()
+        if os.path.exists(self.path):
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def generation_path(data_file, generation):
+    """Older snapshot number generation (1 is the most recent)"""
+    return f"{data_file}.{generation}"
+
+
+def _fsync_dir(path):
+    """Make renames in a directory durable (not supported on Windows)"""
+    if os.name == "nt":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_snapshot(data_file, data, generations=SNAPSHOT_GENERATIONS):
+    """Atomically replace the JSON data file, keeping older generations.
+
+    The new state goes to a temp file that is fsynced before it is renamed
+    over the data file, so a crash leaves either the old or the new file and
+    never a truncated one.
+    """
+    temp_file = data_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+
+    if generations and os.path.exists(data_file):
+        for generation in range(generations, 1, -1):
+            older = generation_path(data_file, generation - 1)
+            if os.path.exists(older):
+                os.replace(older, generation_path(data_file, generation))
+        os.replace(data_file, generation_path(data_file, 1))
+
+    os.replace(temp_file, data_file)
+    _fsync_dir(data_file)
+
+
+def read_snapshot(data_file, generations=SNAPSHOT_GENERATIONS):
+    """Load the newest readable snapshot, falling back to older generations.
+
+    Returns None when no snapshot exists at all; raises ValueError when
+    snapshots exist but none of them can be read.
+    """
+    candidates = [data_file] + [
+        generation_path(data_file, generation) for generation in range(1, generations + 1)
+    ]
+    found = False
+    for path in candidates:
+        if not os.path.exists(path):
+            continue
+        found = True
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                if path != data_file:
+                    print(f"Data file damaged or missing - recovered from {path}")
+                return data
+        except (OSError, ValueError) as e:
+            print(f"Skipping unreadable snapshot {path}: {e}")
+
+    if found:
+        raise ValueError(f"Ingen læsbar udgave af {data_file}")
+    return None
+
+
+class StorageBackend:
+    """Where an event is kept on disk.
+
+    Snapshots use the rowing_data.json layout: {"event_info", "participants",
+    "journal_seq"} with participants in Participant.to_dict() form. Timing
+    events are the journal records built by RowingTimer.record_event.
+    load_snapshot and read_journal run on the Tk thread while the writer is
+    idle; append_many and save_snapshot run on the writer thread.
+    """
+
+    name = None
+    # Whether appended records pile up until the next snapshot folds them in
+    needs_compaction = False
+
+    def __init__(self, data_file):
+        self.data_file = data_file
+
+    def load_snapshot(self):
+        """Return the last saved state, or None if nothing is stored yet"""
+        raise NotImplementedError
+
+    def read_journal(self):
+        """Return the timing events recorded after the snapshot"""
+        return []
+
+    def append_many(self, records):
+        """Durably store several timing events"""
+        raise NotImplementedError
+
+    def save_snapshot(self, data):
+        """Replace the stored state with a complete snapshot"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class JsonStorage(StorageBackend):
+    """JSON snapshot file plus an event journal next to it"""
+
+    name = "json"
+    needs_compaction = True
+
+    def __init__(self, data_file):
+        super().__init__(data_file)
+        self.journal = EventJournal(journal_path_for(data_file))
+
+    def load_snapshot(self):
+        return read_snapshot(self.data_file)
+
+    def read_journal(self):
+        return self.journal.read()
+
+    def append_many(self, records):
+        self.journal.append_many(records)
+
+    def save_snapshot(self, data):
+        write_snapshot(self.data_file, data)
+        self.journal.truncate()
+
+    def close(self):
+        self.journal.close()
+
+
+class SqliteStorage(StorageBackend):
+    """SQLite database in WAL mode with one row per participant and per run"""
+
+    name = "sqlite"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS participants (
+            boat TEXT PRIMARY KEY,
+            name TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS runs (
+            boat TEXT NOT NULL,
+            run INTEGER NOT NULL,
+            start REAL,
+            time_ns INTEGER,
+            clock TEXT,
+            PRIMARY KEY (boat, run)
+        ) WITHOUT ROWID;
+    """
+
+    # Fixed statement texts so sqlite3's statement cache prepares each once
+    SQL_REGISTER = (
+        "INSERT INTO participants (boat, name) VALUES (?, ?) "
+        "ON CONFLICT (boat) DO NOTHING"
+    )
+    SQL_START = (
+        "INSERT INTO runs (boat, run, start, time_ns, clock) VALUES (?, ?, ?, NULL, NULL) "
+        "ON CONFLICT (boat, run) DO UPDATE SET "
+        "start = excluded.start, time_ns = NULL, clock = NULL"
+    )
+    SQL_STOP = (
+        "INSERT INTO runs (boat, run, time_ns, clock) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (boat, run) DO UPDATE SET "
+        "time_ns = excluded.time_ns, clock = excluded.clock"
+    )
+    SQL_RESET = "DELETE FROM runs WHERE boat = ? AND run = ?"
+    SQL_SET_META = (
+        "INSERT INTO meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT (key) DO UPDATE SET value = excluded.value"
+    )
+
+    def __init__(self, data_file):
+        super().__init__(sqlite_path_for(data_file))
+        self._conn = None
+        # Loads happen on the Tk thread, writes on the writer thread
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.data_file, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # FULL syncs the WAL on every commit, like the JSON journal fsync
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def load_snapshot(self):
+        if not os.path.exists(self.data_file):
+            return None
+
+        with self._lock:
+            conn = self._connection()
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+            participants = {
+                boat: {"name": name}
+                for boat, name in conn.execute("SELECT boat, name FROM participants")
+            }
+            for boat, run, start, time_ns, clock in conn.execute(
+                "SELECT boat, run, start, time_ns, clock FROM runs"
+            ):
+                data = participants.get(boat)
+                if data is None:
+                    continue
+                data[f"run{run}_start"] = start
+                if time_ns is not None:
+                    data[f"run{run}_time"] = time_ns / 1e9
+                    data[f"run{run}_time_ns"] = time_ns
+                    data[f"run{run}_clock"] = clock
+
+        if not participants and "event_info" not in meta:
+            return None
+        return {
+            "event_info": json.loads(meta.get("event_info", "{}")),
+            "participants": participants,
+            "journal_seq": int(meta.get("journal_seq", 0)),
+        }
+
+    def append_many(self, records):
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for record in records:
+                    self._apply(conn, record)
+
+    def _apply(self, conn, record):
+        op = record.get("op")
+        boat = record.get("boat")
+        if op == "register":
+            conn.execute(self.SQL_REGISTER, (boat, record.get("name", "")))
+        elif op == "start":
+            conn.execute(self.SQL_START, (boat, int(record["run"]), record.get("start")))
+        elif op == "stop":
+            time_ns = record.get("time_ns")
+            if time_ns is None:
+                time_ns = round(record["time"] * 1e9)
+            conn.execute(
+                self.SQL_STOP, (boat, int(record["run"]), time_ns, record.get("clock"))
+            )
+        elif op == "reset":
+            conn.execute(self.SQL_RESET, (boat, int(record["run"])))
+
+    def save_snapshot(self, data):
+        participants = data.get("participants", {})
+        run_rows = []
+        for boat, record in participants.items():
+            participant = Participant.from_dict(
+                record, data.get("event_info", {}).get("run_count", DEFAULT_RUN_COUNT)
+            )
+            for index, (start, time_ns, clock) in enumerate(
+                zip(participant.starts, participant.times_ns, participant.clocks), 1
+            ):
+                if start is not None or time_ns is not None:
+                    run_rows.append((boat, index, start, time_ns, clock))
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM runs")
+                conn.execute("DELETE FROM participants")
+                conn.executemany(
+                    "INSERT INTO participants (boat, name) VALUES (?, ?)",
+                    [(boat, record.get("name", "")) for boat, record in participants.items()],
+                )
+                conn.executemany(
+                    "INSERT INTO runs (boat, run, start, time_ns, clock) VALUES (?, ?, ?, ?, ?)",
+                    run_rows,
+                )
+                conn.execute(
+                    self.SQL_SET_META,
+                    ("event_info", json.dumps(data.get("event_info", {}), ensure_ascii=False)),
+                )
+                conn.execute(
+                    self.SQL_SET_META, ("journal_seq", str(data.get("journal_seq", 0)))
+                )
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+STORAGE_BACKENDS = {
+    JsonStorage.name: JsonStorage,
+    SqliteStorage.name: SqliteStorage,
+}
+
+
+def open_storage(kind, data_file):
+    """Create the backend named kind for a data file (json if unknown)"""
+    return STORAGE_BACKENDS.get(kind, JsonStorage)(data_file)
+
+
+def import_json_to_sqlite(json_file, sqlite_storage=None):
+    """Copy a rowing_data.json (with its journal) into a SQLite database.
+
+    Both the current {"event_info", "participants"} layout and the legacy
+    flat {boat: participant} layout are understood. Returns the number of
+    participants imported.
+    """
+    source = JsonStorage(json_file)
+    data = source.load_snapshot() or {}
+    if "participants" in data:
+        event_info = data.get("event_info", {})
+        records = data["participants"]
+    else:
+        # Legacy format - the whole file is the participants dict
+        event_info = {}
+        records = data
+
+    run_count = event_info.get("run_count", DEFAULT_RUN_COUNT)
+    participants = {
+        boat: Participant.from_dict(record, run_count) for boat, record in records.items()
+    }
+    journal_seq = replay_journal(
+        participants,
+        source.read_journal(),
+        after_seq=data.get("journal_seq", 0),
+        run_count=run_count,
+    )
+    source.close()
+
+    target = sqlite_storage or SqliteStorage(json_file)
+    target.save_snapshot(
+        {
+            "event_info": event_info,
+            "participants": {
+                boat: participant.to_dict() for boat, participant in participants.items()
+            },
+            "journal_seq": journal_seq,
+        }
+    )
+    if sqlite_storage is None:
+        target.close()
+    return len(participants)
+
+
+class BackgroundWriter:
+    """Dedicated writer thread for journal records and snapshots.
+
+    Work is queued from the Tk thread and written in order. A queued snapshot
+    supersedes everything submitted before it, so a burst of saves only writes
+    the latest state. Errors are passed to on_error from the writer thread.
+    """
+
+    def __init__(self, on_error=None, max_pending=64):
+        self.on_error = on_error
+        self.max_pending = max_pending
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._backends = {}
+
+        self._thread = threading.Thread(
+            target=self._run, name="rowing-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit_record(self, storage, record):
+        """Queue a timing event; returns False when the queue is full"""
+        return self.submit_records(storage, [record])
+
+    def submit_records(self, storage, records):
+        """Queue timing events that belong together, e.g. a group start.
+
+        They are written in the same batch, so they cost a single fsync.
+        """
+        with self._cond:
+            if self._closed or len(self._pending) >= self.max_pending:
+                return False
+            self._pending.append(("records", storage, records))
+            self._cond.notify_all()
+            return True
+
+    def submit_snapshot(self, storage, data):
+        """Queue a full snapshot, replacing any work that is still pending"""
+        with self._cond:
+            if self._closed:
+                return False
+            self._pending.clear()
+            self._pending.append(("snapshot", storage, data))
+            self._cond.notify_all()
+            return True
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far is on disk"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def close(self, timeout=10.0):
+        """Flush pending work and stop the writer thread"""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    break
+                batch = list(self._pending)
+                self._pending.clear()
+                self._busy = True
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+        for storage in self._backends.values():
+            storage.close()
+
+    def _write_batch(self, batch):
+        # Anything before the last snapshot is already contained in it
+        for index in range(len(batch) - 1, -1, -1):
+            if batch[index][0] == "snapshot":
+                batch = batch[index:]
+                break
+
+        records = []
+        for kind, storage, payload in batch:
+            self._backends[id(storage)] = storage
+            if kind == "snapshot":
+                storage.save_snapshot(payload)
+            else:
+                records.extend((storage, record) for record in payload)
+
+        # Group records per backend so each group costs one fsync/commit
+        grouped = {}
+        for storage, record in records:
+            grouped.setdefault(id(storage), (storage, []))[1].append(record)
+        for storage, group in grouped.values():
+            storage.append_many(group)
+
+
+def replay_journal(participants, records, after_seq=0, run_count=DEFAULT_RUN_COUNT):
+    """Apply journal records newer than after_seq to the Participant records.
+
+    Returns the highest sequence number applied, so the caller can continue
+    numbering from there.
+    """
+    last_seq = after_seq
+
+    for record in records:
+        seq = record.get("seq", 0)
+        if seq <= after_seq:
+            # Already folded into the snapshot before the journal was truncated
+            continue
+
+        op = record.get("op")
+        boat = record.get("boat")
+
+        if op == "register":
+            if boat not in participants:
+                participants[boat] = Participant(record.get("name", ""), run_count)
+        elif boat in participants:
+            participant = participants[boat]
+            run = int(record.get("run", 0))
+            if not 1 <= run <= participant.run_count:
+                # Run is no longer part of the event
+                pass
+            elif op == "start":
+                participant.clear_run(run)
+                participant.starts[run - 1] = record.get("start")
+            elif op == "stop":
+                if "time_ns" in record:
+                    participant.set_time_ns(run, record["time_ns"], record.get("clock"))
+                else:
+                    participant.set_time_ns(run, round(record["time"] * 1e9), None)
+            elif op == "reset":
+                participant.clear_run(run)
+                participant.starts[run - 1] = None
+
+        last_seq = max(last_seq, seq)
+
+    return last_seq
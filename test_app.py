@@ -4,7 +4,7 @@ Test script for the Rowing Timer Application
 This script performs basic functionality tests to ensure the application works correctly.
 """
 
-import json
+import io
 import os
 import sys
 import tempfile
@@ -17,7 +17,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 try:
     import tkinter as tk
 
-    from rowing_timer import RowingTimer
+    from clock import EventTimeMapper
+    from exporter import write_results_csv
+    from rowing_timer import TOASTS_SHOWN, RowingTimer
+    from test_timing import ManualClock
+    from timing_engine import Participant
 except ImportError as e:
     print(f"Import error: {e}")
     print("Please ensure all required modules are available.")
@@ -101,7 +105,7 @@ class TestRowingTimer:
             # Check if participant was added
             if "B001" in self.app.participants:
                 participant = self.app.participants["B001"]
-                if participant["name"] == "Test Rower":
+                if participant.name == "Test Rower":
                     self.log_test(
                         "Participant Registration",
                         True,
@@ -159,13 +163,7 @@ class TestRowingTimer:
         """Test timer start/stop functionality"""
         try:
             # Add a participant first
-            self.app.participants["B003"] = {
-                "name": "Timer Test",
-                "run1_time": None,
-                "run2_time": None,
-                "run1_start": None,
-                "run2_start": None,
-            }
+            self.app.participants["B003"] = Participant("Timer Test")
 
             # Setup mock values for timer
             self.app.run_var.get.return_value = "1"
@@ -175,7 +173,7 @@ class TestRowingTimer:
             self.app.start_timer("B003")
 
             # Check if timer was started
-            timer_key = "B003_run1"
+            timer_key = ("B003", 1)
             if timer_key in self.app.current_timers:
                 # Simulate some time passing
                 time.sleep(0.1)
@@ -184,8 +182,8 @@ class TestRowingTimer:
                 self.app.stop_timer("B003")
 
                 # Check if time was recorded
-                if self.app.participants["B003"]["run1_time"] is not None:
-                    recorded_time = self.app.participants["B003"]["run1_time"]
+                if self.app.participants["B003"].time(1) is not None:
+                    recorded_time = self.app.participants["B003"].time(1)
                     if 0.05 <= recorded_time <= 0.2:  # Should be around 0.1 seconds
                         self.log_test(
                             "Timer Functionality",
@@ -279,6 +277,220 @@ class TestRowingTimer:
         except Exception as e:
             self.log_test("Time Formatting", False, f"Exception: {str(e)}")
 
+    def test_warnings_do_not_block(self):
+        """Test that a second boat can be stopped while a warning is pending"""
+        try:
+            for boat in ("W1", "W2"):
+                self.app.participants[boat] = Participant(f"Roer {boat}")
+
+            # Any modal dialog in the timing path fails the test
+            modal = MagicMock(side_effect=AssertionError("modal dialog"))
+            with patch.multiple(
+                "rowing_timer.messagebox",
+                askyesno=modal,
+                showwarning=modal,
+                showerror=modal,
+            ):
+                self.app.start_timer("W1")
+                self.app.stop_timer("W1")
+                first_time = self.app.participants["W1"].time_ns(1)
+                self.app.start_timer("W2")
+
+                # Starting W1 again discards its time, then a double start
+                self.app.start_timer("W1")
+                self.app.start_timer("W1")
+                warnings_pending = len(self.app._toasts)
+
+                self.app.stop_timer_with_feedback("W2")
+                second_time = self.app.participants["W2"].time_ns(1)
+
+                # The discarded time comes back and W1 is no longer running
+                self.app.undo()
+                restored = self.app.participants["W1"].time_ns(1) == first_time
+                restored = restored and not self.app.engine.is_running("W1", 1)
+
+                # A reset is undone the same way
+                self.app.reset_timer("W2")
+                cleared = self.app.participants["W2"].time_ns(1) is None
+                self.app.undo()
+                reset_undone = self.app.participants["W2"].time_ns(1) == second_time
+
+            passed = (
+                warnings_pending >= 2
+                and second_time is not None
+                and restored
+                and cleared
+                and reset_undone
+            )
+            self.log_test(
+                "Warnings Do Not Block",
+                passed,
+                f"{warnings_pending} warnings pending while Båd W2 was stopped, "
+                f"undo restored: {restored and reset_undone}",
+            )
+        except Exception as e:
+            self.log_test("Warnings Do Not Block", False, f"Exception: {str(e)}")
+
+    def test_storage_error_does_not_block(self):
+        """Test that a boat can still be stopped while a save error is shown"""
+        try:
+            self.app.participants["E1"] = Participant("Roer E1")
+
+            # Any modal dialog fails the test
+            modal = MagicMock(side_effect=AssertionError("modal dialog"))
+            with patch.multiple(
+                "rowing_timer.messagebox",
+                askyesno=modal,
+                showwarning=modal,
+                showerror=modal,
+            ):
+                self.app.start_timer("E1")
+
+                # Reported from the writer thread, shown via the Tk loop
+                with patch.object(
+                    self.app.root, "after", lambda ms, f, *args: f(*args)
+                ):
+                    self.app._on_storage_error(OSError("Disken er fuld"))
+                error_toast = self.app._storage_error_toast
+
+                self.app.stop_timer_with_feedback("E1")
+                stopped = self.app.participants["E1"].time_ns(1) is not None
+
+                # Later notifications do not push the error off the screen
+                for _ in range(TOASTS_SHOWN + 1):
+                    self.app.show_toast("Andet")
+                still_shown = error_toast in self.app._toasts
+
+            passed = error_toast is not None and stopped and still_shown
+            self.log_test(
+                "Storage Error Does Not Block",
+                passed,
+                f"Båd E1 stopped: {stopped}, error still shown: {still_shown}",
+            )
+        except Exception as e:
+            self.log_test("Storage Error Does Not Block", False, f"Exception: {str(e)}")
+
+    def test_press_time_used(self):
+        """Test that a slow redraw between button press and handling adds no time"""
+        engine = self.app.engine
+        original_clock, original_mapper = engine.clock, self.app.input_times
+        try:
+            clock = ManualClock()
+            engine.clock = clock
+            self.app.input_times = EventTimeMapper(clock)
+            self.app.participants["B004"] = Participant("Tryk Test")
+            row = {}
+
+            # START pressed at event time 1000 ms, handled 250 ms later
+            clock.value = 10_000_000_000
+            self.app._note_press(row, "start_pressed", MagicMock(time=1_000))
+            clock.value += 250_000_000
+            self.app.start_timer_with_feedback("B004", row.pop("start_pressed"))
+
+            # STOP pressed exactly 60 s later, handled 400 ms late
+            clock.value = 70_000_000_000
+            self.app._note_press(row, "stop_pressed", MagicMock(time=61_000))
+            clock.value += 400_000_000
+            self.app.stop_timer_with_feedback("B004", row.pop("stop_pressed"))
+
+            recorded = self.app.participants["B004"].time_ns(1)
+            passed = (
+                recorded == 60_000_000_000
+                and engine.skew.last_ns == 400_000_000
+                and engine.skew.max_ns == 400_000_000
+            )
+            self.log_test(
+                "Press Time Used",
+                passed,
+                f"Recorded {recorded / 1e9:.3f}s, skew {engine.skew.summary()}",
+            )
+        except Exception as e:
+            self.log_test("Press Time Used", False, f"Exception: {str(e)}")
+        finally:
+            engine.clock, self.app.input_times = original_clock, original_mapper
+
+    def test_stale_press_ignored(self):
+        """Test that only a press that runs the command can set its time"""
+        try:
+            app = self.app
+            app.participants["B005"] = Participant("Gammelt Tryk")
+
+            # A press on a disabled button runs no command
+            row = {}
+            disabled = MagicMock(time=1_000)
+            disabled.widget.cget.return_value = "disabled"
+            app._note_press(row, "stop_pressed", disabled)
+            disabled_ignored = "stop_pressed" not in row
+
+            # A press dragged off the button is forgotten after its release
+            button = MagicMock()
+            app._track_press(button, row, "start_pressed")
+            bindings = {call.args[0]: call.args[1] for call in button.bind.call_args_list}
+            with patch.object(app.root, "after_idle", lambda f, *args: f(*args)):
+                bindings["<ButtonPress-1>"](MagicMock(time=2_000))
+                pressed = "start_pressed" in row
+                bindings["<ButtonRelease-1>"](MagicMock(time=2_500))
+            released_forgotten = pressed and "start_pressed" not in row
+
+            # A recycled row drops what was pressed for its previous boat
+            row.update(
+                {
+                    "boat_label": MagicMock(),
+                    "name_label": MagicMock(),
+                    "window": 1,
+                    "selected_var": MagicMock(),
+                    "start_pressed": 123,
+                    "stop_pressed": 456,
+                }
+            )
+            with patch.object(app, "boat_controls_canvas"), patch.object(
+                app, "_update_boat_row"
+            ), patch.dict(app._boat_row_index, {"B005": 0}):
+                app._bind_boat_control_row(row, "B005", 1)
+            rebound_cleared = "start_pressed" not in row and "stop_pressed" not in row
+            app.boat_control_widgets.pop("B005", None)
+
+            # A click without a press time is not measured as input delay
+            measured = app.engine.skew.count
+            app.start_timer("B005")
+            app.stop_timer_with_feedback("B005")
+            not_measured = (
+                app.engine.skew.count == measured
+                and app.participants["B005"].time_ns(1) is not None
+            )
+
+            passed = (
+                disabled_ignored and released_forgotten and rebound_cleared and not_measured
+            )
+            self.log_test(
+                "Stale Press Ignored",
+                passed,
+                f"disabled {disabled_ignored}, released {released_forgotten}, "
+                f"rebound {rebound_cleared}, unmeasured {not_measured}",
+            )
+        except Exception as e:
+            self.log_test("Stale Press Ignored", False, f"Exception: {str(e)}")
+
+    def test_started_row_ticks_at_once(self):
+        """Test that a start replaces a pending slow idle tick with a fast one"""
+        try:
+            app = self.app
+            app.participants["B006"] = Participant("Hurtig Tik")
+            app._timer_tick_id = "idle-tick"
+            with patch.object(app.root, "after_cancel") as after_cancel:
+                app.start_timer("B006")
+            passed = [call.args for call in after_cancel.call_args_list] == [
+                ("idle-tick",)
+            ]
+            app.engine.reset("B006", 1)
+            self.log_test(
+                "Started Row Ticks At Once",
+                passed,
+                f"cancelled {after_cancel.call_args_list}",
+            )
+        except Exception as e:
+            self.log_test("Started Row Ticks At Once", False, f"Exception: {str(e)}")
+
     def test_data_persistence(self):
         """Test saving and loading data"""
         try:
@@ -306,8 +518,8 @@ class TestRowingTimer:
             if "B999" in self.app.participants:
                 loaded_participant = self.app.participants["B999"]
                 if (
-                    loaded_participant["name"] == "Persistence Test"
-                    and loaded_participant["run1_time"] == 45.67
+                    loaded_participant.name == "Persistence Test"
+                    and loaded_participant.time(1) == 45.67
                 ):
                     self.log_test(
                         "Data Persistence", True, "Data saved and loaded correctly"
@@ -322,11 +534,55 @@ class TestRowingTimer:
         except Exception as e:
             self.log_test("Data Persistence", False, f"Exception: {str(e)}")
 
+    def test_journal_finishes_ranked(self):
+        """Test that finishes only in the journal are ranked after a restart"""
+        try:
+            self.app.participants = {"J1": Participant("Snapshot")}
+            self.app.save_data()
+
+            # Recorded after the snapshot, as during a race
+            self.app.record_event("register", boat="J2", name="Journal")
+            for run, time_ns in ((1, 61_000_000_000), (2, 61_500_000_000)):
+                self.app.record_event("start", boat="J2", run=run, start=None)
+                self.app.record_event(
+                    "stop",
+                    boat="J2",
+                    run=run,
+                    time=time_ns / 1e9,
+                    time_ns=time_ns,
+                    clock="test",
+                )
+
+            self.app.participants = {}
+            self.app.load_data()
+
+            export = io.StringIO()
+            exported = write_results_csv(export, self.app.engine)
+            passed = (
+                "J2" in self.app.participants
+                and [boat for boat, _ in self.app.engine.leaderboard.items()] == ["J2"]
+                and self.app.engine.sorted_boats() == ["J1", "J2"]
+                and exported == 1
+                and "J2" in export.getvalue()
+            )
+            self.log_test(
+                "Journal Finishes Ranked",
+                passed,
+                f"{len(self.app.engine.leaderboard)} ranked, {exported} exported",
+            )
+        except Exception as e:
+            self.log_test("Journal Finishes Ranked", False, f"Exception: {str(e)}")
+
     def cleanup(self):
         """Clean up test files"""
         try:
             if hasattr(self, "temp_file") and os.path.exists(self.temp_file.name):
                 os.unlink(self.temp_file.name)
+            journal_file = os.path.splitext(self.temp_file.name)[0] + ".journal"
+            generations = [f"{self.temp_file.name}.{n}" for n in range(1, 4)]
+            for extra_file in [journal_file] + generations:
+                if os.path.exists(extra_file):
+                    os.unlink(extra_file)
             if hasattr(self, "root"):
                 self.root.destroy()
         except:
@@ -350,6 +606,12 @@ class TestRowingTimer:
             self.test_results_calculation()
             self.test_time_formatting()
             self.test_data_persistence()
+            self.test_journal_finishes_ranked()
+            self.test_press_time_used()
+            self.test_stale_press_ignored()
+            self.test_started_row_ticks_at_once()
+            self.test_warnings_do_not_block()
+            self.test_storage_error_does_not_block()
 
             # Summary
             passed_tests = sum(1 for result in self.test_results if result["passed"])
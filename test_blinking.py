@@ -269,7 +269,7 @@ class BlinkingTester:
 
             # Test timer stop
             time.sleep(0.05)
-            if "B001_run1" in self.app.current_timers:
+            if ("B001", 1) in self.app.current_timers:
                 self.app.stop_timer("B001")
 
             # Verify targeted updates were used
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Test script for the headless result exporter of the Rowing Timer
+These tests need no display and exercise exporter.py directly.
+"""
+
+import csv
+import gc
+import importlib.util
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import exporter
+    from timing_engine import Participant, TimingEngine
+except ImportError as e:
+    print(f"Import error: {e}")
+    sys.exit(1)
+
+
+class ExporterTester:
+    """Test class for streaming CSV, the export CLI and paged PDF output"""
+
+    def __init__(self):
+        self.test_results = []
+        self.temp_dir = None
+
+    def log_test(self, test_name, passed, message=""):
+        """Log test results"""
+        status = "PASS" if passed else "FAIL"
+        print(f"[{status}] {test_name}: {message}")
+        self.test_results.append(
+            {"test": test_name, "passed": passed, "message": message}
+        )
+
+    def setup(self):
+        """Create a scratch directory for export files"""
+        self.temp_dir = tempfile.mkdtemp(prefix="rowing_export_")
+        return True
+
+    def _engine_with_boats(self, boat_count):
+        """Headless engine with boat_count finished boats"""
+        participants = {}
+        for boat in range(1, boat_count + 1):
+            participant = Participant(f"Roer {boat}")
+            participant.set_time_ns(1, 60_000_000_000 + boat, "perf_counter_ns")
+            participant.set_time_ns(2, 61_000_000_000 + 7 * boat, "perf_counter_ns")
+            participants[str(boat)] = participant
+        engine = TimingEngine()
+        engine.load(participants)
+        return engine
+
+    def test_streaming_export_columns(self):
+        """Engine export honours the column selection and keeps every nanosecond"""
+        try:
+            engine = self._engine_with_boats(3)
+            rows = [
+                list(row)
+                for row in exporter.iter_result_rows(
+                    engine, ("boat", "runs", "difference")
+                )
+            ]
+            expected = [
+                ["Båd", "Tur 1", "Tur 2", "Forskel"],
+                ["1", "60.000000001", "61.000000007", "1.000000006"],
+                ["2", "60.000000002", "61.000000014", "1.000000012"],
+                ["3", "60.000000003", "61.000000021", "1.000000018"],
+            ]
+
+            # The CSV text is joined without csv.writer; it must read the same
+            engine.participants["2"].name = 'Holm, "Lille" Bo'
+            engine.participants["3"].times_ns[1] = 60_000_000_004  # Under 1 s apart
+            written = io.StringIO()
+            exporter.write_results_csv(written, engine)
+            reference = io.StringIO()
+            csv.writer(reference).writerows(exporter.iter_result_rows(engine))
+            same_csv = written.getvalue() == reference.getvalue()
+
+            passed = rows == expected and same_csv
+            self.log_test(
+                "Streaming Export Columns",
+                passed,
+                "Selected columns at full precision, same text as csv.writer"
+                if passed
+                else f"Got {rows}, same CSV text: {same_csv}",
+            )
+        except Exception as e:
+            self.log_test("Streaming Export Columns", False, f"Exception: {str(e)}")
+
+    def test_streaming_export_speed(self):
+        """100k result rows must be written in well under a second"""
+        budget = 0.5
+        try:
+            engine = self._engine_with_boats(100_000)
+            filename = os.path.join(self.temp_dir, "speed.csv")
+
+            # Like timeit, take the best of a few runs with the garbage
+            # collector kept out of the measurement
+            timings = []
+            gc.disable()
+            try:
+                for _ in range(5):
+                    started = time.perf_counter()
+                    with open(filename, "w", newline="", encoding="utf-8") as f:
+                        count = exporter.write_results_csv(f, engine)
+                    timings.append(time.perf_counter() - started)
+            finally:
+                gc.enable()
+            elapsed = min(timings)
+
+            self.log_test(
+                "Streaming Export Speed",
+                count == 100_000 and elapsed < budget,
+                f"{count} rows in {elapsed * 1000:.0f} ms (budget {budget * 1000:.0f} ms)",
+            )
+        except Exception as e:
+            self.log_test("Streaming Export Speed", False, f"Exception: {str(e)}")
+
+    def test_export_cli(self):
+        """The command line exporter reads a data file without any GUI"""
+        try:
+            data_file = os.path.join(self.temp_dir, "event.json")
+            output = os.path.join(self.temp_dir, "results.csv")
+            engine = self._engine_with_boats(5)
+            with open(data_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "event_info": {"name": "Testregatta"},
+                        "participants": {
+                            boat: participant.to_dict()
+                            for boat, participant in engine.participants.items()
+                        },
+                    },
+                    f,
+                )
+
+            status = exporter.main(
+                [data_file, "-o", output, "--columns", "place,boat,score", "--event-info"]
+            )
+            with open(output, newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+
+            passed = (
+                status == 0
+                and rows[0] == ["Begivenhed:", "Testregatta"]
+                and rows[2] == ["Plads", "Båd", "Score"]
+                and [row[1] for row in rows[3:]] == ["1", "2", "3", "4", "5"]
+            )
+            self.log_test(
+                "Export CLI",
+                passed,
+                f"Exit status {status}, {len(rows) - 3} result rows",
+            )
+        except Exception as e:
+            self.log_test("Export CLI", False, f"Exception: {str(e)}")
+
+    def test_pdf_export_large_field(self):
+        """A big field is paged into one table per page, with progress and cancel"""
+        try:
+            if importlib.util.find_spec("reportlab") is None:
+                self.log_test(
+                    "PDF Export Large Field",
+                    True,
+                    "Skipped - reportlab not installed",
+                )
+                return
+
+            snapshot = exporter.result_snapshot(self._engine_with_boats(2000))
+            temp_dir = os.path.join(self.temp_dir, "pdf")
+            os.mkdir(temp_dir)
+            filename = os.path.join(temp_dir, "large.pdf")
+
+            progress = []
+            exporter.write_results_pdf(
+                filename, snapshot, 2, {"name": "Stor regatta"}, progress=progress.append
+            )
+            with open(filename, "rb") as f:
+                pages = f.read().count(b"/Type /Page\n")
+
+            # Cancelling half way through rendering must leave no file behind
+            cancelled_file = os.path.join(temp_dir, "cancelled.pdf")
+            cancel_progress = [0.0]
+            try:
+                exporter.write_results_pdf(
+                    cancelled_file,
+                    snapshot,
+                    2,
+                    {},
+                    progress=cancel_progress.append,
+                    cancelled=lambda: cancel_progress[-1] > 0.5,
+                )
+                cancelled = False
+            except exporter.ExportCancelled:
+                cancelled = True
+            leftovers = [
+                name for name in os.listdir(temp_dir) if name.startswith("cancelled")
+            ]
+
+            # About 38 rows fit a page; a split table would add pages
+            passed = (
+                50 <= pages <= 56
+                and progress[-1] == 1.0
+                and progress == sorted(progress)
+                and cancelled
+                and not leftovers
+            )
+            self.log_test(
+                "PDF Export Large Field",
+                passed,
+                f"{pages} pages for 2000 boats, {len(progress)} progress updates, "
+                f"cancel {'ok' if cancelled and not leftovers else 'failed'}",
+            )
+        except Exception as e:
+            self.log_test("PDF Export Large Field", False, f"Exception: {str(e)}")
+
+    def cleanup(self):
+        """Clean up test files"""
+        try:
+            if self.temp_dir:
+                shutil.rmtree(self.temp_dir)
+        except:
+            pass
+
+    def run_all_tests(self):
+        """Run all exporter tests"""
+        print("=" * 60)
+        print("ROWING TIMER - EXPORTER TESTS")
+        print("=" * 60)
+
+        if not self.setup():
+            print("Failed to setup test environment")
+            return False
+
+        try:
+            self.test_streaming_export_columns()
+            self.test_streaming_export_speed()
+            self.test_export_cli()
+            self.test_pdf_export_large_field()
+
+            # Summary
+            passed_tests = sum(1 for result in self.test_results if result["passed"])
+            total_tests = len(self.test_results)
+
+            print("\n" + "=" * 60)
+            print(f"EXPORTER TEST SUMMARY: {passed_tests}/{total_tests} PASSED")
+
+            if passed_tests == total_tests:
+                print("✅ ALL EXPORTER TESTS PASSED!")
+            else:
+                print("❌ SOME EXPORTER TESTS FAILED")
+                failed_tests = [r for r in self.test_results if not r["passed"]]
+                for test in failed_tests:
+                    print(f"   • {test['test']}: {test['message']}")
+
+            print("=" * 60)
+
+            return passed_tests == total_tests
+
+        finally:
+            self.cleanup()
+
+
+def main():
+    """Main test function"""
+    tester = ExporterTester()
+    success = tester.run_all_tests()
+
+    if not success:
+        print("\n⚠️ Some export features need attention.")
+
+    return success
+
+
+if __name__ == "__main__":
+    main()
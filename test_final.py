@@ -17,6 +17,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from rowing_timer import RowingTimer
+    from timing_engine import Participant
 except ImportError as e:
     print(f"Import error: {e}")
     print("Please ensure rowing_timer.py is in the same directory.")
@@ -120,7 +121,7 @@ class FinalTester:
 
             # Verify Run 1 times recorded
             run1_complete = all(
-                self.app.participants[boat]["run1_time"] is not None
+                self.app.participants[boat].time(1) is not None
                 for boat, _ in participants
             )
             if not run1_complete:
@@ -135,7 +136,7 @@ class FinalTester:
 
             # Verify Run 2 times recorded
             run2_complete = all(
-                self.app.participants[boat]["run2_time"] is not None
+                self.app.participants[boat].time(2) is not None
                 for boat, _ in participants
             )
             if not run2_complete:
@@ -161,13 +162,7 @@ class FinalTester:
         """Test that anti-blinking improvements are working"""
         try:
             # Add test participant
-            self.app.participants["TEST"] = {
-                "name": "Test Boat",
-                "run1_time": None,
-                "run2_time": None,
-                "run1_start": None,
-                "run2_start": None,
-            }
+            self.app.participants["TEST"] = Participant("Test Boat")
 
             # Set up widget storage
             self.app.boat_control_widgets = {
@@ -219,13 +214,7 @@ class FinalTester:
         """Test that timer stop operations don't show popups"""
         try:
             # Add test participant
-            self.app.participants["POPUP_TEST"] = {
-                "name": "Popup Test",
-                "run1_time": None,
-                "run2_time": None,
-                "run1_start": None,
-                "run2_start": None,
-            }
+            self.app.participants["POPUP_TEST"] = Participant("Popup Test")
 
             # Mock messagebox to detect popup calls
             with patch("rowing_timer.messagebox") as mock_messagebox:
@@ -327,7 +316,7 @@ class FinalTester:
             # Verify data was restored
             if len(self.app.participants) == 2:
                 persist1 = self.app.participants.get("PERSIST1")
-                if persist1 and persist1["name"] == "Persistence Test 1":
+                if persist1 and persist1.name == "Persistence Test 1":
                     self.log_test(
                         "Data Persistence",
                         True,
@@ -414,13 +403,7 @@ class FinalTester:
             # Add multiple test participants
             boats = ["SIMUL1", "SIMUL2", "SIMUL3"]
             for boat in boats:
-                self.app.participants[boat] = {
-                    "name": f"Simultaneous Test {boat[-1]}",
-                    "run1_time": None,
-                    "run2_time": None,
-                    "run1_start": None,
-                    "run2_start": None,
-                }
+                self.app.participants[boat] = Participant(f"Simultaneous Test {boat[-1]}")
 
             # Start multiple timers simultaneously
             for boat in boats:
@@ -438,7 +421,7 @@ class FinalTester:
                 completed_count = sum(
                     1
                     for boat in boats
-                    if self.app.participants[boat]["run1_time"] is not None
+                    if self.app.participants[boat].time(1) is not None
                 )
 
                 if completed_count == 3:
@@ -503,6 +486,12 @@ class FinalTester:
                 self.root.destroy()
             if self.temp_file and os.path.exists(self.temp_file.name):
                 os.unlink(self.temp_file.name)
+            if self.temp_file:
+                journal_file = os.path.splitext(self.temp_file.name)[0] + ".journal"
+                generations = [f"{self.temp_file.name}.{n}" for n in range(1, 4)]
+                for extra_file in [journal_file] + generations:
+                    if os.path.exists(extra_file):
+                        os.unlink(extra_file)
         except:
             pass
 
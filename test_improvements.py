@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from rowing_timer import RowingTimer
+    from timing_engine import Participant
 except ImportError as e:
     print(f"Import error: {e}")
     sys.exit(1)
@@ -73,13 +74,7 @@ class ImprovementTester:
         """Test that timer stop does not show popup dialog"""
         try:
             # Add a test participant
-            self.app.participants["TEST"] = {
-                "name": "Test Boat",
-                "run1_time": None,
-                "run2_time": None,
-                "run1_start": None,
-                "run2_start": None,
-            }
+            self.app.participants["TEST"] = Participant("Test Boat")
 
             # Mock messagebox to detect if it's called
             with patch("rowing_timer.messagebox") as mock_messagebox:
@@ -235,7 +230,7 @@ class ImprovementTester:
                 data = case["data"]
                 run = case["run"]
                 run_key = f"run{run}_time"
-                timer_key = f"{boat}_run{run}"
+                timer_key = (boat, int(run))
 
                 # Check current timers (empty for this test)
                 if timer_key in self.app.current_timers:
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for the Rowing Timer
+This script checks that per-click UI work stays flat as the field grows.
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+from unittest.mock import patch
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from rowing_timer import TIMER_TICK_MS, RowingTimer
+    from timing_engine import Participant
+except ImportError as e:
+    print(f"Import error: {e}")
+    sys.exit(1)
+
+
+class PerformanceTester:
+    """Benchmarks for the hot paths used during a race"""
+
+    def __init__(self):
+        self.test_results = []
+        self.temp_dir = tempfile.mkdtemp(prefix="rowing_perf_")
+
+    def log_test(self, test_name, passed, message=""):
+        """Log test results"""
+        status = "PASS" if passed else "FAIL"
+        print(f"[{status}] {test_name}: {message}")
+        self.test_results.append(
+            {"test": test_name, "passed": passed, "message": message}
+        )
+
+    def create_app(self, boat_count):
+        """Create an app with boat_count registered boats"""
+        root = tk.Tk()
+        root.withdraw()
+
+        app = RowingTimer(root)
+        app.data_file = os.path.join(self.temp_dir, f"bench_{boat_count}.json")
+        app.build_all_tabs()
+        app.participants = {
+            str(boat): Participant(f"Roer {boat}") for boat in range(1, boat_count + 1)
+        }
+        app.update_participants_display()
+        app.update_boat_controls()
+        return root, app
+
+    def time_clicks(self, boat_count, clicks=50):
+        """Average seconds for one START + STOP pair"""
+        root, app = self.create_app(boat_count)
+        try:
+            boats = [str(boat) for boat in range(1, clicks + 1)]
+            # Like timeit, keep the garbage collector out of the measurement
+            gc.disable()
+            try:
+                with patch("rowing_timer.messagebox"):
+                    started = time.perf_counter()
+                    for boat in boats:
+                        app.start_timer(boat)
+                        app.stop_timer(boat)
+                    elapsed = time.perf_counter() - started
+            finally:
+                gc.enable()
+            app.flush_storage()
+            return elapsed / clicks
+        finally:
+            root.destroy()
+
+    def test_participants_display_flat_in_n(self):
+        """Per-click cost of refreshing the participants list must not grow with N"""
+        try:
+            small = self.time_clicks(100)
+            large = self.time_clicks(1000)
+            ratio = large / small if small else float("inf")
+
+            self.log_test(
+                "Participants Refresh Flat In N",
+                ratio < 3.0,
+                f"100 boats: {small * 1000:.2f} ms/click, "
+                f"1000 boats: {large * 1000:.2f} ms/click (x{ratio:.1f})",
+            )
+        except Exception as e:
+            self.log_test(
+                "Participants Refresh Flat In N", False, f"Exception: {str(e)}"
+            )
+
+    def test_timing_rows_virtualized(self):
+        """Only visible boat rows exist as widgets and they are recycled on scroll"""
+        try:
+            root, app = self.create_app(1000)
+            try:
+                root.update_idletasks()
+                pool_size = len(app._boat_row_pool)
+                first_visible = set(app.boat_control_widgets)
+
+                # Scroll half way down and render the new range
+                app.boat_controls_canvas.yview_moveto(0.5)
+                app._render_visible_boat_rows()
+                middle_visible = set(app.boat_control_widgets)
+
+                # Registering another boat must reuse the pool, not rebuild it
+                rows_before = list(app._boat_row_pool)
+                app.participants["1001"] = Participant("Ny")
+                app.update_boat_controls()
+                rows_kept = all(
+                    a is b for a, b in zip(rows_before, app._boat_row_pool)
+                )
+
+                passed = (
+                    pool_size < 100
+                    and "1" in first_visible
+                    and "1" not in middle_visible
+                    and "500" in middle_visible
+                    and rows_kept
+                )
+                self.log_test(
+                    "Timing Rows Virtualized",
+                    passed,
+                    f"{pool_size} pooled rows for 1000 boats, "
+                    f"{len(middle_visible)} visible after scrolling",
+                )
+            finally:
+                root.destroy()
+        except Exception as e:
+            self.log_test("Timing Rows Virtualized", False, f"Exception: {str(e)}")
+
+    def test_running_timer_cpu_budget(self):
+        """200 running timers must stay well under the CPU budget per tick"""
+        budget = 0.10  # Fraction of one core spent rendering running timers
+        try:
+            root, app = self.create_app(200)
+            try:
+                app.notebook.select(app.timing_frame)
+                with patch("rowing_timer.messagebox"):
+                    for boat in range(1, 201):
+                        app.start_timer(str(boat))
+
+                ticks = 100
+                gc.disable()
+                try:
+                    started = time.perf_counter()
+                    for _ in range(ticks):
+                        app.update_running_timers()
+                    per_tick = (time.perf_counter() - started) / ticks
+                finally:
+                    gc.enable()
+                cpu_share = per_tick / (TIMER_TICK_MS / 1000)
+
+                self.log_test(
+                    "Running Timer CPU Budget",
+                    cpu_share < budget,
+                    f"{per_tick * 1000:.3f} ms per tick = {cpu_share:.1%} CPU "
+                    f"(budget {budget:.0%})",
+                )
+            finally:
+                app.flush_storage()
+                root.destroy()
+        except Exception as e:
+            self.log_test("Running Timer CPU Budget", False, f"Exception: {str(e)}")
+
+    def test_cold_start(self):
+        """Opening a saved 1000-boat event must be quick and build one tab only"""
+        budget = 0.30
+        try:
+            data_file = os.path.join(self.temp_dir, "cold_start.json")
+            root, app = self.create_app(1000)
+            try:
+                app.data_file = data_file
+                app.save_data()
+                app.flush_storage()
+            finally:
+                root.destroy()
+
+            root = tk.Tk()
+            root.withdraw()
+            try:
+                started = time.perf_counter()
+                app = RowingTimer(root, data_file=data_file)
+                elapsed = time.perf_counter() - started
+
+                passed = (
+                    elapsed < budget
+                    and len(app.participants) == 1000
+                    and app.participants_tree is None
+                    and app.results_tree is None
+                )
+                self.log_test(
+                    "Cold Start",
+                    passed,
+                    f"{elapsed * 1000:.1f} ms for 1000 boats "
+                    f"(budget {budget * 1000:.0f} ms), "
+                    f"{len(app._pending_tabs)} tabs deferred",
+                )
+                app.flush_storage()
+            finally:
+                root.destroy()
+        except Exception as e:
+            self.log_test("Cold Start", False, f"Exception: {str(e)}")
+
+    def test_bulk_import(self):
+        """Importing a 1000-boat start list must refresh and save once"""
+        budget = 0.5
+        try:
+            # Some boats are registered already, so the timing rows exist
+            root, app = self.create_app(100)
+            try:
+                start_list = os.path.join(self.temp_dir, "start_list.csv")
+                with open(start_list, "w", encoding="utf-8") as f:
+                    f.write("Båd;Navn\n")
+                    for boat in range(101, 1101):
+                        f.write(f"{boat};Roer {boat}\n")
+
+                with patch("rowing_timer.messagebox"), patch.object(
+                    app, "save_data", wraps=app.save_data
+                ) as save_data, patch.object(
+                    app, "update_boat_controls", wraps=app.update_boat_controls
+                ) as update_boat_controls:
+                    started = time.perf_counter()
+                    app.import_start_list(start_list)
+                    elapsed = time.perf_counter() - started
+
+                passed = (
+                    len(app.participants) == 1100
+                    and save_data.call_count == 1
+                    and update_boat_controls.call_count == 1
+                    and elapsed < budget
+                )
+                self.log_test(
+                    "Bulk Import",
+                    passed,
+                    f"1000 boats in {elapsed * 1000:.1f} ms "
+                    f"(budget {budget * 1000:.0f} ms), "
+                    f"{save_data.call_count} save, "
+                    f"{update_boat_controls.call_count} refresh",
+                )
+            finally:
+                app.flush_storage()
+                root.destroy()
+        except Exception as e:
+            self.log_test("Bulk Import", False, f"Exception: {str(e)}")
+
+    def test_hotkey_timing(self):
+        """Keyboard starts/stops must not dialog and must not scan the field"""
+        budget = 0.005  # Seconds per keystroke
+        try:
+            root, app = self.create_app(1000)
+            try:
+                with patch("rowing_timer.messagebox") as messagebox:
+                    # Staggered start: Enter on an empty field, 50 times
+                    gc.disable()
+                    try:
+                        started = time.perf_counter()
+                        for _ in range(50):
+                            app.toggle_boat("")
+                        per_key = (time.perf_counter() - started) / 50
+                    finally:
+                        gc.enable()
+
+                    app.toggle_boat("15")
+                    app.toggle_boat(" 3 ")
+                    refused = app.toggle_boat("3")
+                    unknown = app.toggle_boat("9999")
+                    app.engine.reset("2", 1)
+                    next_after_reset = app._next_unstarted_boat()
+
+                run_1 = app.engine.current_timers
+                passed = (
+                    len(run_1) == 47
+                    and ("51", 1) not in run_1
+                    and app.participants["15"].time(1) is not None
+                    and "allerede" in refused
+                    and "ikke tilmeldt" in unknown
+                    and next_after_reset == "2"
+                    and not messagebox.method_calls
+                    and per_key < budget
+                )
+                self.log_test(
+                    "Hotkey Timing",
+                    passed,
+                    f"{per_key * 1000:.2f} ms per keystroke with 1000 boats "
+                    f"(budget {budget * 1000:.0f} ms), "
+                    f"{len(messagebox.method_calls)} dialogs",
+                )
+            finally:
+                app.flush_storage()
+                root.destroy()
+        except Exception as e:
+            self.log_test("Hotkey Timing", False, f"Exception: {str(e)}")
+
+    def test_group_start(self):
+        """A group start is one timestamp, one journal write and one refresh"""
+        budget = 0.05  # Seconds for starting a heat of 20 boats, toast included
+        try:
+            root, app = self.create_app(1000)
+            try:
+                app.start_timer("5")
+                app.stop_timer("5")
+                heat = [str(boat) for boat in range(1, 21)]
+                app.select_group(heat)
+                app.save_heat("Heat 1")
+                app.select_group(())
+                app.select_heat("Heat 1")
+                selected = len(app._group_selection)
+
+                with patch.object(
+                    app.writer, "submit_records", wraps=app.writer.submit_records
+                ) as writes, patch.object(
+                    app,
+                    "update_participants_display",
+                    wraps=app.update_participants_display,
+                ) as refreshes, patch("rowing_timer.messagebox") as messagebox:
+                    gc.disable()
+                    try:
+                        started = time.perf_counter()
+                        start_ns = app.start_group()
+                        elapsed = time.perf_counter() - started
+                    finally:
+                        gc.enable()
+
+                starts = {app.engine.current_timers[(boat, 1)] for boat in heat}
+                grouped_undo = len(app._undo_stack[-1]) == len(heat)
+                undone = app.undo() and not app.engine.current_timers
+                passed = (
+                    selected == len(heat)
+                    and starts == {start_ns}
+                    and writes.call_count == 1
+                    and len(writes.call_args.args[1]) == len(heat)
+                    and [call.args for call in refreshes.call_args_list] == [(heat,)]
+                    and not messagebox.method_calls
+                    and grouped_undo
+                    and undone
+                    and app.participants["5"].time(1) is not None
+                    and elapsed < budget
+                )
+                self.log_test(
+                    "Group Start",
+                    passed,
+                    f"{len(heat)} boats in {elapsed * 1000:.2f} ms with 1000 boats "
+                    f"(budget {budget * 1000:.0f} ms), {writes.call_count} journal "
+                    f"write, {refreshes.call_count} participants refresh",
+                )
+            finally:
+                app.flush_storage()
+                root.destroy()
+        except Exception as e:
+            self.log_test("Group Start", False, f"Exception: {str(e)}")
+
+    def test_results_header_sort(self):
+        """Sorting 2000 results by a header must not read cells back from Tk"""
+        budget = 0.05  # Seconds for the first click on a column
+        try:
+            root, app = self.create_app(2000)
+            try:
+                for boat, participant in app.participants.items():
+                    participant.set_time_ns(1, 60_000_000_000 + int(boat) * 7919, "test")
+                    participant.set_time_ns(2, 61_000_000_000 - int(boat) * 104_729, "test")
+                app.refresh_results(app.engine.calculate_results())
+                tree = app.results_tree
+
+                with patch.object(tree, "set") as cell_reads, patch.object(
+                    tree, "move"
+                ) as moves:
+                    started = time.perf_counter()
+                    app.treeview_sort_column(tree, "Båd", False)
+                    first_click = time.perf_counter() - started
+                    by_boat = list(tree.get_children(""))
+
+                    started = time.perf_counter()
+                    app.treeview_sort_column(tree, "Båd", True)
+                    second_click = time.perf_counter() - started
+                    reversed_order = list(tree.get_children(""))
+
+                    app.treeview_sort_column(tree, "Konsistens Score", False)
+                    by_score = list(tree.get_children(""))
+
+                rows = app._result_rows
+                passed = (
+                    by_boat == [rows[str(boat)] for boat in range(1, 2001)]
+                    and reversed_order == by_boat[::-1]
+                    and by_score == [rows[boat] for boat in app.engine.leaderboard]
+                    and not cell_reads.called
+                    and not moves.called
+                    and first_click < budget
+                )
+                self.log_test(
+                    "Results Header Sort",
+                    passed,
+                    f"2000 rows: first click {first_click * 1000:.1f} ms "
+                    f"(budget {budget * 1000:.0f} ms), "
+                    f"reverse {second_click * 1000:.2f} ms",
+                )
+            finally:
+                app.flush_storage()
+                root.destroy()
+        except Exception as e:
+            self.log_test("Results Header Sort", False, f"Exception: {str(e)}")
+
+    def test_filter_boxes(self):
+        """Typing in the filter boxes must narrow 5000 boats within 10 ms"""
+        budget = 0.010  # Seconds per keystroke
+        try:
+            root, app = self.create_app(100)
+            try:
+                app.engine.register_many(
+                    [(str(boat), f"Roer {boat}") for boat in range(101, 5001)]
+                )
+                pool_before = list(app._boat_row_pool)
+
+                # Clicking into a filter box indexes the boats
+                started = time.perf_counter()
+                app.engine.prepare_search()
+                indexing = time.perf_counter() - started
+
+                worst = 0.0
+                gc.disable()
+                try:
+                    for variable in (app.participant_filter_var, app.timing_filter_var):
+                        for query in ("4", "42", "421", "4217", "roer 4217"):
+                            started = time.perf_counter()
+                            variable.set(query)
+                            worst = max(worst, time.perf_counter() - started)
+                finally:
+                    gc.enable()
+
+                tree = app.participants_tree
+                rows = app._participant_rows
+                shown_rows = list(tree.get_children(""))
+                shown_boats = list(app._boat_order)
+
+                # A new boat that matches appears in both filtered views
+                app.engine.register("14217", "Roer 14217")
+                added_rows = list(tree.get_children(""))
+                added_boats = list(app._boat_order)
+
+                app.participant_filter_var.set("")
+                app.timing_filter_var.set("")
+
+                passed = (
+                    shown_rows == [rows["4217"][0]]
+                    and shown_boats == ["4217"]
+                    and added_rows == [rows["4217"][0], rows["14217"][0]]
+                    and added_boats == ["4217", "14217"]
+                    and len(tree.get_children("")) == 5001
+                    and len(app._boat_order) == 5001
+                    and all(a is b for a, b in zip(pool_before, app._boat_row_pool))
+                    and worst < budget
+                )
+                self.log_test(
+                    "Filter Boxes",
+                    passed,
+                    f"worst keystroke {worst * 1000:.2f} ms at 5000 boats "
+                    f"(budget {budget * 1000:.0f} ms), indexed on focus in "
+                    f"{indexing * 1000:.0f} ms, {len(app._boat_row_pool)} pooled rows",
+                )
+            finally:
+                app.flush_storage()
+                root.destroy()
+        except Exception as e:
+            self.log_test("Filter Boxes", False, f"Exception: {str(e)}")
+
+    def run_all_tests(self):
+        """Run all benchmarks"""
+        print("=" * 70)
+        print("ROWING TIMER - PERFORMANCE BENCHMARKS")
+        print("=" * 70)
+
+        self.test_participants_display_flat_in_n()
+        self.test_timing_rows_virtualized()
+        self.test_running_timer_cpu_budget()
+        self.test_cold_start()
+        self.test_bulk_import()
+        self.test_hotkey_timing()
+        self.test_group_start()
+        self.test_results_header_sort()
+        self.test_filter_boxes()
+
+        passed_tests = sum(1 for result in self.test_results if result["passed"])
+        total_tests = len(self.test_results)
+
+        print("\n" + "=" * 70)
+        print(f"BENCHMARK SUMMARY: {passed_tests}/{total_tests} PASSED")
+        print("=" * 70)
+
+        return passed_tests == total_tests
+
+
+def main():
+    """Main benchmark function"""
+    tester = PerformanceTester()
+    return tester.run_all_tests()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Test script for the remote station API of the Rowing Timer
+These tests need no display: a server on a free local port is driven by
+stand-in station clients while a helper thread plays the Tk thread's part.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from remote_api import CommandQueue, RemoteApiServer, RemoteClient, parse_address
+    from timing_engine import TimingEngine
+except ImportError as e:
+    print(f"Import error: {e}")
+    sys.exit(1)
+
+
+class EngineOwner:
+    """Applies queued commands every millisecond, like the app's Tk loop"""
+
+    def __init__(self, engine, queue):
+        self.engine = engine
+        self.queue = queue
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.queue.drain(self.engine)
+            time.sleep(0.001)
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+
+
+class RemoteApiTester:
+    """Test class for the remote station API"""
+
+    def __init__(self):
+        self.test_results = []
+
+    def log_test(self, test_name, passed, message=""):
+        """Log test results"""
+        status = "PASS" if passed else "FAIL"
+        print(f"[{status}] {test_name}: {message}")
+        self.test_results.append(
+            {"test": test_name, "passed": passed, "message": message}
+        )
+
+    def start_server(self, boat_count=10, token=None):
+        """Engine with registered boats, a running server and its owner"""
+        engine = TimingEngine()
+        engine.register_many(
+            [(str(boat), f"Roer {boat}") for boat in range(1, boat_count + 1)]
+        )
+        queue = CommandQueue(engine.clock)
+        server = RemoteApiServer(queue, port=0, token=token)
+        server.start()
+        owner = EngineOwner(engine, queue)
+        return engine, server, owner
+
+    def stop_server(self, server, owner):
+        server.stop()
+        owner.close()
+
+    def test_start_stop_with_station_timestamps(self):
+        """Test that times come from the stations' timestamps, not arrival"""
+        try:
+            engine, server, owner = self.start_server()
+            try:
+                start_station = RemoteClient(port=server.port)
+                finish_station = RemoteClient(port=server.port)
+                start_station.sync()
+                finish_station.sync()
+
+                # Both presses happened a moment before their requests
+                pressed = start_station.now_ns() - 2_000_000_000
+                start_status, _ = start_station.start("3", 1, at_ns=pressed)
+                stop_status, data = finish_station.stop(
+                    "3", 1, at_ns=pressed + 1_234_567_890
+                )
+                start_station.close()
+                finish_station.close()
+
+                passed = (
+                    start_status == 200
+                    and stop_status == 200
+                    and data["time_ns"] == 1_234_567_890
+                    and engine.participants["3"].time_ns(1) == 1_234_567_890
+                )
+                self.log_test(
+                    "Start/Stop With Station Timestamps", passed, f"{data}"
+                )
+            finally:
+                self.stop_server(server, owner)
+        except Exception as e:
+            self.log_test(
+                "Start/Stop With Station Timestamps", False, f"Exception: {str(e)}"
+            )
+
+    def test_error_responses(self):
+        """Test status codes for bad commands, addresses, methods and tokens"""
+        try:
+            engine, server, owner = self.start_server(token="hemmelig")
+            try:
+                client = RemoteClient(port=server.port, token="hemmelig")
+                client.sync()
+                codes = [
+                    client.stop("1", 1)[0],  # Not running
+                    client.start("99", 1)[0],  # Not registered
+                    client.request("POST", "/api/boats/1/runs/1/jump", {})[0],
+                    client.request("POST", "/api/status")[0],
+                    client.request("POST", "/api/commands", {"action": "stop"})[0],
+                    # Backdated by an hour, and a minute in the future
+                    client.start("1", 1, at_ns=0)[0],
+                    client.start("1", 1, at_ns=client.now_ns() + 60_000_000_000)[0],
+                    # A batch with an entry without run queues nothing
+                    client.request(
+                        "POST",
+                        "/api/commands",
+                        [
+                            {"action": "start", "boat": "2", "run": 1},
+                            {"action": "start", "boat": "3"},
+                        ],
+                    )[0],
+                ]
+                client.close()
+
+                stranger = RemoteClient(port=server.port)
+                codes.append(stranger.request("GET", "/api/clock")[0])
+                stranger.close()
+
+                expected = [409, 400, 404, 405, 400, 400, 400, 400, 401]
+                passed = codes == expected and not engine.current_timers
+                self.log_test("Error Responses", passed, f"{codes}")
+            finally:
+                self.stop_server(server, owner)
+        except Exception as e:
+            self.log_test("Error Responses", False, f"Exception: {str(e)}")
+
+    def test_boat_ids_in_path(self):
+        """Test that boat IDs with spaces, "/", "?", "#" and "å" round-trip"""
+        try:
+            engine, server, owner = self.start_server(boat_count=0)
+            boats = ["Bå 3", "A/B", "1?2", "#7", "50%"]
+            engine.register_many([(boat, f"Roer {boat}") for boat in boats])
+            try:
+                client = RemoteClient(port=server.port)
+                client.sync()
+                pressed = client.now_ns() - 2_000_000_000
+                statuses = []
+                for boat in boats:
+                    statuses.append(client.start(boat, 1, at_ns=pressed)[0])
+                    statuses.append(
+                        client.stop(boat, 1, at_ns=pressed + 1_000_000_000)[0]
+                    )
+                client.close()
+
+                timed = [
+                    boat
+                    for boat in boats
+                    if engine.participants[boat].time_ns(1) == 1_000_000_000
+                ]
+                passed = statuses == [200] * len(statuses) and timed == boats
+                self.log_test(
+                    "Boat IDs In Path", passed, f"Statuses {statuses}, timed {timed}"
+                )
+            finally:
+                self.stop_server(server, owner)
+        except Exception as e:
+            self.log_test("Boat IDs In Path", False, f"Exception: {str(e)}")
+
+    def test_commands_applied_in_press_order(self):
+        """Test that a batch arriving out of order is applied by timestamp"""
+        try:
+            engine, server, owner = self.start_server()
+            try:
+                applied = []
+                engine.subscribe(
+                    lambda event, data: event == "stopped" and applied.append(data["boat"])
+                )
+                client = RemoteClient(port=server.port)
+                client.sync()
+                now = client.now_ns()
+                for boat in ("1", "2", "3"):
+                    client.start(boat, 1, at_ns=now)
+
+                # Boat 3 crossed first, boat 1 last
+                status, data = client.request(
+                    "POST",
+                    "/api/commands",
+                    [
+                        {"action": "stop", "boat": "1", "run": 1, "at_ns": now + 3_000},
+                        {"action": "stop", "boat": "2", "run": 1, "at_ns": now + 2_000},
+                        {"action": "stop", "boat": "3", "run": 1, "at_ns": now + 1_000},
+                        {"action": "stop", "boat": "4", "run": 1, "at_ns": now + 4_000},
+                    ],
+                )
+                client.close()
+
+                oks = [result["ok"] for result in data["results"]]
+                passed = (
+                    status == 200
+                    and applied == ["3", "2", "1"]
+                    and oks == [True, True, True, False]
+                    and data["results"][3]["status"] == 409
+                )
+                self.log_test(
+                    "Commands Applied In Press Order", passed, f"applied {applied}"
+                )
+            finally:
+                self.stop_server(server, owner)
+        except Exception as e:
+            self.log_test(
+                "Commands Applied In Press Order", False, f"Exception: {str(e)}"
+            )
+
+    def test_simultaneous_finishes(self):
+        """50 stations finishing at once must all be recorded quickly"""
+        budget = 0.05  # Worst request round trip in seconds
+        stations = 50
+        try:
+            engine, server, owner = self.start_server(boat_count=stations)
+            try:
+                clients = [RemoteClient(port=server.port) for _ in range(stations)]
+                for boat, client in enumerate(clients, 1):
+                    client.sync(samples=2)
+                    client.start(str(boat), 1)
+
+                barrier = threading.Barrier(stations)
+
+                def finish(boat):
+                    client = clients[boat - 1]
+                    barrier.wait()
+                    sent = time.perf_counter()
+                    status, _ = client.stop(str(boat), 1)
+                    return status, time.perf_counter() - sent
+
+                with ThreadPoolExecutor(max_workers=stations) as pool:
+                    outcomes = list(pool.map(finish, range(1, stations + 1)))
+                for client in clients:
+                    client.close()
+
+                worst = max(latency for _, latency in outcomes)
+                recorded = sum(
+                    participant.time_ns(1) is not None
+                    for participant in engine.participants.values()
+                )
+                passed = (
+                    all(status == 200 for status, _ in outcomes)
+                    and recorded == stations
+                    and worst < budget
+                )
+                self.log_test(
+                    "Simultaneous Finishes",
+                    passed,
+                    f"{recorded}/{stations} recorded, worst round trip "
+                    f"{worst * 1000:.1f} ms (budget {budget * 1000:.0f} ms)",
+                )
+            finally:
+                self.stop_server(server, owner)
+        except Exception as e:
+            self.log_test("Simultaneous Finishes", False, f"Exception: {str(e)}")
+
+    def test_parse_address(self):
+        """Test the accepted forms of the API address setting"""
+        try:
+            parsed = [
+                parse_address("1"),
+                parse_address("9000"),
+                parse_address(":9000"),
+                parse_address("0.0.0.0:9000"),
+                parse_address("timer.local"),
+            ]
+            expected = [
+                ("127.0.0.1", 8765),
+                ("127.0.0.1", 9000),
+                ("127.0.0.1", 9000),
+                ("0.0.0.0", 9000),
+                ("timer.local", 8765),
+            ]
+            self.log_test("Parse Address", parsed == expected, f"{parsed}")
+        except Exception as e:
+            self.log_test("Parse Address", False, f"Exception: {str(e)}")
+
+    def run_all_tests(self):
+        """Run all remote API tests"""
+        print("=" * 60)
+        print("ROWING TIMER - REMOTE API TESTS")
+        print("=" * 60)
+
+        self.test_start_stop_with_station_timestamps()
+        self.test_error_responses()
+        self.test_boat_ids_in_path()
+        self.test_commands_applied_in_press_order()
+        self.test_simultaneous_finishes()
+        self.test_parse_address()
+
+        # Summary
+        passed_tests = sum(1 for result in self.test_results if result["passed"])
+        total_tests = len(self.test_results)
+
+        print("\n" + "=" * 60)
+        print(f"REMOTE API TEST SUMMARY: {passed_tests}/{total_tests} PASSED")
+
+        if passed_tests == total_tests:
+            print("✅ ALL REMOTE API TESTS PASSED!")
+        else:
+            print("❌ SOME REMOTE API TESTS FAILED")
+
+        print("=" * 60)
+
+        return passed_tests == total_tests
+
+
+def main():
+    """Main test function"""
+    tester = RemoteApiTester()
+    return tester.run_all_tests()
+
+
+if __name__ == "__main__":
+    main()
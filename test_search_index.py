@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test script for the boat search index of the Rowing Timer
+These tests need no display and drive the index through the timing engine.
+"""
+
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from search_index import SearchIndex
+    from timing_engine import Participant, TimingEngine
+except ImportError as e:
+    print(f"Import error: {e}")
+    sys.exit(1)
+
+
+class SearchIndexTester:
+    """Test class for the search index"""
+
+    def __init__(self):
+        self.test_results = []
+
+    def log_test(self, test_name, passed, message=""):
+        """Log test results"""
+        status = "PASS" if passed else "FAIL"
+        print(f"[{status}] {test_name}: {message}")
+        self.test_results.append(
+            {"test": test_name, "passed": passed, "message": message}
+        )
+
+    def test_matches(self):
+        """Test short, long, multi-word and mixed-case queries"""
+        try:
+            index = SearchIndex()
+            index.add("B12", "Søren Hansen")
+            index.add("B120", "Anne Roer")
+            index.add("7", "Roe Oer")  # Has the trigrams of "roer", not the word
+            index.add("C3", "Mads Sørensen")
+
+            results = {
+                "": index.search(""),
+                "b12": index.search("b12"),
+                "SØREN": index.search("SØREN"),
+                "roer": index.search("roer"),
+                "sen mads": index.search("sen mads"),
+                "xyz": index.search("xyz"),
+            }
+            expected = {
+                "": None,
+                "b12": {"B12", "B120"},
+                "SØREN": {"B12", "C3"},
+                "roer": {"B120"},
+                "sen mads": {"C3"},
+                "xyz": set(),
+            }
+            self.log_test("Matches", results == expected, f"{results}")
+        except Exception as e:
+            self.log_test("Matches", False, f"Exception: {str(e)}")
+
+    def test_kept_up_to_date(self):
+        """Test that registrations and removals update the engine's index"""
+        try:
+            engine = TimingEngine()
+            engine.register("1", "Ida Holm")
+            engine.register_many([("2", "Bo Holm"), ("3", "Eva Lund")])
+            before = engine.find("holm")
+            engine.remove("1")
+            engine.register("4", "Jens Holmgaard")
+            after = engine.find("holm")
+
+            # Loading a new event indexes it again on the next search
+            engine.load({"9": Participant("Holm Nielsen")})
+            loaded = engine.find("holm")
+
+            passed = (
+                before == {"1", "2"}
+                and after == {"2", "4"}
+                and loaded == {"9"}
+            )
+            self.log_test(
+                "Kept Up To Date", passed, f"{before} -> {after} -> {loaded}"
+            )
+        except Exception as e:
+            self.log_test("Kept Up To Date", False, f"Exception: {str(e)}")
+
+    def test_keystroke_speed(self):
+        """Each keystroke of a query must be answered fast at 5000 boats"""
+        # Seconds per keystroke: half of the 10 ms a keystroke may take,
+        # the views get the rest
+        budget = 0.005
+        try:
+            engine = TimingEngine()
+            engine.register_many(
+                [(f"B{boat}", f"Roer {boat} Klub {boat % 37}") for boat in range(5000)]
+            )
+            engine.find("x")  # Build the index
+
+            query = "roer 4217"
+            worst = 0.0
+            for length in range(1, len(query) + 1):
+                started = time.perf_counter()
+                matches = engine.find(query[:length])
+                worst = max(worst, time.perf_counter() - started)
+
+            self.log_test(
+                "Keystroke Speed",
+                matches == {"B4217"} and worst < budget,
+                f"worst keystroke {worst * 1000:.2f} ms at 5000 boats "
+                f"(budget {budget * 1000:.0f} ms)",
+            )
+        except Exception as e:
+            self.log_test("Keystroke Speed", False, f"Exception: {str(e)}")
+
+    def run_all_tests(self):
+        """Run all search index tests"""
+        print("=" * 60)
+        print("ROWING TIMER - SEARCH INDEX TESTS")
+        print("=" * 60)
+
+        self.test_matches()
+        self.test_kept_up_to_date()
+        self.test_keystroke_speed()
+
+        # Summary
+        passed_tests = sum(1 for result in self.test_results if result["passed"])
+        total_tests = len(self.test_results)
+
+        print("\n" + "=" * 60)
+        print(f"SEARCH INDEX TEST SUMMARY: {passed_tests}/{total_tests} PASSED")
+
+        if passed_tests == total_tests:
+            print("✅ ALL SEARCH INDEX TESTS PASSED!")
+        else:
+            print("❌ SOME SEARCH INDEX TESTS FAILED")
+
+        print("=" * 60)
+
+        return passed_tests == total_tests
+
+
+def main():
+    """Main test function"""
+    tester = SearchIndexTester()
+    return tester.run_all_tests()
+
+
+if __name__ == "__main__":
+    main()
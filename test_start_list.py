@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script for start list import in the Rowing Timer
+These tests need no display and read start lists in the formats Excel writes.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import zipfile
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from start_list import NOT_TEXT_PROBLEM, parse_start_list, read_start_list
+except ImportError as e:
+    print(f"Import error: {e}")
+    sys.exit(1)
+
+
+class StartListTester:
+    """Test class for start list parsing"""
+
+    def __init__(self):
+        self.test_results = []
+        self.temp_dir = tempfile.mkdtemp(prefix="rowing_start_list_")
+
+    def log_test(self, test_name, passed, message=""):
+        """Log test results"""
+        status = "PASS" if passed else "FAIL"
+        print(f"[{status}] {test_name}: {message}")
+        self.test_results.append(
+            {"test": test_name, "passed": passed, "message": message}
+        )
+
+    def write_file(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_excel_semicolon_csv(self):
+        """Test Danish Excel CSV: BOM, semicolons, header in any column order"""
+        try:
+            path = self.write_file(
+                "excel.csv",
+                "\ufeffNavn;Klub;Båd\r\n"
+                "\"Jensen; Ida\";Skælskør;12\r\n"
+                ";;\r\n"
+                "Bo Æbelø;Korsør;7\r\n".encode("utf-8"),
+            )
+            entries, problems = read_start_list(path)
+            expected = [("12", "Jensen; Ida"), ("7", "Bo Æbelø")]
+            self.log_test(
+                "Excel Semicolon CSV",
+                entries == expected and not problems,
+                f"{entries} {problems}",
+            )
+        except Exception as e:
+            self.log_test("Excel Semicolon CSV", False, f"Exception: {str(e)}")
+
+    def test_tsv_without_header(self):
+        """Test tab-separated lists without a header, also in the Windows code page"""
+        try:
+            path = self.write_file(
+                "list.tsv", "1\tSøren\n2\tÅse\n".encode("cp1252")
+            )
+            entries, problems = read_start_list(path)
+            expected = [("1", "Søren"), ("2", "Åse")]
+            self.log_test(
+                "TSV Without Header",
+                entries == expected and not problems,
+                f"{entries} {problems}",
+            )
+        except Exception as e:
+            self.log_test("TSV Without Header", False, f"Exception: {str(e)}")
+
+    def test_problem_lines(self):
+        """Test that short lines are reported with their line numbers"""
+        try:
+            entries, problems = parse_start_list("Båd,Navn\n1,Ida\n2\n3,Bo\n")
+            passed = (
+                entries == [("1", "Ida"), ("3", "Bo")]
+                and len(problems) == 1
+                and problems[0].startswith("Linje 3:")
+            )
+            self.log_test("Problem Lines", passed, f"{problems}")
+        except Exception as e:
+            self.log_test("Problem Lines", False, f"Exception: {str(e)}")
+
+    def test_not_text_files(self):
+        """Test that workbooks and undecodable files are reported, not raised"""
+        try:
+            workbook = io.BytesIO()
+            with zipfile.ZipFile(workbook, "w") as archive:
+                archive.writestr("xl/workbook.xml", "<workbook/>")
+            xlsx = self.write_file("list.xlsx", workbook.getvalue())
+            # 0x81 is neither UTF-8 nor defined in the Windows code page
+            undecodable = self.write_file("list.csv", b"1;S\x81ren\r\n2;Bo\r\n")
+
+            results = [read_start_list(xlsx), read_start_list(undecodable)]
+            passed = all(
+                entries == [] and problems == [NOT_TEXT_PROBLEM]
+                for entries, problems in results
+            )
+            self.log_test("Not Text Files", passed, f"{results}")
+        except Exception as e:
+            self.log_test("Not Text Files", False, f"Exception: {str(e)}")
+
+    def run_all_tests(self):
+        """Run all start list tests"""
+        print("=" * 60)
+        print("ROWING TIMER - START LIST TESTS")
+        print("=" * 60)
+
+        self.test_excel_semicolon_csv()
+        self.test_tsv_without_header()
+        self.test_problem_lines()
+        self.test_not_text_files()
+
+        # Summary
+        passed_tests = sum(1 for result in self.test_results if result["passed"])
+        total_tests = len(self.test_results)
+
+        print("\n" + "=" * 60)
+        print(f"START LIST TEST SUMMARY: {passed_tests}/{total_tests} PASSED")
+
+        if passed_tests == total_tests:
+            print("✅ ALL START LIST TESTS PASSED!")
+        else:
+            print("❌ SOME START LIST TESTS FAILED")
+
+        print("=" * 60)
+
+        return passed_tests == total_tests
+
+
+def main():
+    """Main test function"""
+    tester = StartListTester()
+    return tester.run_all_tests()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Test script for the Rowing Timer persistence layer
+This script tests the event journal without needing a display.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from storage import (
+        BackgroundWriter,
+        EventJournal,
+        JsonStorage,
+        SqliteStorage,
+        import_json_to_sqlite,
+        generation_path,
+        journal_path_for,
+        read_snapshot,
+        replay_journal,
+        sqlite_path_for,
+        write_snapshot,
+    )
+    from timing_engine import Participant
+except ImportError as e:
+    print(f"Import error: {e}")
+    sys.exit(1)
+
+
+class StorageTester:
+    """Test class for journal and snapshot persistence"""
+
+    def __init__(self):
+        self.test_results = []
+        self.temp_dir = None
+
+    def log_test(self, test_name, passed, message=""):
+        """Log test results"""
+        status = "PASS" if passed else "FAIL"
+        print(f"[{status}] {test_name}: {message}")
+        self.test_results.append(
+            {"test": test_name, "passed": passed, "message": message}
+        )
+
+    def setup(self):
+        """Create a scratch directory for data files"""
+        self.temp_dir = tempfile.mkdtemp(prefix="rowing_storage_")
+        self.data_file = os.path.join(self.temp_dir, "rowing_data.json")
+        return True
+
+    def test_journal_path(self):
+        """Test that the journal lives next to the snapshot file"""
+        try:
+            path = journal_path_for(self.data_file)
+            expected = os.path.join(self.temp_dir, "rowing_data.journal")
+            self.log_test("Journal Path", path == expected, path)
+        except Exception as e:
+            self.log_test("Journal Path", False, f"Exception: {str(e)}")
+
+    def test_journal_append_and_replay(self):
+        """Test that appended records rebuild participant state"""
+        try:
+            journal = EventJournal(journal_path_for(self.data_file))
+            journal.append({"seq": 1, "op": "register", "boat": "7", "name": "Ida"})
+            journal.append({"seq": 2, "op": "start", "boat": "7", "run": "1", "start": 100.0})
+            journal.append({"seq": 3, "op": "stop", "boat": "7", "run": "1", "time": 61.5})
+            journal.append({"seq": 4, "op": "start", "boat": "7", "run": "2", "start": 200.0})
+            journal.append({"seq": 5, "op": "reset", "boat": "7", "run": "2"})
+            journal.close()
+
+            participants = {}
+            last_seq = replay_journal(participants, journal.read())
+            boat = participants["7"]
+
+            passed = (
+                last_seq == 5
+                and boat.name == "Ida"
+                and boat.time(1) == 61.5
+                and boat.start(1) == 100.0
+                and boat.start(2) is None
+            )
+            self.log_test(
+                "Journal Replay", passed, f"seq={last_seq}, participant={boat}"
+            )
+        except Exception as e:
+            self.log_test("Journal Replay", False, f"Exception: {str(e)}")
+
+    def test_replay_skips_compacted_records(self):
+        """Test that records already folded into the snapshot are not re-applied"""
+        try:
+            participants = {"1": Participant.from_dict({"name": "Snapshot", "run1_time": 50.0})}
+            records = [
+                {"seq": 1, "op": "register", "boat": "2", "name": "Removed later"},
+                {"seq": 2, "op": "reset", "boat": "1", "run": "1"},
+                {"seq": 3, "op": "stop", "boat": "1", "run": "2", "time": 52.0},
+            ]
+            last_seq = replay_journal(participants, records, after_seq=2)
+
+            passed = (
+                last_seq == 3
+                and "2" not in participants
+                and participants["1"].time(1) == 50.0
+                and participants["1"].time(2) == 52.0
+            )
+            self.log_test("Compacted Records Skipped", passed, f"seq={last_seq}")
+        except Exception as e:
+            self.log_test("Compacted Records Skipped", False, f"Exception: {str(e)}")
+
+    def test_torn_record_ignored(self):
+        """Test that a half-written last line neither breaks loading nor the next append"""
+        try:
+            path = journal_path_for(self.data_file)
+            journal = EventJournal(path)
+            journal.truncate()
+            journal.append({"seq": 1, "op": "register", "boat": "9", "name": "Bo"})
+            journal.close()
+            with open(path, "a", encoding="utf-8") as f:
+                f.write('{"seq":2,"op":"stop","bo')
+
+            torn = journal.read()
+            # The first record after the restart must not be lost with the tear
+            journal.append({"seq": 3, "op": "register", "boat": "10", "name": "Eva"})
+            journal.close()
+
+            records = journal.read()
+            passed = (
+                [record["seq"] for record in torn] == [1]
+                and [record["seq"] for record in records] == [1, 3]
+            )
+            self.log_test("Torn Record Ignored", passed, f"{len(records)} records read")
+        except Exception as e:
+            self.log_test("Torn Record Ignored", False, f"Exception: {str(e)}")
+
+    def test_truncate(self):
+        """Test that compaction empties the journal"""
+        try:
+            journal = EventJournal(journal_path_for(self.data_file))
+            journal.append({"seq": 10, "op": "register", "boat": "1", "name": "A"})
+            journal.truncate()
+            self.log_test("Journal Truncate", journal.read() == [], "Journal emptied")
+        except Exception as e:
+            self.log_test("Journal Truncate", False, f"Exception: {str(e)}")
+
+    def test_writer_coalesces_snapshots(self):
+        """Test that only the latest of several queued snapshots is written"""
+        try:
+            writer = BackgroundWriter()
+            storage = JsonStorage(self.data_file)
+
+            # Hold the writer busy so the snapshots pile up behind it
+            gate = threading.Event()
+            original_write = writer._write_batch
+            written = []
+
+            def slow_write(batch):
+                gate.wait(5)
+                written.append(batch)
+                original_write(batch)
+
+            writer._write_batch = slow_write
+            writer.submit_record(storage, {"seq": 1, "op": "register"})
+            for version in range(1, 6):
+                writer.submit_snapshot(storage, {"participants": {}, "version": version})
+            gate.set()
+            writer.close()
+
+            with open(self.data_file, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+
+            snapshots = sum(
+                1 for batch in written for item in batch if item[0] == "snapshot"
+            )
+            passed = saved["version"] == 5 and snapshots <= 2
+            self.log_test(
+                "Writer Coalescing",
+                passed,
+                f"latest version={saved['version']}, snapshots handed to disk={snapshots}",
+            )
+        except Exception as e:
+            self.log_test("Writer Coalescing", False, f"Exception: {str(e)}")
+
+    def test_writer_reports_errors(self):
+        """Test that write errors reach the error callback instead of raising"""
+        try:
+            errors = []
+            writer = BackgroundWriter(on_error=errors.append)
+            bad_file = os.path.join(self.temp_dir, "missing_dir", "data.json")
+            writer.submit_snapshot(JsonStorage(bad_file), {})
+            writer.close()
+
+            self.log_test(
+                "Writer Error Reporting",
+                len(errors) == 1,
+                f"{len(errors)} error(s) reported",
+            )
+        except Exception as e:
+            self.log_test("Writer Error Reporting", False, f"Exception: {str(e)}")
+
+    def test_snapshot_generations(self):
+        """Test that snapshots rotate and loading skips a damaged data file"""
+        try:
+            data_file = os.path.join(self.temp_dir, "generations.json")
+            for version in range(1, 6):
+                write_snapshot(data_file, {"participants": {}, "version": version})
+
+            kept = [
+                json.load(open(generation_path(data_file, n), encoding="utf-8"))["version"]
+                for n in range(1, 4)
+            ]
+            leftovers = not os.path.exists(generation_path(data_file, 4)) and not (
+                os.path.exists(data_file + ".tmp")
+            )
+
+            # Simulate a write torn by a power cut
+            with open(data_file, "w", encoding="utf-8") as f:
+                f.write('{"participants": {"1": {"na')
+            recovered = read_snapshot(data_file)
+
+            passed = kept == [4, 3, 2] and leftovers and recovered["version"] == 4
+            self.log_test(
+                "Snapshot Generations",
+                passed,
+                f"generations={kept}, recovered version={recovered['version']}",
+            )
+        except Exception as e:
+            self.log_test("Snapshot Generations", False, f"Exception: {str(e)}")
+
+    def test_sqlite_round_trip(self):
+        """Test that SQLite stores each timing event as a row and reloads it"""
+        try:
+            data_file = os.path.join(self.temp_dir, "sqlite_event.json")
+            storage = SqliteStorage(data_file)
+            storage.save_snapshot(
+                {"event_info": {"name": "Regatta"}, "participants": {}, "journal_seq": 0}
+            )
+            storage.append_many(
+                [
+                    {"seq": 1, "op": "register", "boat": "5", "name": "Eva"},
+                    {"seq": 2, "op": "start", "boat": "5", "run": 1, "start": 100.0},
+                    {"seq": 3, "op": "stop", "boat": "5", "run": 1,
+                     "time": 61.5, "time_ns": 61_500_000_000, "clock": "perf_counter_ns"},
+                    {"seq": 4, "op": "start", "boat": "5", "run": 2, "start": 200.0},
+                    {"seq": 5, "op": "reset", "boat": "5", "run": 2},
+                ]
+            )
+            storage.close()
+
+            data = SqliteStorage(data_file).load_snapshot()
+            boat = data["participants"]["5"]
+            mode = sqlite3.connect(sqlite_path_for(data_file)).execute(
+                "PRAGMA journal_mode"
+            ).fetchone()[0]
+
+            passed = (
+                data["event_info"]["name"] == "Regatta"
+                and boat["name"] == "Eva"
+                and boat["run1_time_ns"] == 61_500_000_000
+                and boat["run1_start"] == 100.0
+                and "run2_start" not in boat
+                and mode == "wal"
+            )
+            self.log_test("SQLite Round Trip", passed, f"journal_mode={mode}, boat={boat}")
+        except Exception as e:
+            self.log_test("SQLite Round Trip", False, f"Exception: {str(e)}")
+
+    def test_sqlite_imports_legacy_json(self):
+        """Test that the importer handles the legacy flat rowing_data.json"""
+        try:
+            data_file = os.path.join(self.temp_dir, "legacy.json")
+            with open(data_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"B1": {"name": "Gammel", "run1_time": 60.0, "run2_time": 61.0,
+                            "run1_start": None, "run2_start": None}},
+                    f,
+                )
+            EventJournal(journal_path_for(data_file)).append(
+                {"seq": 1, "op": "register", "boat": "B2", "name": "Ny"}
+            )
+
+            imported = import_json_to_sqlite(data_file)
+            data = SqliteStorage(data_file).load_snapshot()
+
+            passed = (
+                imported == 2
+                and data["participants"]["B1"]["run2_time"] == 61.0
+                and data["participants"]["B2"]["name"] == "Ny"
+                and data["journal_seq"] == 1
+            )
+            self.log_test("SQLite Legacy Import", passed, f"{imported} participants imported")
+        except Exception as e:
+            self.log_test("SQLite Legacy Import", False, f"Exception: {str(e)}")
+
+    def cleanup(self):
+        """Clean up test files"""
+        try:
+            if self.temp_dir:
+                shutil.rmtree(self.temp_dir)
+        except:
+            pass
+
+    def run_all_tests(self):
+        """Run all storage tests"""
+        print("=" * 60)
+        print("ROWING TIMER - STORAGE TESTS")
+        print("=" * 60)
+
+        if not self.setup():
+            print("Failed to setup test environment")
+            return False
+
+        try:
+            self.test_journal_path()
+            self.test_journal_append_and_replay()
+            self.test_replay_skips_compacted_records()
+            self.test_torn_record_ignored()
+            self.test_truncate()
+            self.test_writer_coalesces_snapshots()
+            self.test_writer_reports_errors()
+            self.test_snapshot_generations()
+            self.test_sqlite_round_trip()
+            self.test_sqlite_imports_legacy_json()
+
+            # Summary
+            passed_tests = sum(1 for result in self.test_results if result["passed"])
+            total_tests = len(self.test_results)
+
+            print("\n" + "=" * 60)
+            print(f"STORAGE TEST SUMMARY: {passed_tests}/{total_tests} PASSED")
+
+            if passed_tests == total_tests:
+                print("✅ ALL STORAGE TESTS PASSED!")
+            else:
+                print("❌ SOME STORAGE TESTS FAILED")
+                failed_tests = [r for r in self.test_results if not r["passed"]]
+                for test in failed_tests:
+                    print(f"   • {test['test']}: {test['message']}")
+
+            print("=" * 60)
+
+            return passed_tests == total_tests
+
+        finally:
+            self.cleanup()
+
+
+def main():
+    """Main test function"""
+    tester = StorageTester()
+    success = tester.run_all_tests()
+
+    if not success:
+        print("\n⚠️ Some persistence features need attention.")
+
+    return success
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test script for time display formatting in the Rowing Timer
+These tests need no display. The microbenchmarks compare the integer,
+cached formatting with the float formatting it replaced.
+"""
+
+import os
+import sys
+import timeit
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from time_format import (
+        format_ms,
+        format_running_tenths,
+        format_time_ns,
+        ns_to_ms,
+        seconds_to_ms,
+    )
+except ImportError as e:
+    print(f"Import error: {e}")
+    sys.exit(1)
+
+
+def float_format_time(seconds):
+    """The float formatting used before, as the benchmark baseline"""
+    minutes = int(seconds // 60)
+    secs = seconds % 60
+    return f"{minutes:02d}:{secs:06.3f}"
+
+
+def float_format_running_time(seconds):
+    minutes, tenths = divmod(int(seconds * 10), 600)
+    return f"{minutes:02d}:{tenths // 10:02d}.{tenths % 10}"
+
+
+class TimeFormatTester:
+    """Test class for time formatting"""
+
+    def __init__(self):
+        self.test_results = []
+
+    def log_test(self, test_name, passed, message=""):
+        """Log test results"""
+        status = "PASS" if passed else "FAIL"
+        print(f"[{status}] {test_name}: {message}")
+        self.test_results.append(
+            {"test": test_name, "passed": passed, "message": message}
+        )
+
+    def best_time(self, statement, number):
+        """Best of five timeit runs (timeit keeps the collector out)"""
+        return min(timeit.repeat(statement, number=number, repeat=5))
+
+    def test_formats(self):
+        """Test finished and running times, including rounding at the edges"""
+        try:
+            cases = [
+                (format_time_ns(65_123_000_000), "01:05.123"),
+                (format_time_ns(500_000_000), "00:00.500"),
+                (format_time_ns(3_661_123_000_000), "61:01.123"),
+                (format_time_ns(59_999_600_000), "01:00.000"),  # Rounds up
+                (format_time_ns(1_499_999), "00:00.001"),
+                (format_time_ns(None), "-"),
+                (format_ms(seconds_to_ms(125.999)), "02:05.999"),
+                (format_ms(ns_to_ms(42_000_499_999)), "00:42.000"),
+                (format_running_tenths(0), "00:00.0"),
+                (format_running_tenths(659), "01:05.9"),
+                (format_running_tenths(36_611), "61:01.1"),
+            ]
+            wrong = [(got, expected) for got, expected in cases if got != expected]
+            self.log_test("Formats", not wrong, f"{wrong}" if wrong else "All formats correct")
+        except Exception as e:
+            self.log_test("Formats", False, f"Exception: {str(e)}")
+
+    def test_refresh_benchmark(self):
+        """Formatting 2000 finished times per refresh must beat the float version"""
+        try:
+            times_ns = [60_000_000_000 + boat * 7_919_123 for boat in range(2000)]
+            seconds = [ns / 1e9 for ns in times_ns]
+            refreshes = 20
+
+            cached = self.best_time(
+                lambda: [format_time_ns(ns) for ns in times_ns], refreshes
+            )
+            baseline = self.best_time(
+                lambda: [float_format_time(s) for s in seconds], refreshes
+            )
+
+            per_cell_ns = cached / (refreshes * len(times_ns)) * 1e9
+            self.log_test(
+                "Refresh Benchmark",
+                cached < baseline,
+                f"{per_cell_ns:.0f} ns per cell, "
+                f"{baseline / cached:.1f}x faster than float formatting",
+            )
+        except Exception as e:
+            self.log_test("Refresh Benchmark", False, f"Exception: {str(e)}")
+
+    def test_running_benchmark(self):
+        """A minute of 50 ms ticks for 50 running timers must beat the float version"""
+        try:
+            ticks = [
+                (tick * 50_000_000 + boat * 3_000_000_000) // 100_000_000
+                for tick in range(1200)
+                for boat in range(50)
+            ]
+            seconds = [tenths / 10 + 0.05 for tenths in ticks]
+
+            cached = self.best_time(
+                lambda: [format_running_tenths(tenths) for tenths in ticks], 1
+            )
+            baseline = self.best_time(
+                lambda: [float_format_running_time(s) for s in seconds], 1
+            )
+
+            per_tick_ns = cached / len(ticks) * 1e9
+            self.log_test(
+                "Running Timer Benchmark",
+                cached < baseline,
+                f"{per_tick_ns:.0f} ns per timer tick, "
+                f"{baseline / cached:.1f}x faster than float formatting",
+            )
+        except Exception as e:
+            self.log_test("Running Timer Benchmark", False, f"Exception: {str(e)}")
+
+    def run_all_tests(self):
+        """Run all time format tests"""
+        print("=" * 60)
+        print("ROWING TIMER - TIME FORMAT TESTS")
+        print("=" * 60)
+
+        self.test_formats()
+        self.test_refresh_benchmark()
+        self.test_running_benchmark()
+
+        # Summary
+        passed_tests = sum(1 for result in self.test_results if result["passed"])
+        total_tests = len(self.test_results)
+
+        print("\n" + "=" * 60)
+        print(f"TIME FORMAT TEST SUMMARY: {passed_tests}/{total_tests} PASSED")
+
+        if passed_tests == total_tests:
+            print("✅ ALL TIME FORMAT TESTS PASSED!")
+        else:
+            print("❌ SOME TIME FORMAT TESTS FAILED")
+
+        print("=" * 60)
+
+        return passed_tests == total_tests
+
+
+def main():
+    """Main test function"""
+    tester = TimeFormatTester()
+    return tester.run_all_tests()
+
+
+if __name__ == "__main__":
+    main()
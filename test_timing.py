@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+"""
+Test script for the headless timing core of the Rowing Timer
+These tests need no display and exercise clock and timing logic directly.
+"""
+
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from clock import (
+        Clock,
+        EventTimeMapper,
+        MonotonicClock,
+        PerfCounterClock,
+        get_clock,
+    )
+    from timing_engine import (
+        GroupStartError,
+        Participant,
+        RegistrationError,
+        TimerStateError,
+        TimingEngine,
+        TimingError,
+        natural_key,
+    )
+except ImportError as e:
+    print(f"Import error: {e}")
+    sys.exit(1)
+
+
+class ManualClock(Clock):
+    """Clock that only moves when a test advances it"""
+
+    name = "manual"
+
+    def __init__(self):
+        self.value = 0
+        super().__init__()
+
+    def now_ns(self):
+        return self.value
+
+
+class TimingTester:
+    """Test class for the timing core"""
+
+    def __init__(self):
+        self.test_results = []
+
+    def log_test(self, test_name, passed, message=""):
+        """Log test results"""
+        status = "PASS" if passed else "FAIL"
+        print(f"[{status}] {test_name}: {message}")
+        self.test_results.append(
+            {"test": test_name, "passed": passed, "message": message}
+        )
+
+    def test_clock_is_monotonic_ns(self):
+        """Test that clocks return increasing integer nanoseconds"""
+        try:
+            passed = True
+            for clock in (PerfCounterClock(), MonotonicClock()):
+                first = clock.now_ns()
+                time.sleep(0.01)
+                second = clock.now_ns()
+                if not (isinstance(first, int) and second - first >= 5_000_000):
+                    passed = False
+            self.log_test("Monotonic Nanosecond Clock", passed, "perf_counter_ns and monotonic_ns")
+        except Exception as e:
+            self.log_test("Monotonic Nanosecond Clock", False, f"Exception: {str(e)}")
+
+    def test_wall_clock_anchor(self):
+        """Test that counter values map back to readable wall-clock times"""
+        try:
+            clock = get_clock()
+            wall = clock.to_wall(clock.now_ns())
+            passed = abs(wall - time.time()) < 0.5 and clock.name == "perf_counter_ns"
+            self.log_test("Wall Clock Anchor", passed, f"offset {wall - time.time():+.6f}s")
+        except Exception as e:
+            self.log_test("Wall Clock Anchor", False, f"Exception: {str(e)}")
+
+    def test_unknown_clock_falls_back(self):
+        """Test that an unknown clock name still yields a usable clock"""
+        try:
+            clock = get_clock("sundial")
+            self.log_test(
+                "Unknown Clock Fallback",
+                clock.name == "perf_counter_ns" and clock.resolution > 0,
+                f"{clock.name}, resolution {clock.resolution}s",
+            )
+        except Exception as e:
+            self.log_test("Unknown Clock Fallback", False, f"Exception: {str(e)}")
+
+    def test_engine_start_stop(self):
+        """Test a full start/stop cycle and the events it emits"""
+        try:
+            engine = TimingEngine()
+            events = []
+            engine.subscribe(lambda event, data: events.append(event))
+
+            engine.register("12", "Karen")
+            engine.start("12", "1")
+            time.sleep(0.01)
+            elapsed_ns = engine.stop("12", "1")
+            data = engine.participants["12"]
+
+            passed = (
+                events == ["registered", "started", "stopped"]
+                and data.time_ns(1) == elapsed_ns
+                and abs(data.time(1) - elapsed_ns / 1e9) < 1e-9
+                and data.clocks[0] == "perf_counter_ns"
+                and not engine.current_timers
+            )
+            self.log_test("Engine Start/Stop", passed, f"{elapsed_ns} ns, events={events}")
+        except Exception as e:
+            self.log_test("Engine Start/Stop", False, f"Exception: {str(e)}")
+
+    def test_engine_rejects_invalid_operations(self):
+        """Test that invalid operations raise instead of blocking on a dialog"""
+        try:
+            engine = TimingEngine()
+            engine.register("1", "A")
+            engine.start("1", "1")
+
+            checks = []
+            for operation, expected in (
+                (lambda: engine.register("1", "B"), TimingError),
+                (lambda: engine.start("99", "1"), TimingError),
+                (lambda: engine.start("1", "1"), TimerStateError),
+                (lambda: engine.stop("1", "2"), TimerStateError),
+            ):
+                try:
+                    operation()
+                    checks.append(False)
+                except expected:
+                    checks.append(True)
+
+            engine.reset("1", "1")
+            checks.append(not engine.is_running("1", "1"))
+
+            self.log_test(
+                "Engine Rejects Invalid Operations", all(checks), f"checks={checks}"
+            )
+        except Exception as e:
+            self.log_test("Engine Rejects Invalid Operations", False, f"Exception: {str(e)}")
+
+    def test_engine_results(self):
+        """Test that results rank the most consistent boat first"""
+        try:
+            engine = TimingEngine()
+            for boat, run1, run2 in (("1", 60.0, 62.0), ("2", 61.0, 61.1), ("3", 59.0, None)):
+                engine.participants[boat] = Participant.from_dict(
+                    {"name": f"Boat {boat}", "run1_time": run1, "run2_time": run2}
+                )
+
+            ranking = [result["boat"] for result in engine.calculate_results()]
+            self.log_test("Engine Results", ranking == ["2", "1"], f"ranking={ranking}")
+        except Exception as e:
+            self.log_test("Engine Results", False, f"Exception: {str(e)}")
+
+    def test_leaderboard_incremental(self):
+        """Test that stop/reset keep the leaderboard equal to a full recompute"""
+        try:
+            clock = ManualClock()
+            engine = TimingEngine(clock)
+            moves = []
+            engine.subscribe(
+                lambda event, data: moves.append(data) if event == "ranked" else None
+            )
+
+            def timed_run(boat, run, seconds):
+                engine.start(boat, run)
+                clock.value += int(seconds * 1e9)
+                engine.stop(boat, run)
+
+            for boat, run1, run2 in (("1", 60.0, 62.0), ("2", 61.0, 61.1), ("3", 59.0, 64.0)):
+                engine.register(boat, f"Boat {boat}")
+                timed_run(boat, 1, run1)
+                timed_run(boat, 2, run2)
+            after_stops = list(engine.leaderboard)
+
+            engine.reset("2", 1)
+            after_reset = list(engine.leaderboard)
+            reset_move = moves[-1]
+
+            timed_run("2", 1, 61.2)
+            incremental = list(engine.leaderboard)
+            full = [result["boat"] for result in engine.calculate_results()]
+
+            passed = (
+                after_stops == ["2", "1", "3"]
+                and after_reset == ["1", "3"]
+                and reset_move == {"boat": "2", "old_index": 0, "new_index": None}
+                and incremental == full == ["2", "1", "3"]
+            )
+            self.log_test(
+                "Leaderboard Incremental",
+                passed,
+                f"after stops={after_stops}, after reset={after_reset}, final={incremental}",
+            )
+        except Exception as e:
+            self.log_test("Leaderboard Incremental", False, f"Exception: {str(e)}")
+
+    def test_configurable_runs_and_scoring(self):
+        """Test five runs per boat ranked by standard deviation"""
+        try:
+            clock = ManualClock()
+            engine = TimingEngine(clock)
+            engine.register("1", "Steady")
+            engine.register("2", "Erratic")
+            engine.configure(run_count=5, scoring="stddev")
+
+            for boat, times in (("1", (60, 61, 60, 61, 60)), ("2", (60, 60, 60, 60, 66))):
+                for run, seconds in enumerate(times, 1):
+                    engine.start(boat, run)
+                    clock.value += seconds * 10**9
+                    engine.stop(boat, run)
+
+            results = engine.results()
+            try:
+                engine.configure(run_count=3)
+                shrink_refused = False
+            except TimingError:
+                shrink_refused = True
+
+            passed = (
+                [result["boat"] for result in results] == ["1", "2"]
+                and abs(results[0]["score"] - 0.4899) < 1e-4
+                and results[1]["difference"] == 6.0
+                and shrink_refused
+                and engine.participants["1"].run_count == 5
+            )
+            self.log_test(
+                "Configurable Runs And Scoring",
+                passed,
+                f"scores={[round(result['score'], 4) for result in results]}",
+            )
+        except Exception as e:
+            self.log_test("Configurable Runs And Scoring", False, f"Exception: {str(e)}")
+
+    def test_batch_scoring_speed(self):
+        """Scoring 5,000 boats x 5 runs from scratch must stay instant"""
+        try:
+            engine = TimingEngine(scoring="stddev", run_count=5)
+            for boat in range(5000):
+                engine.participants[str(boat)] = Participant.from_dict(
+                    {"name": f"Boat {boat}",
+                     **{f"run{run}_time": 60.0 + (boat * run) % 7 for run in range(1, 6)}},
+                    run_count=5,
+                )
+
+            started = time.perf_counter()
+            results = engine.calculate_results()
+            elapsed = time.perf_counter() - started
+
+            self.log_test(
+                "Batch Scoring Speed",
+                len(results) == 5000 and elapsed < 0.5,
+                f"{len(results)} boats ranked in {elapsed * 1000:.1f} ms",
+            )
+        except Exception as e:
+            self.log_test("Batch Scoring Speed", False, f"Exception: {str(e)}")
+
+    def test_participant_record(self):
+        """Test that slotted records round-trip the JSON format, old files included"""
+        try:
+            participant = Participant("Ida")
+            participant.set_time_ns(1, 61_500_000_000, "perf_counter_ns")
+            restored = Participant.from_dict(participant.to_dict())
+            legacy = Participant.from_dict(
+                {"name": "Bo", "run1_time": 61.5, "run2_time": None,
+                 "run1_start": None, "run2_start": None}
+            )
+
+            passed = (
+                not hasattr(participant, "__dict__")
+                and restored.time_ns(1) == 61_500_000_000
+                and restored.clocks[0] == "perf_counter_ns"
+                and restored.time(2) is None
+                and legacy.time_ns(1) == 61_500_000_000
+                and legacy.to_dict()["run1_time"] == 61.5
+            )
+            self.log_test("Participant Record", passed, f"{restored!r}")
+        except Exception as e:
+            self.log_test("Participant Record", False, f"Exception: {str(e)}")
+
+    def test_natural_boat_order(self):
+        """Test that boats keep a natural order through registrations"""
+        try:
+            engine = TimingEngine(ManualClock())
+            for boat in ("B10", "B2", "12", "B001", "2"):
+                engine.register(boat, f"Roer {boat}")
+            engine.register_many([("A7", "Ida"), ("b3", "Bo")])
+            engine.remove("B2")
+            # Records put in the dict directly are picked up as well
+            engine.participants["B20"] = Participant("Ny")
+
+            order = engine.sorted_boats()
+            expected = ["2", "12", "A7", "B001", "b3", "B10", "B20"]
+            passed = (
+                order == expected
+                and sorted(expected, key=natural_key) == expected
+                and natural_key("B1") != natural_key("B001")
+            )
+            self.log_test("Natural Boat Order", passed, f"{order}")
+        except Exception as e:
+            self.log_test("Natural Boat Order", False, f"Exception: {str(e)}")
+
+    def test_bulk_registration(self):
+        """Test that a batch registers all boats in one event, or none on any problem"""
+        try:
+            engine = TimingEngine()
+            engine.register("1", "Ida")
+            events = []
+            engine.subscribe(lambda event, data: events.append((event, data)))
+
+            try:
+                engine.register_many([("2", "Bo"), ("1", "Eva"), ("3", ""), ("2", "Bo")])
+                problems = []
+            except RegistrationError as e:
+                problems = e.problems
+            refused = len(problems) == 3 and list(engine.participants) == ["1"]
+
+            engine.register_many([("2", "Bo"), ("3", "Eva")])
+            passed = (
+                refused
+                and list(engine.participants) == ["1", "2", "3"]
+                and engine.participants["3"].run_count == engine.run_count
+                and events == [("imported", {"boats": ["2", "3"]})]
+            )
+            self.log_test(
+                "Bulk Registration", passed, f"{len(problems)} problems reported"
+            )
+        except Exception as e:
+            self.log_test("Bulk Registration", False, f"Exception: {str(e)}")
+
+    def test_event_time_mapping(self):
+        """Test that input events map to when they happened, not when handled"""
+        try:
+            clock = ManualClock()
+            mapper = EventTimeMapper(clock)
+
+            near_wrap = 2**32 - 10_000  # Event clock in ms, 10 s from wrapping
+            clock.value = 5_000_000_000
+            first = mapper.to_clock_ns(near_wrap)  # Handled at once
+            clock.value = 8_300_000_000
+            late = mapper.to_clock_ns(near_wrap + 3_000)  # Handled 300 ms late
+            clock.value = 19_000_000_000
+            wrapped = mapper.to_clock_ns(20)  # Back past zero
+
+            # A mouse move handled at once primes a fresh mapper, so the
+            # first press, handled 200 ms late, is still backdated
+            primed = EventTimeMapper(clock)
+            clock.value = 30_000_000_000
+            primed.observe(1_000)
+            clock.value = 30_700_000_000
+            first_press = primed.to_clock_ns(1_500)
+
+            passed = (
+                first == 5_000_000_000
+                and late == 8_000_000_000
+                and wrapped == 19_000_000_000
+                and first_press == 30_500_000_000
+            )
+            self.log_test(
+                "Event Time Mapping",
+                passed,
+                f"{first}, {late}, {wrapped}, primed {first_press}",
+            )
+        except Exception as e:
+            self.log_test("Event Time Mapping", False, f"Exception: {str(e)}")
+
+    def test_timestamps_at_source(self):
+        """Test that the engine uses the given timestamps and records the skew"""
+        try:
+            clock = ManualClock()
+            engine = TimingEngine(clock)
+            engine.register("1", "Ida")
+            engine.register("2", "Bo")
+
+            clock.value = 1_000_000_000
+            engine.start("1", 1, at_ns=900_000_000)
+            clock.value = 62_000_000_000
+            elapsed = engine.stop("1", 1, at_ns=61_800_000_000)
+
+            try:
+                engine.start("1", 2, at_ns=62_000_000_000)
+                engine.stop("1", 2, at_ns=61_000_000_000)
+                refused = False
+            except TimingError:
+                refused = True
+
+            # Stamps from long ago or from the future are refused as well
+            implausible = 0
+            for at_ns in (0, 63_000_000_000):
+                try:
+                    engine.start("2", 1, at_ns=at_ns)
+                except TimingError:
+                    implausible += 1
+
+            skew = engine.skew.summary()
+            passed = (
+                elapsed == 60_900_000_000
+                and refused
+                and implausible == 2
+                and not engine.is_running("2", 1)
+                and skew["count"] == 3  # The refused commands are not counted
+                and skew["max_ms"] == 200.0
+                and engine.skew.percentile(0.5) == 100_000_000
+            )
+            self.log_test("Timestamps At Source", passed, f"{skew}")
+        except Exception as e:
+            self.log_test("Timestamps At Source", False, f"Exception: {str(e)}")
+
+    def test_group_start(self):
+        """Test that a group starts with one timestamp and one event, or not at all"""
+        try:
+            clock = ManualClock()
+            engine = TimingEngine(clock)
+            engine.register_many([(str(boat), f"Roer {boat}") for boat in range(1, 6)])
+            clock.value = 10_000_000_000
+            engine.start("5", 1)
+            clock.value = 20_000_000_000
+            engine.stop("5", 1, at_ns=clock.value)
+            engine.start("4", 1)
+            events = []
+            engine.subscribe(lambda event, data: events.append((event, data)))
+
+            try:
+                engine.start_many(["1", "2", "4", "9"], 1, at_ns=clock.value)
+                problems = []
+            except GroupStartError as e:
+                problems = e.problems
+            refused = (
+                len(problems) == 2
+                and not events
+                and not engine.is_running("1", 1)
+            )
+
+            clock.value = 30_000_000_000
+            start_ns = engine.start_many(["1", "2", "5", "1"], 1, at_ns=29_990_000_000)
+            started = [event for event, data in events if event != "ranked"]
+            clock.value = 90_000_000_000
+            passed = (
+                refused
+                and start_ns == 29_990_000_000
+                and {engine.current_timers[(boat, 1)] for boat in ("1", "2", "5")}
+                == {start_ns}
+                and engine.participants["5"].time_ns(1) is None  # Discarded
+                and started == ["group_started"]
+                and events[0][1]["boats"] == ["1", "2", "5"]
+                and engine.elapsed_ns("1", 1) == engine.elapsed_ns("5", 1)
+            )
+            self.log_test(
+                "Group Start", passed, f"{len(problems)} problems, then {started}"
+            )
+        except Exception as e:
+            self.log_test("Group Start", False, f"Exception: {str(e)}")
+
+    def test_engine_throughput(self):
+        """The engine must handle at least 10,000 start/stop ops per second"""
+        try:
+            engine = TimingEngine()
+            engine.subscribe(lambda event, data: None)
+            boats = [str(boat) for boat in range(1, 1001)]
+            for boat in boats:
+                engine.register(boat, f"Roer {boat}")
+
+            operations = 0
+            started = time.perf_counter()
+            for _ in range(10):
+                for boat in boats:
+                    engine.start(boat, "1")
+                for boat in boats:
+                    engine.stop(boat, "1")
+                operations += 2 * len(boats)
+            elapsed = time.perf_counter() - started
+            rate = operations / elapsed
+
+            self.log_test(
+                "Engine Throughput", rate >= 10_000, f"{rate:,.0f} ops/s"
+            )
+        except Exception as e:
+            self.log_test("Engine Throughput", False, f"Exception: {str(e)}")
+
+    def run_all_tests(self):
+        """Run all timing core tests"""
+        print("=" * 60)
+        print("ROWING TIMER - TIMING CORE TESTS")
+        print("=" * 60)
+
+        self.test_clock_is_monotonic_ns()
+        self.test_wall_clock_anchor()
+        self.test_unknown_clock_falls_back()
+        self.test_engine_start_stop()
+        self.test_engine_rejects_invalid_operations()
+        self.test_engine_results()
+        self.test_leaderboard_incremental()
+        self.test_configurable_runs_and_scoring()
+        self.test_batch_scoring_speed()
+        self.test_participant_record()
+        self.test_bulk_registration()
+        self.test_natural_boat_order()
+        self.test_event_time_mapping()
+        self.test_timestamps_at_source()
+        self.test_group_start()
+        self.test_engine_throughput()
+
+        # Summary
+        passed_tests = sum(1 for result in self.test_results if result["passed"])
+        total_tests = len(self.test_results)
+
+        print("\n" + "=" * 60)
+        print(f"TIMING TEST SUMMARY: {passed_tests}/{total_tests} PASSED")
+
+        if passed_tests == total_tests:
+            print("✅ ALL TIMING TESTS PASSED!")
+        else:
+            print("❌ SOME TIMING TESTS FAILED")
+            failed_tests = [r for r in self.test_results if not r["passed"]]
+            for test in failed_tests:
+                print(f"   • {test['test']}: {test['message']}")
+
+        print("=" * 60)
+
+        return passed_tests == total_tests
+
+
+def main():
+    """Main test function"""
+    tester = TimingTester()
+    return tester.run_all_tests()
+
+
+if __name__ == "__main__":
+    main()
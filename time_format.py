@@ -0,0 +1,57 @@
+"""
+Time display formatting for the Rowing Timer
+Everything is formatted from integer milliseconds (tenths for running
+timers) without float arithmetic. Finished times are shown again on every
+refresh, so their strings are cached by value; running timers keep the
+"MM:SS." of each second and only add the changing tenths digit.
+"""
+
+from functools import lru_cache
+
+NS_PER_MS = 1_000_000
+NS_PER_TENTH = 100_000_000
+
+# Distinct finished times kept as strings; a few per boat in a large event
+FORMAT_CACHE_SIZE = 8192
+
+# "MM:SS." prefixes kept for running timers; one per second a visible
+# timer is currently in
+RUNNING_PREFIX_CACHE_SIZE = 512
+
+TENTH_DIGITS = "0123456789"
+
+
+def ns_to_ms(ns):
+    """Nanoseconds rounded to whole milliseconds"""
+    return (ns + NS_PER_MS // 2) // NS_PER_MS
+
+
+def seconds_to_ms(seconds):
+    """Float seconds rounded to whole milliseconds"""
+    return round(seconds * 1000)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def format_ms(ms):
+    """MM:SS.mmm for a whole number of milliseconds"""
+    minutes, ms = divmod(ms, 60_000)
+    seconds, ms = divmod(ms, 1000)
+    return "%02d:%02d.%03d" % (minutes, seconds, ms)
+
+
+def format_time_ns(ns):
+    """MM:SS.mmm for a nanosecond count, "-" for no time"""
+    if ns is None:
+        return "-"
+    return format_ms((ns + NS_PER_MS // 2) // NS_PER_MS)
+
+
+@lru_cache(maxsize=RUNNING_PREFIX_CACHE_SIZE)
+def _running_prefix(second):
+    return "%02d:%02d." % divmod(second, 60)
+
+
+def format_running_tenths(tenths):
+    """MM:SS.t for a running timer, from whole tenths of a second"""
+    second, tenth = divmod(tenths, 10)
+    return _running_prefix(second) + TENTH_DIGITS[tenth]
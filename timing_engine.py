@@ -0,0 +1,729 @@
+"""
+Headless timing engine for the Rowing Timer
+Owns participants, running timers and results without any Tk dependency, so
+it can be driven from the GUI, from tests, or from a server at high rate.
+Changes are announced to subscribers as (event, data) callbacks.
+"""
+
+import math
+import re
+from bisect import bisect_left
+from collections import deque
+from operator import itemgetter
+
+from clock import get_clock
+from search_index import SearchIndex
+
+# Runs per boat unless an event says otherwise
+DEFAULT_RUN_COUNT = 2
+MAX_RUN_COUNT = 10
+
+
+def spread_scores(rows):
+    """Max-min spread of each row of run times (the difference for two runs)"""
+    return [max(row) - min(row) for row in rows]
+
+
+def stddev_scores(rows):
+    """Population standard deviation of each row of run times"""
+    if not rows:
+        return []
+    count = len(rows[0])
+    # Row sums give every boat's mean before the squared deviations
+    means = [total / count for total in map(sum, rows)]
+    return [
+        math.sqrt(sum((time - mean) * (time - mean) for time in row) / count)
+        for row, mean in zip(rows, means)
+    ]
+
+
+# Consistency scoring methods: name -> (label, batch function). Each
+# function scores all boats at once from a list of equal-length rows.
+SCORING_METHODS = {
+    "spread": ("Forskel (max-min)", spread_scores),
+    "stddev": ("Standardafvigelse", stddev_scores),
+}
+DEFAULT_SCORING = "spread"
+
+# Timestamps given with a command (at_ns) must lie between this long ago
+# and this far ahead of now: a press is handled within seconds, and a
+# station's synced clock is off by milliseconds, not by whole seconds
+MAX_STAMP_AGE_NS = 10_000_000_000
+MAX_STAMP_AHEAD_NS = 250_000_000
+
+
+class Participant:
+    """Compact participant record with one slot per run (run 1 is index 0)"""
+
+    __slots__ = ("name", "times_ns", "starts", "clocks")
+
+    def __init__(self, name, run_count=DEFAULT_RUN_COUNT):
+        self.name = name
+        self.times_ns = [None] * run_count
+        self.starts = [None] * run_count
+        self.clocks = [None] * run_count
+
+    def time_ns(self, run):
+        return self.times_ns[run - 1]
+
+    def time(self, run):
+        """Finished time in seconds, or None"""
+        ns = self.times_ns[run - 1]
+        return None if ns is None else ns / 1e9
+
+    def start(self, run):
+        """Wall-clock start time (seconds since the epoch), or None"""
+        return self.starts[run - 1]
+
+    def set_time_ns(self, run, elapsed_ns, clock_name):
+        self.times_ns[run - 1] = elapsed_ns
+        self.clocks[run - 1] = clock_name
+
+    def clear_run(self, run):
+        self.times_ns[run - 1] = None
+        self.clocks[run - 1] = None
+
+    @property
+    def run_count(self):
+        return len(self.times_ns)
+
+    def times(self):
+        """All run times in seconds, None for runs without a time"""
+        return [None if ns is None else ns / 1e9 for ns in self.times_ns]
+
+    def resize(self, run_count):
+        """Add empty runs or drop trailing ones"""
+        missing = run_count - len(self.times_ns)
+        if missing > 0:
+            self.times_ns.extend([None] * missing)
+            self.starts.extend([None] * missing)
+            self.clocks.extend([None] * missing)
+        else:
+            del self.times_ns[run_count:]
+            del self.starts[run_count:]
+            del self.clocks[run_count:]
+
+    def to_dict(self):
+        """Serialize to the rowing_data.json participant format"""
+        data = {"name": self.name}
+        for index, ns in enumerate(self.times_ns, 1):
+            data[f"run{index}_time"] = None if ns is None else ns / 1e9
+        for index, start in enumerate(self.starts, 1):
+            data[f"run{index}_start"] = start
+        for index, ns in enumerate(self.times_ns, 1):
+            if ns is not None:
+                data[f"run{index}_time_ns"] = ns
+                if self.clocks[index - 1] is not None:
+                    data[f"run{index}_clock"] = self.clocks[index - 1]
+        return data
+
+    @classmethod
+    def from_dict(cls, data, run_count=DEFAULT_RUN_COUNT):
+        """Build a record from the JSON format, including files without _ns keys"""
+        participant = cls(data.get("name", ""), run_count)
+        for index in range(run_count):
+            run = index + 1
+            ns = data.get(f"run{run}_time_ns")
+            if ns is None and data.get(f"run{run}_time") is not None:
+                # Times saved before nanosecond storage were float seconds
+                ns = round(data[f"run{run}_time"] * 1e9)
+            participant.times_ns[index] = ns
+            participant.starts[index] = data.get(f"run{run}_start")
+            participant.clocks[index] = data.get(f"run{run}_clock")
+        return participant
+
+    def __repr__(self):
+        return f"Participant({self.name!r}, times_ns={self.times_ns})"
+
+
+_DIGIT_RUNS = re.compile(r"(\d+)")
+
+
+def natural_key(boat):
+    """Sort key that orders boat numbers the way people read them.
+
+    Digit runs compare as numbers, so "B2" comes before "B10" and plain
+    numbers come before numbers with a letter prefix. The boat itself
+    breaks ties such as "B1" and "B001".
+    """
+    # Split puts text at even and digits at odd positions, so any two
+    # keys compare like with like
+    parts = _DIGIT_RUNS.split(boat)
+    return (
+        tuple(
+            int(part) if index % 2 else part.casefold()
+            for index, part in enumerate(parts)
+        ),
+        boat,
+    )
+
+
+class BoatOrder:
+    """Registered boats in natural order, kept sorted as boats come and go"""
+
+    def __init__(self):
+        self._keys = []  # Sorted natural_key() values
+        self._boats = []  # The boat of each key, at the same index
+
+    def __len__(self):
+        return len(self._boats)
+
+    def __iter__(self):
+        return iter(self._boats)
+
+    def boats(self):
+        """All boats in order, as a new list"""
+        return list(self._boats)
+
+    def index(self, boat):
+        return bisect_left(self._keys, natural_key(boat))
+
+    def add(self, boat):
+        key = natural_key(boat)
+        index = bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._boats.insert(index, boat)
+
+    def add_many(self, boats):
+        """Add a batch with one sort instead of an insert per boat"""
+        keys = self._keys + [natural_key(boat) for boat in boats]
+        keys.sort()
+        self._keys = keys
+        self._boats = [boat for _, boat in keys]
+
+    def discard(self, boat):
+        index = self.index(boat)
+        if index < len(self._boats) and self._boats[index] == boat:
+            del self._keys[index]
+            del self._boats[index]
+
+    def rebuild(self, boats):
+        self._keys = sorted(natural_key(boat) for boat in boats)
+        self._boats = [boat for _, boat in self._keys]
+
+    def clear(self):
+        self._keys.clear()
+        self._boats.clear()
+
+
+class Leaderboard:
+    """Boats with a score, kept sorted so one change costs a binary search"""
+
+    def __init__(self):
+        self._keys = []  # Sorted (score, boat) pairs
+        self._scores = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return (boat for _, boat in self._keys)
+
+    def __contains__(self, boat):
+        return boat in self._scores
+
+    def items(self):
+        """(boat, score) pairs, best first"""
+        return map(itemgetter(1, 0), self._keys)
+
+    def boat_at(self, index):
+        return self._keys[index][1]
+
+    def score(self, boat):
+        return self._scores[boat]
+
+    def index(self, boat):
+        """Position of a ranked boat (0 is the winner)"""
+        return bisect_left(self._keys, (self._scores[boat], boat))
+
+    def update(self, boat, score):
+        """Insert, move or (score None) drop a boat.
+
+        Returns (old_index, new_index) with None where the boat was or is
+        not ranked.
+        """
+        old_index = None
+        old_score = self._scores.pop(boat, None)
+        if old_score is not None:
+            old_index = bisect_left(self._keys, (old_score, boat))
+            del self._keys[old_index]
+
+        new_index = None
+        if score is not None:
+            key = (score, boat)
+            new_index = bisect_left(self._keys, key)
+            self._keys.insert(new_index, key)
+            self._scores[boat] = score
+
+        return old_index, new_index
+
+    def rebuild(self, scores):
+        """Replace the contents from a {boat: score} mapping"""
+        self._scores = {boat: score for boat, score in scores.items() if score is not None}
+        self._keys = sorted((score, boat) for boat, score in self._scores.items())
+
+    def clear(self):
+        self._keys.clear()
+        self._scores.clear()
+
+
+class SkewStats:
+    """Delay between input and the engine applying it, in nanoseconds.
+
+    Recorded for every start/stop that carries its own timestamp, from
+    the GUI as well as from remote stations.
+    """
+
+    def __init__(self, window=1000):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.last_ns = None
+        self._recent = deque(maxlen=window)
+
+    def record(self, skew_ns):
+        self.count += 1
+        self.total_ns += skew_ns
+        self.max_ns = max(self.max_ns, skew_ns)
+        self.last_ns = skew_ns
+        self._recent.append(skew_ns)
+
+    def percentile(self, fraction):
+        """Skew not exceeded by this fraction of the recent commands"""
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self):
+        """Milliseconds, for display and the remote status endpoint"""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "last_ms": self.last_ns / 1e6,
+            "mean_ms": self.total_ns / self.count / 1e6,
+            "p95_ms": self.percentile(0.95) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+
+class TimingError(Exception):
+    """A timing operation that cannot be carried out (unknown boat etc.)"""
+
+
+class TimerStateError(TimingError):
+    """The timer is not in the state the operation expects"""
+
+
+class RegistrationError(TimingError):
+    """A batch of registrations was refused; problems lists every reason"""
+
+    def __init__(self, problems):
+        super().__init__("\n".join(problems))
+        self.problems = problems
+
+
+class GroupStartError(TimingError):
+    """A group start was refused; problems lists every boat that blocked it"""
+
+    def __init__(self, problems):
+        super().__init__("\n".join(problems))
+        self.problems = problems
+
+
+class TimingEngine:
+    """Participants, running timers and results for one event"""
+
+    def __init__(self, clock=None, run_count=DEFAULT_RUN_COUNT, scoring=DEFAULT_SCORING):
+        self.clock = clock or get_clock()
+        self.run_count = run_count
+        self.scoring = scoring if scoring in SCORING_METHODS else DEFAULT_SCORING
+        self.participants = {}
+        self.current_timers = {}
+        self.boat_order = BoatOrder()
+        self.search_index = SearchIndex()
+        self.leaderboard = Leaderboard()
+        self.skew = SkewStats()
+        self._listeners = []
+
+    # --- Events -----------------------------------------------------------
+
+    def subscribe(self, callback):
+        """Call callback(event, data) after every change"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _emit(self, event, **data):
+        for callback in list(self._listeners):
+            callback(event, data)
+
+    # --- Registration -----------------------------------------------------
+
+    def register(self, boat, name):
+        if not boat or not name:
+            raise TimingError("Indtast venligst både båd nummer og deltager navn.")
+        if boat in self.participants:
+            raise TimingError(f"Båd {boat} er allerede tilmeldt.")
+
+        self.participants[boat] = Participant(name, self.run_count)
+        self.boat_order.add(boat)
+        self.search_index.add(boat, name)
+        self._emit("registered", boat=boat, name=name)
+
+    def register_many(self, entries):
+        """Register (boat, name) pairs all at once, or none of them.
+
+        Every entry is checked against the registered boats and the rest of
+        the batch first, so one RegistrationError reports all problems.
+        Listeners get a single "imported" event for the whole batch.
+        """
+        problems = []
+        batch = {}
+        for boat, name in entries:
+            if not boat or not name:
+                problems.append(f"Båd {boat or '?'}: mangler båd nummer eller navn.")
+            elif boat in self.participants:
+                problems.append(f"Båd {boat} er allerede tilmeldt.")
+            elif boat in batch:
+                problems.append(f"Båd {boat} står flere gange i listen.")
+            else:
+                batch[boat] = name
+        if problems:
+            raise RegistrationError(problems)
+
+        run_count = self.run_count
+        for boat, name in batch.items():
+            self.participants[boat] = Participant(name, run_count)
+        self.boat_order.add_many(batch)
+        for boat, name in batch.items():
+            self.search_index.add(boat, name)
+        self._emit("imported", boats=list(batch))
+
+    def load(self, participants):
+        """Replace all participants, e.g. after reading the data file"""
+        self.participants = participants
+        for participant in participants.values():
+            if participant.run_count != self.run_count:
+                participant.resize(self.run_count)
+        self.boat_order.rebuild(participants)
+        # Indexed on the first search, which is often never
+        self.search_index.clear()
+        self.rebuild_leaderboard()
+
+    def configure(self, run_count=None, scoring=None):
+        """Change the number of runs per boat and/or the scoring method"""
+        if run_count is not None and run_count != self.run_count:
+            if not 1 <= run_count <= MAX_RUN_COUNT:
+                raise TimingError(f"Antal ture skal være mellem 1 og {MAX_RUN_COUNT}.")
+            for boat, participant in self.participants.items():
+                dropped = participant.times_ns[run_count:]
+                if any(ns is not None for ns in dropped) or any(
+                    (boat, run) in self.current_timers
+                    for run in range(run_count + 1, self.run_count + 1)
+                ):
+                    raise TimingError(
+                        f"Båd {boat} har tider i de ture der fjernes. "
+                        "Nulstil dem først."
+                    )
+            for participant in self.participants.values():
+                participant.resize(run_count)
+            self.run_count = run_count
+
+        if scoring is not None:
+            if scoring not in SCORING_METHODS:
+                raise TimingError(f"Ukendt pointmetode: {scoring}")
+            self.scoring = scoring
+
+        self.rebuild_leaderboard()
+        self._emit("configured", run_count=self.run_count, scoring=self.scoring)
+
+    def remove(self, boat):
+        if boat not in self.participants:
+            raise TimingError("Valgte båd er ikke tilmeldt.")
+
+        del self.participants[boat]
+        self.boat_order.discard(boat)
+        self.search_index.remove(boat)
+        for timer_key in [key for key in self.current_timers if key[0] == boat]:
+            del self.current_timers[timer_key]
+        self.leaderboard.update(boat, None)
+        self._emit("removed", boat=boat)
+
+    def clear(self):
+        self.participants.clear()
+        self.current_timers.clear()
+        self.boat_order.clear()
+        self.search_index.clear()
+        self.leaderboard.clear()
+        self._emit("cleared")
+
+    def sorted_boats(self):
+        """Registered boats in natural order (see natural_key), as a list"""
+        if len(self.boat_order) != len(self.participants):
+            # Records were added to or removed from the dict directly
+            self.boat_order.rebuild(self.participants)
+        return self.boat_order.boats()
+
+    def find(self, query):
+        """Boats whose number or name contains every word of query.
+
+        None for an empty query, i.e. no filter. See SearchIndex.
+        """
+        if not query.split():
+            return None
+        self.prepare_search()
+        return self.search_index.search(query)
+
+    def prepare_search(self):
+        """Index every boat now if needed, e.g. before the user starts typing"""
+        if len(self.search_index) != len(self.participants):
+            # First search since loading, or the dict was changed directly
+            self.search_index.rebuild(self.participants)
+
+    # --- Timing -----------------------------------------------------------
+
+    # Running timers are keyed by (boat, run) with run as an int, and map
+    # to the start counter value in nanoseconds
+
+    def is_running(self, boat, run):
+        return (boat, int(run)) in self.current_timers
+
+    def has_time(self, boat, run):
+        return self.participants[boat].time_ns(int(run)) is not None
+
+    def elapsed_ns(self, boat, run, now_ns=None):
+        """Elapsed time of a running timer in nanoseconds"""
+        start_ns = self.current_timers[(boat, int(run))]
+        if now_ns is None:
+            now_ns = self.clock.now_ns()
+        return now_ns - start_ns
+
+    def start(self, boat, run, at_ns=None):
+        """Start a run; any previous time for that run is discarded.
+
+        at_ns is the clock value when the start was given (the button
+        press or a remote station's timestamp); it defaults to now. How
+        late it is applied is recorded in skew.
+        """
+        if not boat:
+            raise TimingError("Ingen båd specificeret.")
+        if boat not in self.participants:
+            raise TimingError("Valgte båd er ikke tilmeldt.")
+
+        run = self._check_run(run)
+        timer_key = (boat, run)
+        if timer_key in self.current_timers:
+            raise TimerStateError(f"Timer for Båd {boat} Tur {run} kører allerede.")
+
+        start_ns = self._stamp(at_ns)
+        start_time = self.clock.to_wall(start_ns)
+        self.current_timers[timer_key] = start_ns
+
+        participant = self.participants[boat]
+        participant.clear_run(run)
+        participant.starts[run - 1] = start_time
+
+        self._emit("started", boat=boat, run=run, start=start_time, start_ns=start_ns)
+        self._update_rank(boat)
+        return start_ns
+
+    def start_many(self, boats, run, at_ns=None):
+        """Start a run for a group of boats with one shared timestamp.
+
+        All boats start or none do: unknown boats and boats already running
+        are reported together in one GroupStartError. Previous times for the
+        run are discarded as with start(). Listeners get a single
+        "group_started" event for the whole group.
+        """
+        run = self._check_run(run)
+        problems = []
+        group = []
+        seen = set()
+        for boat in boats:
+            if boat in seen:
+                continue
+            seen.add(boat)
+            if boat not in self.participants:
+                problems.append(f"Båd {boat} er ikke tilmeldt.")
+            elif (boat, run) in self.current_timers:
+                problems.append(f"Timer for Båd {boat} Tur {run} kører allerede.")
+            else:
+                group.append(boat)
+        if not group and not problems:
+            problems.append("Ingen både valgt til gruppestart.")
+        if problems:
+            raise GroupStartError(problems)
+
+        start_ns = self._stamp(at_ns)
+        start_time = self.clock.to_wall(start_ns)
+        for boat in group:
+            self.current_timers[(boat, run)] = start_ns
+            participant = self.participants[boat]
+            participant.clear_run(run)
+            participant.starts[run - 1] = start_time
+
+        self._emit(
+            "group_started", boats=group, run=run, start=start_time, start_ns=start_ns
+        )
+        for boat in group:
+            self._update_rank(boat)
+        return start_ns
+
+    def _stamp(self, at_ns):
+        """Timestamp for a command, recording how late it arrived.
+
+        A given at_ns that is implausibly old or in the future is refused
+        with a TimingError before anything is changed.
+        """
+        now_ns = self.clock.now_ns()
+        if at_ns is None:
+            return now_ns
+        skew_ns = now_ns - at_ns
+        if skew_ns < -MAX_STAMP_AHEAD_NS:
+            raise TimingError(
+                f"Tidsstemplet ligger {-skew_ns / 1e6:.0f} ms i fremtiden."
+            )
+        if skew_ns > MAX_STAMP_AGE_NS:
+            raise TimingError(f"Tidsstemplet er {skew_ns / 1e9:.1f} s gammelt.")
+        self.skew.record(skew_ns)
+        return at_ns
+
+    def stop(self, boat, run, at_ns=None):
+        """Stop a running timer and return the elapsed nanoseconds.
+
+        at_ns is the clock value at the finish, defaulting to now.
+        """
+        if not boat:
+            raise TimingError("Ingen båd specificeret.")
+
+        run = int(run)
+        timer_key = (boat, run)
+        if timer_key not in self.current_timers:
+            raise TimerStateError(f"Ingen aktiv timer for Båd {boat} Tur {run}.")
+
+        if at_ns is not None and at_ns < self.current_timers[timer_key]:
+            raise TimingError(f"Stop for Båd {boat} Tur {run} ligger før starten.")
+        end_ns = self._stamp(at_ns)
+        elapsed_ns = end_ns - self.current_timers.pop(timer_key)
+        self.participants[boat].set_time_ns(run, elapsed_ns, self.clock.name)
+
+        self._emit(
+            "stopped",
+            boat=boat,
+            run=run,
+            time=elapsed_ns / 1e9,
+            time_ns=elapsed_ns,
+            clock=self.clock.name,
+        )
+        self._update_rank(boat)
+        return elapsed_ns
+
+    def reset(self, boat, run):
+        """Cancel a running timer or clear a recorded time"""
+        if not boat:
+            raise TimingError("Ingen båd specificeret.")
+        if boat not in self.participants:
+            raise TimingError("Valgte båd er ikke tilmeldt.")
+
+        run = self._check_run(run)
+        was_running = self.current_timers.pop((boat, run), None) is not None
+        participant = self.participants[boat]
+        participant.clear_run(run)
+        participant.starts[run - 1] = None
+
+        self._emit("reset", boat=boat, run=run, was_running=was_running)
+        self._update_rank(boat)
+
+    def run_state(self, boat, run):
+        """Everything start, stop and reset change about one run, for restore"""
+        if boat not in self.participants:
+            raise TimingError("Valgte båd er ikke tilmeldt.")
+        run = self._check_run(run)
+        participant = self.participants[boat]
+        return {
+            "start": participant.starts[run - 1],
+            "time_ns": participant.times_ns[run - 1],
+            "clock": participant.clocks[run - 1],
+            "running_ns": self.current_timers.get((boat, run)),
+        }
+
+    def restore(self, boat, run, state):
+        """Put a run back as run_state() saw it, e.g. to undo a reset"""
+        if boat not in self.participants:
+            raise TimingError("Valgte båd er ikke tilmeldt.")
+        run = self._check_run(run)
+        participant = self.participants[boat]
+        participant.starts[run - 1] = state["start"]
+        participant.times_ns[run - 1] = state["time_ns"]
+        participant.clocks[run - 1] = state["clock"]
+        if state["running_ns"] is None:
+            self.current_timers.pop((boat, run), None)
+        else:
+            self.current_timers[(boat, run)] = state["running_ns"]
+
+        self._emit("restored", boat=boat, run=run, **state)
+        self._update_rank(boat)
+
+    def _check_run(self, run):
+        run = int(run)
+        if not 1 <= run <= self.run_count:
+            raise TimingError(f"Tur {run} findes ikke (1-{self.run_count}).")
+        return run
+
+    # --- Results ----------------------------------------------------------
+
+    def _score_rows(self, rows):
+        return SCORING_METHODS[self.scoring][1](rows)
+
+    def score(self, participant):
+        """Consistency score (smaller is better), or None until all runs are in"""
+        times_ns = participant.times_ns
+        if all(times_ns):
+            return self._score_rows([[ns / 1e9 for ns in times_ns]])[0]
+        return None
+
+    def _update_rank(self, boat):
+        """Move one boat on the leaderboard and announce the change"""
+        old_index, new_index = self.leaderboard.update(
+            boat, self.score(self.participants[boat])
+        )
+        if old_index is not None or new_index is not None:
+            self._emit("ranked", boat=boat, old_index=old_index, new_index=new_index)
+
+    def rebuild_leaderboard(self):
+        """Score every boat from scratch, e.g. after records were edited directly"""
+        boats = []
+        rows = []
+        for boat, participant in self.participants.items():
+            times_ns = participant.times_ns
+            if all(times_ns):
+                boats.append(boat)
+                rows.append([ns / 1e9 for ns in times_ns])
+
+        # One batch call scores the whole field
+        self.leaderboard.rebuild(dict(zip(boats, self._score_rows(rows))))
+
+    def result(self, boat):
+        """Result row for a ranked boat"""
+        participant = self.participants[boat]
+        times = participant.times()
+        return {
+            "boat": boat,
+            "name": participant.name,
+            "times": times,
+            "difference": max(times) - min(times),
+            "score": self.leaderboard.score(boat),
+        }
+
+    def results(self):
+        """Current leaderboard, most consistent (smallest difference) first"""
+        return [self.result(boat) for boat in self.leaderboard]
+
+    def calculate_results(self):
+        """Recompute the leaderboard from all participants and return it"""
+        self.rebuild_leaderboard()
+        return self.results()